@@ -9,13 +9,24 @@ from io import BytesIO
 from hypercorn.asyncio import serve
 from hypercorn.config import Config
 
-from flask import Flask, render_template, request, redirect, url_for, send_file, session
+from flask import (
+    Flask,
+    render_template,
+    request,
+    redirect,
+    url_for,
+    send_file,
+    session,
+    jsonify,
+)
 
 from pymodules.__atlas_fixed_vars import VERSION, VERSION_HASH, PORT, RUN
 from pymodules.__atlas_cache import get_cached_image_path
 from pymodules.__atlas_cache_daemon import start_cache_daemon
 from pymodules.__atlas_config import config
-from pymodules.__atlas_observer import observer
+from pymodules.__atlas_observer import observer_main
+from pymodules.__atlas_search_index import SearchIndex, index_main, parse_near
+from pymodules.__atlas_seedmaster import create_seed_deriver
 from pymodules.__atlas_stargate import (
     generate_planet_url,
     generate_system_url,
@@ -25,6 +36,7 @@ from pymodules.__atlas_stargate import (
 
 from pymodules.__universe_constants import PhysicalConstants
 from pymodules.__universe_base import Universe
+from pymodules.__universe_clock import CosmicClock
 
 from pymodules.__drawer_base import handle_image_generation
 
@@ -33,6 +45,7 @@ app = Flask(__name__)
 app.secret_key = os.urandom(24)
 
 universe = None
+search_index = None
 constants = PhysicalConstants()
 
 
@@ -42,23 +55,27 @@ def RunAtlasProtocol():
         if not config.initialize():
             return False
 
-    universe = Universe(config.seed, constants)
+    universe = Universe(
+        config.seed,
+        constants,
+        create_seed_deriver(config.seed, config.universe_format),
+    )
     return True
 
 
-def get_current_galaxy():
+def get_current_galaxy(clock=None):
     galaxy_data = session.get("galaxy")
     if galaxy_data:
-        galaxy = universe.get_galaxy(*galaxy_data["coordinates"])
+        galaxy = universe.get_galaxy(*galaxy_data["coordinates"], clock)
         return galaxy
     return None
 
 
-def get_current_system():
-    galaxy = get_current_galaxy()
+def get_current_system(clock=None):
+    galaxy = get_current_galaxy(clock)
     system_index = session.get("system")
     if galaxy and system_index is not None:
-        return galaxy.get_solar_system(system_index)
+        return galaxy.get_solar_system(system_index, clock)
     return None
 
 
@@ -93,7 +110,7 @@ def navigate():
     try:
         if universe is None:
             raise ValueError("The universe simulation isn't running yet.")
-        galaxy = universe.get_galaxy(x, y, z)
+        galaxy = universe.get_galaxy(x, y, z, CosmicClock())
         session["galaxy"] = {
             "seed": galaxy.seed,
             "name": galaxy.name,
@@ -111,7 +128,8 @@ def navigate():
 @app.route("/galaxy/<int:page>")
 def view_galaxy(page):
     try:
-        current_galaxy = get_current_galaxy()
+        clock = CosmicClock()
+        current_galaxy = get_current_galaxy(clock)
         if not current_galaxy:
             return redirect(url_for("index"))
 
@@ -122,23 +140,27 @@ def view_galaxy(page):
         per_page = 50
         start = (page - 1) * per_page
         end = start + per_page
-        finish = (current_galaxy.num_systems - 1) // 50 + 1
+        num_systems = current_galaxy.num_systems_at(clock)
+        finish = (num_systems - 1) // 50 + 1
 
         systems = [
             {
                 "index": i,
                 "number": i + 1,
-                "name": current_galaxy.get_solar_system(i).name,
+                "name": name,
             }
-            for i in range(start, min(end, current_galaxy.num_systems))
+            for i, name in enumerate(
+                current_galaxy.system_names(start, end, clock), start
+            )
         ]
 
-        next_page = page + 1 if end < current_galaxy.num_systems else None
+        next_page = page + 1 if end < num_systems else None
         prev_page = page - 1 if start > 0 else None
 
         return render_template(
             "galaxy.html",
             galaxy=current_galaxy,
+            num_systems=num_systems,
             image_url=url_for("galaxy_blob"),
             systems=systems,
             page=page,
@@ -159,7 +181,8 @@ def view_galaxy(page):
 
 @app.route("/galaxy_blob")
 def galaxy_blob():
-    current_galaxy = get_current_galaxy()
+    clock = CosmicClock()
+    current_galaxy = get_current_galaxy(clock)
 
     coordinates = f"{current_galaxy.coordinates[0]}_{current_galaxy.coordinates[1]}_{current_galaxy.coordinates[2]}"
     system_name = current_galaxy.name.lower()
@@ -170,11 +193,11 @@ def galaxy_blob():
         if os.path.exists(cache_filepath):
             return send_file(cache_filepath, mimetype="image/webp")
 
-        image = asyncio.run(handle_image_generation(current_galaxy))
+        image = asyncio.run(handle_image_generation(current_galaxy, clock))
         image.save(cache_filepath, "WEBP", quality=config.image_quality)
         return send_file(cache_filepath, mimetype="image/webp")
     else:
-        image = asyncio.run(handle_image_generation(current_galaxy))
+        image = asyncio.run(handle_image_generation(current_galaxy, clock))
         img_io = BytesIO()
         image.save(img_io, "WEBP", quality=config.image_quality)
         img_io.seek(0)
@@ -184,12 +207,13 @@ def galaxy_blob():
 @app.route("/system/<int:system_index>")
 def view_system(system_index):
     try:
-        current_galaxy = get_current_galaxy()
+        clock = CosmicClock()
+        current_galaxy = get_current_galaxy(clock)
         if not current_galaxy:
             return redirect(url_for("index"))
 
         session["system"] = system_index
-        current_system = current_galaxy.get_solar_system(system_index)
+        current_system = current_galaxy.get_solar_system(system_index, clock)
 
         page = session.get(f"page_{current_galaxy.coordinates}", 1)
 
@@ -232,8 +256,9 @@ def view_system(system_index):
 
 @app.route("/system_blob")
 def system_blob():
-    current_system = get_current_system()
-    current_galaxy = get_current_galaxy()
+    clock = CosmicClock()
+    current_system = get_current_system(clock)
+    current_galaxy = get_current_galaxy(clock)
 
     coordinates = f"{current_galaxy.coordinates[0]}_{current_galaxy.coordinates[1]}_{current_galaxy.coordinates[2]}"
     system_name = current_system.name.lower()
@@ -244,11 +269,11 @@ def system_blob():
         if os.path.exists(cache_filepath):
             return send_file(cache_filepath, mimetype="image/webp")
 
-        image = asyncio.run(handle_image_generation(current_system))
+        image = asyncio.run(handle_image_generation(current_system, clock))
         image.save(cache_filepath, "WEBP", quality=config.image_quality)
         return send_file(cache_filepath, mimetype="image/webp")
     else:
-        image = asyncio.run(handle_image_generation(current_system))
+        image = asyncio.run(handle_image_generation(current_system, clock))
         img_io = BytesIO()
         image.save(img_io, "WEBP", quality=config.image_quality)
         img_io.seek(0)
@@ -257,55 +282,60 @@ def system_blob():
 
 @app.route("/planet/<planet_name>")
 def view_planet(planet_name):
-    current_system = get_current_system()
+    clock = CosmicClock()
+    current_system = get_current_system(clock)
     if not current_system:
         return redirect(url_for("view_galaxy"))
 
-    current_galaxy = get_current_galaxy()
+    current_galaxy = get_current_galaxy(clock)
 
     planet_name = planet_name.lower()
 
     page = session.get(f"page_{current_galaxy.coordinates}", 1)
 
-    for planet in current_system.planets.values():
-        if planet.name.lower() == planet_name:
-            image_url = url_for("planet_blob", planet_name=planet_name)
-            planet_url = generate_planet_url(
-                current_galaxy.coordinates, current_system.index, planet_name, page
-            )
+    planet = current_system.get_planet_by_name(planet_name)
+    if planet:
+        image_url = url_for("planet_blob", planet_name=planet_name)
+        planet_url = generate_planet_url(
+            current_galaxy.coordinates, current_system.index, planet_name, page
+        )
 
-            planet_summary = {
-                "Type": planet.planet_type,
-                "Atmosphere": planet.atmosphere,
-                "Mass": f"{planet.mass:.2e} kg",
-                "Diameter": f"{planet.diameter / 1000:.2f} km",
-                "Gravity": f"{planet.gravity:.2f} m/s²",
-                "Orbital Radius": f"{planet.orbital_radius:.2f} AU",
-                "Orbital Period": f"{planet.orbital_period_seconds / (365.25 * 24 * 3600):.2f} years",
-                "Surface Temperature": f"{planet.surface_temperature:.2f} K",
-                "Elements": ", ".join(planet.elements),
-                "Life Forms": planet.life_forms,
-            }
+        surface_temperature = planet.surface_temperature_at(clock)
+
+        planet_summary = {
+            "Type": planet.planet_type,
+            "Atmosphere": planet.atmosphere,
+            "Mass": f"{planet.mass:.2e} kg",
+            "Diameter": f"{planet.diameter / 1000:.2f} km",
+            "Gravity": f"{planet.gravity:.2f} m/s²",
+            "Orbital Radius": f"{planet.orbital_radius:.2f} AU",
+            "Orbital Period": f"{planet.orbital_period_seconds / (365.25 * 24 * 3600):.2f} years",
+            "Surface Temperature": f"{surface_temperature:.2f} K",
+            "Elements": ", ".join(planet.elements),
+            "Life Forms": planet.life_forms,
+        }
 
-            return render_template(
-                "planet.html",
-                planet=planet,
-                system=current_system,
-                galaxy=current_galaxy,
-                image_url=image_url,
-                summary=planet_summary,
-                planet_url=planet_url,
-                version=VERSION,
-                versionHash=VERSION_HASH,
-            )
+        return render_template(
+            "planet.html",
+            planet=planet,
+            surface_temperature=surface_temperature,
+            system=current_system,
+            galaxy=current_galaxy,
+            image_url=image_url,
+            summary=planet_summary,
+            planet_url=planet_url,
+            version=VERSION,
+            versionHash=VERSION_HASH,
+        )
 
     return redirect(url_for("view_system", system_index=current_system.index))
 
 
 @app.route("/planet_blob/<planet_name>")
 def planet_blob(planet_name):
-    current_system = get_current_system()
-    current_galaxy = get_current_galaxy()
+    clock = CosmicClock()
+    current_system = get_current_system(clock)
+    current_galaxy = get_current_galaxy(clock)
 
     coordinates = f"{current_galaxy.coordinates[0]}_{current_galaxy.coordinates[1]}_{current_galaxy.coordinates[2]}"
     system_name = current_system.name.lower()
@@ -319,23 +349,54 @@ def planet_blob(planet_name):
         if os.path.exists(cache_filepath):
             return send_file(cache_filepath, mimetype="image/webp")
 
-        for planet in current_system.planets.values():
-            if planet.name.lower() == planet_name:
-                image = asyncio.run(handle_image_generation(planet))
-                image.save(cache_filepath, "WEBP", quality=config.image_quality)
-                return send_file(cache_filepath, mimetype="image/webp")
+        planet = current_system.get_planet_by_name(planet_name)
+        if planet:
+            image = asyncio.run(handle_image_generation(planet, clock))
+            image.save(cache_filepath, "WEBP", quality=config.image_quality)
+            return send_file(cache_filepath, mimetype="image/webp")
     else:
-        for planet in current_system.planets.values():
-            if planet.name.lower() == planet_name:
-                image = asyncio.run(handle_image_generation(planet))
-                img_io = BytesIO()
-                image.save(img_io, "WEBP", quality=config.image_quality)
-                img_io.seek(0)
-                return send_file(img_io, mimetype="image/webp")
+        planet = current_system.get_planet_by_name(planet_name)
+        if planet:
+            image = asyncio.run(handle_image_generation(planet, clock))
+            img_io = BytesIO()
+            image.save(img_io, "WEBP", quality=config.image_quality)
+            img_io.seek(0)
+            return send_file(img_io, mimetype="image/webp")
 
     return redirect(url_for("view_system", system_index=current_system.index))
 
 
+@app.route("/search")
+def search():
+    global search_index
+    try:
+        if search_index is None or search_index.is_stale():
+            search_index = SearchIndex()
+
+        near = request.args.get("near")
+        limit = min(max(request.args.get("limit", 20, type=int), 0), 1000)
+        found = search_index.search(
+            request.args.get("q", ""), parse_near(near) if near else None, limit
+        )
+        return jsonify(found)
+    except FileNotFoundError:
+        return (
+            jsonify(
+                {"error": "No search index found, build one with --index --build."}
+            ),
+            404,
+        )
+    except ValueError as ve:
+        return jsonify({"error": str(ve)}), 400
+
+
+@app.route("/cache_stats")
+def cache_stats():
+    if universe is None:
+        return jsonify({"error": "The universe simulation isn't running yet."}), 503
+    return jsonify(universe.cache_stats())
+
+
 @app.route("/stargate/<encoded_url>", endpoint="stargate")
 def stargate(encoded_url):
     try:
@@ -386,9 +447,13 @@ if __name__ == "__main__":
 
     if RunAtlasProtocol():
         if "--observer" in sys.argv:
-            observer(universe)
+            observer_main(universe, sys.argv[1:])
             exit("Observer out!")
 
+        if "--index" in sys.argv:
+            index_main(universe, sys.argv[1:])
+            exit("Index out!")
+
         if config.enable_cache:
             start_cache_daemon()
 
@@ -41,11 +41,15 @@ def display_boot_message(
     seed_str,
     seed_hash,
     seed,
+    universe_format,
     cosmic_origin_time,
     cosmic_origin_datetime,
     image_quality,
+    planet_renderer,
     enable_cache,
     cache_cleanup_time,
+    galaxy_cache_size,
+    system_cache_size,
     version,
     version_hash,
 ):
@@ -57,14 +61,23 @@ def display_boot_message(
     print(f"\033[1m    Original Seed\033[0m          : \033[92m{seed_str}\033[0m")
     print(f"\033[1m    SHA-256 Seed Hash\033[0m      : \033[92m{seed_hash}\033[0m")
     print(f"\033[1m    Final Decimal Seed\033[0m     : \033[92m{seed}\033[0m")
+    print(
+        f"\033[1m    Universe Format\033[0m        : \033[92mv{universe_format}\033[0m"
+    )
     print(
         f"\033[1m    Cosmic Origin Time\033[0m     : \033[92m{cosmic_origin_time}\033[0m (\033[93m{cosmic_origin_datetime}\033[0m)"
     )
     print(f"\033[1m    Image Quality\033[0m          : \033[92m{image_quality}\033[0m")
+    print(
+        f"\033[1m    Planet Renderer\033[0m        : \033[92m{planet_renderer}\033[0m"
+    )
     print(f"\033[1m    Enable Cache\033[0m           : \033[92m{enable_cache}\033[0m")
     print(
         f"\033[1m    Cache Cleanup Time\033[0m     : \033[92m{cache_cleanup_time}\033[0m (\033[93m{cache_cleanup_time / 60} minutes\033[0m)"
     )
+    print(
+        f"\033[1m    Galaxy Cache Size\033[0m      : \033[92m{galaxy_cache_size}\033[0m (\033[93m{system_cache_size} systems per galaxy\033[0m)"
+    )
     print(f"\033[1m    Version\033[0m                : \033[92m{version}\033[0m")
     print(f"\033[1m    Version Hash\033[0m           : \033[92m{version_hash}\033[0m")
     print("\033[94m" + "=" * 50 + "\033[0m")
@@ -3,10 +3,17 @@
 import os
 import hashlib
 
+from pymodules.__atlas_fixed_vars import SURFACE_CACHE_VERSION
+
 cache_dir = "static/cache"
 if not os.path.exists(cache_dir):
     os.makedirs(cache_dir)
 
+surface_cache_dir = os.path.join(cache_dir, "surfaces")
+if not os.path.exists(surface_cache_dir):
+    os.makedirs(surface_cache_dir)
+surface_cache_prefix = f"surface_v{SURFACE_CACHE_VERSION}_"
+
 
 def generate_cache_filename(
     identifier_type, coordinates, system_name, planet_name=None
@@ -26,3 +33,10 @@ def get_cached_image_path(identifier_type, coordinates, system_name, planet_name
         identifier_type, coordinates, system_name, planet_name
     )
     return os.path.join(cache_dir, cache_filename)
+
+
+def get_cached_surface_path(shape_seed, planet_radius, img_size):
+    return os.path.join(
+        surface_cache_dir,
+        f"{surface_cache_prefix}{shape_seed}_{planet_radius}_{img_size}.png",
+    )
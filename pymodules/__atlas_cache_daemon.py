@@ -5,8 +5,41 @@ import time
 
 from threading import Thread
 
-from pymodules.__atlas_cache import cache_dir
+from pymodules.__atlas_cache import cache_dir, surface_cache_dir, surface_cache_prefix
 from pymodules.__atlas_config import config
+from pymodules.__atlas_fixed_vars import SURFACE_DISK_CACHE_BYTES
+
+
+def remove_cached_file(filepath):
+    try:
+        os.remove(filepath)
+    except FileNotFoundError:
+        pass
+
+
+def clear_surface_cache(now):
+    surfaces = []
+    for filename in os.listdir(surface_cache_dir):
+        filepath = os.path.join(surface_cache_dir, filename)
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            continue
+
+        if not filename.startswith(surface_cache_prefix):
+            remove_cached_file(filepath)
+        elif filename.endswith(".tmp"):
+            if now - stat.st_mtime > config.cache_cleanup_time:
+                remove_cached_file(filepath)
+        else:
+            surfaces.append((stat.st_mtime, stat.st_size, filepath))
+
+    total_size = sum(size for _, size, _ in surfaces)
+    for _, size, filepath in sorted(surfaces):
+        if total_size <= SURFACE_DISK_CACHE_BYTES:
+            break
+        remove_cached_file(filepath)
+        total_size -= size
 
 
 def clear_cache():
@@ -23,6 +56,8 @@ def clear_cache():
 
                 if now - file_creation_time > config.cache_cleanup_time:
                     os.remove(filepath)
+
+        clear_surface_cache(now)
         time.sleep(60)
 
 
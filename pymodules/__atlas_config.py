@@ -6,7 +6,15 @@ import random
 import hashlib
 import configparser
 
-from pymodules.__atlas_fixed_vars import VERSION, VERSION_HASH, PORT
+from pymodules.__atlas_fixed_vars import (
+    VERSION,
+    VERSION_HASH,
+    PORT,
+    GALAXY_CACHE_SIZE,
+    SYSTEM_CACHE_SIZE,
+    PLANET_RENDERER,
+    UNIVERSE_FORMAT,
+)
 from pymodules.__atlas_boot_message import display_boot_message, display_intro_message
 from pymodules.__atlas_config_helpers import custom_timestamp_to_date
 
@@ -37,6 +45,8 @@ class Config:
         self.seed_hash = hashlib.sha256(self.seed_str.encode("utf-8")).hexdigest()
         self.seed = int(self.seed_hash, 16)
 
+        self.universe_format = config.getint("Settings", "universe_format", fallback=1)
+
         self.cosmic_origin_time = config.get("Settings", "cosmic_origin_time")
         self.cosmic_origin_time = int(self.cosmic_origin_time)
 
@@ -45,21 +55,36 @@ class Config:
         self.image_quality = config.get("Settings", "image_quality")
         self.image_quality = int(self.image_quality)
 
+        self.planet_renderer = config.get(
+            "Settings", "planet_renderer", fallback=PLANET_RENDERER
+        )
+
         self.enable_cache = config.get("Settings", "enable_cache")
         self.enable_cache = config.getboolean("Settings", "enable_cache")
 
         self.cache_cleanup_time = config.get("Settings", "cache_cleanup_time")
         self.cache_cleanup_time = int(self.cache_cleanup_time)
 
+        self.galaxy_cache_size = config.getint(
+            "Settings", "galaxy_cache_size", fallback=GALAXY_CACHE_SIZE
+        )
+        self.system_cache_size = config.getint(
+            "Settings", "system_cache_size", fallback=SYSTEM_CACHE_SIZE
+        )
+
         display_boot_message(
             self.seed_str,
             self.seed_hash,
             self.seed,
+            self.universe_format,
             self.cosmic_origin_time,
             self.cosmic_origin_datetime,
             self.image_quality,
+            self.planet_renderer,
             self.enable_cache,
             self.cache_cleanup_time,
+            self.galaxy_cache_size,
+            self.system_cache_size,
             VERSION,
             VERSION_HASH,
         )
@@ -67,14 +92,18 @@ class Config:
         self._initialized = True
         return True
 
-    def create_atlas_ini(self, seed_str, cosmic_origin_time):
+    def create_atlas_ini(self, seed_str, cosmic_origin_time, universe_format=1):
         config = configparser.ConfigParser()
         config["Settings"] = {
             "seed": seed_str,
+            "universe_format": str(universe_format),
             "cosmic_origin_time": str(cosmic_origin_time),
             "image_quality": "100",
+            "planet_renderer": PLANET_RENDERER,
             "enable_cache": "True",
             "cache_cleanup_time": "900",
+            "galaxy_cache_size": str(GALAXY_CACHE_SIZE),
+            "system_cache_size": str(SYSTEM_CACHE_SIZE),
         }
         with open("atlas.ini", "w") as configfile:
             config.write(configfile)
@@ -87,11 +116,13 @@ class Config:
         if universe_type == "default":
             seed_str = "1.618033988749895"
             cosmic_origin_time = 514080000
+            universe_format = 1
         else:
             seed_str = f"{self.generate_hex_seed()}-{self.generate_hex_seed()}-{self.generate_hex_seed()}"
             cosmic_origin_time = int(time.time())
+            universe_format = UNIVERSE_FORMAT
 
-        self.create_atlas_ini(seed_str, cosmic_origin_time)
+        self.create_atlas_ini(seed_str, cosmic_origin_time, universe_format)
 
         return self.initialize()
 
@@ -8,4 +8,13 @@ RUN = "PROD"
 VERSION = "0.9.98sm1"
 VERSION_HASH = hashlib.sha256(VERSION.encode("utf-8")).hexdigest()
 MAX_PILLOW_WORKERS = 4
+GALAXY_CACHE_SIZE = 64
+SYSTEM_CACHE_SIZE = 128
+SURFACE_CACHE_SIZE = 32
+SURFACE_CACHE_VERSION = 1
+SURFACE_DISK_CACHE_BYTES = 256 * 1024 * 1024
+HALO_CACHE_SIZE = 32
+PLANET_RENDERER = "disc"
+UNIVERSE_FORMAT = 2
+SEARCH_INDEX_PATH = "atlas_index"
 VISUAL_DEBUG = False
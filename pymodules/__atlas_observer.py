@@ -1,9 +1,25 @@
 # pymodules/__atlas_observer.py
 
-import gc
-
+import os
+import sys
+import json
+import time
+import argparse
+import multiprocessing
+
+from collections import deque
+from itertools import islice
+
+from pymodules.__atlas_config import config
+from pymodules.__atlas_observer_query import parse_query, parse_region
+from pymodules.__atlas_observer_stats import statistics_observer
+from pymodules.__atlas_seedmaster import create_seed_deriver
 from pymodules.__atlas_stargate import generate_planet_url
 
+from pymodules.__universe_base import MAX_COORDINATE, Universe, iter_coordinates
+from pymodules.__universe_clock import CosmicClock
+from pymodules.__universe_constants import PhysicalConstants
+
 
 planet_types = [
     "None",
@@ -51,6 +67,10 @@ life_forms = [
 ]
 
 
+OBSERVER_REGION = (range(MAX_COORDINATE + 1), range(9999999), range(9999999))
+OBSERVER_SHARD_SYSTEMS = 256
+
+
 def select_option(options, prompt="Please select an option"):
     print(prompt)
     for i, option in enumerate(options, 1):
@@ -67,7 +87,7 @@ def select_option(options, prompt="Please select an option"):
             print("Invalid input. Please enter a number.")
 
 
-def observer(universe):
+def select_criteria():
     desired_planet_type = select_option(planet_types, "Please select a planet type:")
     desired_life_form = select_option(life_forms, "Please select a desired life form:")
 
@@ -93,8 +113,82 @@ def observer(universe):
         print(
             "You must select at least one criterion (planet type, life form, or rings) to search."
         )
+        return None, None
+
+    criteria = {}
+    if desired_planet_type:
+        criteria["planet_type"] = desired_planet_type
+    if desired_life_form:
+        criteria["life_forms"] = desired_life_form
+    if search_rings is not None and search_rings != "infinite":
+        criteria["planet_rings"] = search_rings
+
+    return criteria, search_rings
+
+
+def print_progress(
+    total_planets_searched,
+    planets_with_rings,
+    planet_type_counts,
+    planets_with_rings_by_type,
+):
+    print(f"Total planets searched: {total_planets_searched}")
+    ring_percentage = (planets_with_rings / total_planets_searched) * 100
+    print(f"Total planets with rings: {planets_with_rings} ({ring_percentage}%)")
+    print()
+
+    probabilities = []
+    for ptype in planet_types:
+        if planet_type_counts[ptype] > 0:
+            ring_prob_by_type = (
+                planets_with_rings_by_type[ptype] / planet_type_counts[ptype]
+            ) * 100
+            if ring_prob_by_type > 0:
+                probabilities.append((ptype, ring_prob_by_type))
+
+    probabilities.sort(key=lambda x: x[1], reverse=True)
+
+    prob_strings = [f"[{ptype}: {prob:.2f}%]" for ptype, prob in probabilities]
+    print("Percentage by type -> " + " ".join(prob_strings))
+
+    print("-" * 50)
+
+
+def planet_url(coordinates, system_index, planet_name):
+    return f"http://127.0.0.1:5000{generate_planet_url(coordinates, system_index, planet_name, (system_index - 1) // 50 + 1)}"
+
+
+def print_match(
+    coordinates,
+    system_index,
+    galaxy_name,
+    system_name,
+    planet_name,
+    total_galaxies_searched,
+    total_systems_searched,
+    total_planets_searched,
+):
+    x, y, z = coordinates
+    print("Found a match!")
+    print(f"Galaxy: {galaxy_name} (Coords: {x}, {y}, {z})")
+    print(f"System #{system_index + 1}: {system_name}")
+    print(f"Planet: {planet_name}")
+    print(f"URL: {planet_url(coordinates, system_index, planet_name)}")
+    print(
+        f" + Galaxies Mapped: #{total_galaxies_searched} (now {x}, {y}, {z}), Systems Mapped: #{total_systems_searched}, Planets Mapped: #{total_planets_searched}"
+    )
+    print("-" * 50)
+    print("")
+
+
+def observer(universe, workers=1):
+    criteria, search_rings = select_criteria()
+    if criteria is None:
         return
 
+    if workers > 1:
+        return parallel_observer(universe, criteria, search_rings, workers)
+
     total_galaxies_searched = 0
     total_systems_searched = 0
     total_planets_searched = 0
@@ -104,117 +198,415 @@ def observer(universe):
     planets_with_rings_by_type = {ptype: 0 for ptype in planet_types}
 
     print("Searching infinitely. Please wait...")
-    x = 0
-    while True:
-        for y in range(9999999):
-            for z in range(9999999):
-                try:
-                    galaxy = universe.get_galaxy(x, y, z)
-                    total_galaxies_searched += 1
-
-                    for system_index in range(galaxy.num_systems):
-                        solar_system = galaxy.get_solar_system(system_index)
-                        total_systems_searched += 1
-
-                        for planet_index in range(solar_system.num_planets):
-                            planet = solar_system.get_planet(planet_index)
-                            total_planets_searched += 1
-
-                            if planet:
-                                planet_type = planet.planet_type
-                                planet_type_counts[planet_type] += 1
-
-                                if search_rings == "infinite":
-                                    if planet.planet_rings:
-                                        planets_with_rings += 1
-                                        planets_with_rings_by_type[planet_type] += 1
-
-                                if total_planets_searched % 1000 == 0:
-                                    print(
-                                        f"Total planets searched: {total_planets_searched}"
-                                    )
-                                    ring_percentage = (
-                                        planets_with_rings / total_planets_searched
-                                    ) * 100
-                                    print(
-                                        f"Total planets with rings: {planets_with_rings} ({ring_percentage}%)"
-                                    )
-                                    print()
-
-                                    probabilities = []
-                                    for ptype in planet_types:
-                                        if planet_type_counts[ptype] > 0:
-                                            ring_prob_by_type = (
-                                                planets_with_rings_by_type[ptype]
-                                                / planet_type_counts[ptype]
-                                            ) * 100
-                                            if ring_prob_by_type > 0:
-                                                probabilities.append(
-                                                    (ptype, ring_prob_by_type)
-                                                )
-
-                                    probabilities.sort(key=lambda x: x[1], reverse=True)
-
-                                    prob_strings = [
-                                        f"[{ptype}: {prob:.2f}%]"
-                                        for ptype, prob in probabilities
-                                    ]
-                                    print(
-                                        "Percentage by type -> "
-                                        + " ".join(prob_strings)
-                                    )
-
-                                    print("-" * 50)
-
-                                match = True
-                                if planet and search_rings != "infinite":
-                                    if (
-                                        desired_planet_type
-                                        and planet.planet_type != desired_planet_type
-                                    ):
-                                        match = False
-
-                                    if (
-                                        desired_life_form
-                                        and planet.life_forms != desired_life_form
-                                    ):
-                                        match = False
-
-                                    if (
-                                        search_rings is not None
-                                        and planet.planet_rings != search_rings
-                                    ):
-                                        match = False
-
-                                    if match:
-                                        print("Found a match!")
-                                        print(
-                                            f"Galaxy: {galaxy.name} (Coords: {x}, {y}, {z})"
-                                        )
-                                        print(
-                                            f"System #{system_index + 1}: {solar_system.name}"
-                                        )
-                                        print(f"Planet: {planet.name}")
-                                        print(
-                                            f"URL: http://127.0.0.1:5000{generate_planet_url((x, y, z), system_index, planet.name, (system_index - 1) // 50 + 1)}"
-                                        )
-                                        print(
-                                            f" + Galaxies Mapped: #{total_galaxies_searched} (now {x}, {y}, {z}), Systems Mapped: #{total_systems_searched}, Planets Mapped: #{total_planets_searched}"
-                                        )
-                                        print("-" * 50)
-                                        print("")
-                                        input("Press Enter to continue searching...")
-
-                            del planet
-                            gc.collect()
-
-                        del solar_system
-                        gc.collect()
-
-                    del galaxy
-                    gc.collect()
-
-                except ValueError:
-                    continue
-
-        x += 1
+    last_coordinates = None
+    last_system = None
+
+    for record in universe.iter_planets(OBSERVER_REGION, "xyz"):
+        system_index = record.system_index
+        planet = record.planet
+
+        if record.coordinates != last_coordinates:
+            last_coordinates = record.coordinates
+            last_system = None
+            total_galaxies_searched += 1
+        if system_index != last_system:
+            last_system = system_index
+            total_systems_searched += 1
+        total_planets_searched += 1
+
+        planet_type = planet.planet_type
+        planet_type_counts[planet_type] += 1
+
+        if search_rings == "infinite":
+            if planet.planet_rings:
+                planets_with_rings += 1
+                planets_with_rings_by_type[planet_type] += 1
+
+        if total_planets_searched % 1000 == 0:
+            print_progress(
+                total_planets_searched,
+                planets_with_rings,
+                planet_type_counts,
+                planets_with_rings_by_type,
+            )
+
+        if search_rings != "infinite" and planet.matches(criteria):
+            print_match(
+                record.coordinates,
+                system_index,
+                record.galaxy_name,
+                record.system_name,
+                planet.name,
+                total_galaxies_searched,
+                total_systems_searched,
+                total_planets_searched,
+            )
+            input("Press Enter to continue searching...")
+
+
+def plan_shards(universe, region, shard_systems=OBSERVER_SHARD_SYSTEMS):
+    for x, y, z in iter_coordinates(region, "xyz"):
+        clock = CosmicClock(origin_time=config.cosmic_origin_time)
+        num_systems = universe.create_galaxy(x, y, z, clock).num_systems_at(clock)
+        for start in range(0, num_systems, shard_systems):
+            yield (x, y, z), start, min(
+                start + shard_systems, num_systems
+            ), clock.timestamp
+
+
+def init_worker(seed, universe_format):
+    global worker_universe
+    config.initialize()
+    worker_universe = Universe(
+        seed, PhysicalConstants(), create_seed_deriver(seed, universe_format)
+    )
+
+
+def search_shard(shard, criteria, count_rings):
+    coordinates, start, stop, timestamp = shard
+    x, y, z = coordinates
+    clock = CosmicClock(timestamp, config.cosmic_origin_time)
+
+    planets = 0
+    planets_with_rings = 0
+    planet_type_counts = {}
+    planets_with_rings_by_type = {}
+    matches = []
+
+    for record in worker_universe.iter_planets(
+        ((x,), (y,), (z,)), "xyz", clock, range(start, stop)
+    ):
+        planet = record.planet
+        planets += 1
+
+        planet_type = planet.planet_type
+        planet_type_counts[planet_type] = planet_type_counts.get(planet_type, 0) + 1
+
+        if count_rings and planet.planet_rings:
+            planets_with_rings += 1
+            planets_with_rings_by_type[planet_type] = (
+                planets_with_rings_by_type.get(planet_type, 0) + 1
+            )
+
+        if criteria and planet.matches(criteria):
+            matches.append(
+                (
+                    record.system_index,
+                    record.planet_index,
+                    record.galaxy_name,
+                    record.system_name,
+                    planet.name,
+                    planets,
+                )
+            )
+
+    return {
+        "shard": shard,
+        "planets": planets,
+        "planets_with_rings": planets_with_rings,
+        "planet_type_counts": planet_type_counts,
+        "planets_with_rings_by_type": planets_with_rings_by_type,
+        "matches": matches,
+    }
+
+
+def parallel_observer(universe, criteria, search_rings, workers):
+    count_rings = search_rings == "infinite"
+    if count_rings:
+        criteria = None
+
+    total_galaxies_searched = 0
+    total_systems_searched = 0
+    total_planets_searched = 0
+    planets_with_rings = 0
+
+    planet_type_counts = {ptype: 0 for ptype in planet_types}
+    planets_with_rings_by_type = {ptype: 0 for ptype in planet_types}
+
+    print(f"Searching infinitely on {workers} workers. Please wait...")
+    shards = plan_shards(universe, OBSERVER_REGION)
+
+    with multiprocessing.Pool(
+        workers, init_worker, (universe.seed, config.universe_format)
+    ) as pool:
+        pending = deque(
+            pool.apply_async(search_shard, (shard, criteria, count_rings))
+            for shard in islice(shards, workers * 4)
+        )
+
+        while pending:
+            result = pending.popleft().get()
+            shard = next(shards, None)
+            if shard is not None:
+                pending.append(
+                    pool.apply_async(search_shard, (shard, criteria, count_rings))
+                )
+
+            coordinates, start, stop, timestamp = result["shard"]
+            if start == 0:
+                total_galaxies_searched += 1
+
+            for (
+                system_index,
+                planet_index,
+                galaxy_name,
+                system_name,
+                planet_name,
+                ordinal,
+            ) in result["matches"]:
+                print_match(
+                    coordinates,
+                    system_index,
+                    galaxy_name,
+                    system_name,
+                    planet_name,
+                    total_galaxies_searched,
+                    total_systems_searched + system_index - start + 1,
+                    total_planets_searched + ordinal,
+                )
+
+            previous_thousands = total_planets_searched // 1000
+            total_systems_searched += stop - start
+            total_planets_searched += result["planets"]
+            planets_with_rings += result["planets_with_rings"]
+            for ptype, count in result["planet_type_counts"].items():
+                planet_type_counts[ptype] += count
+            for ptype, count in result["planets_with_rings_by_type"].items():
+                planets_with_rings_by_type[ptype] += count
+
+            if total_planets_searched // 1000 > previous_thousands:
+                print_progress(
+                    total_planets_searched,
+                    planets_with_rings,
+                    planet_type_counts,
+                    planets_with_rings_by_type,
+                )
+
+
+def load_checkpoint(checkpoint_path, query, region_text):
+    if not checkpoint_path or not os.path.exists(checkpoint_path):
+        return None
+
+    with open(checkpoint_path) as checkpoint_file:
+        checkpoint = json.load(checkpoint_file)
+
+    if checkpoint["query"] != query or checkpoint["region"] != region_text:
+        raise ValueError(
+            f"Checkpoint {checkpoint_path} belongs to a different search, remove it or choose another --checkpoint."
+        )
+    return checkpoint
+
+
+def save_checkpoint(checkpoint_path, checkpoint):
+    temporary_path = f"{checkpoint_path}.tmp"
+    with open(temporary_path, "w") as checkpoint_file:
+        json.dump(checkpoint, checkpoint_file)
+    os.replace(temporary_path, checkpoint_path)
+
+
+def report_progress(checkpoint, started, searched_since_start, position):
+    elapsed = max(time.monotonic() - started, 1e-9)
+    x, y, z = position[0]
+    print(
+        f"[observer] planets={checkpoint['planets']} systems={checkpoint['systems']} "
+        f"galaxies={checkpoint['galaxies']} matches={checkpoint['matches']} "
+        f"rate={searched_since_start / elapsed:.0f} planets/s "
+        f"at ({x}, {y}, {z}) system #{position[1] + 1}",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def batch_observer(
+    universe,
+    query,
+    region_text=None,
+    out_path=None,
+    checkpoint_path=None,
+    progress_interval=10.0,
+    checkpoint_interval=30.0,
+):
+    criteria = parse_query(query)
+    region = parse_region(region_text) if region_text else OBSERVER_REGION
+    if out_path and not checkpoint_path:
+        checkpoint_path = f"{out_path}.checkpoint"
+
+    checkpoint = load_checkpoint(checkpoint_path, query, region_text)
+    if checkpoint is None:
+        checkpoint = {
+            "query": query,
+            "region": region_text,
+            "cursor": None,
+            "done": False,
+            "out_offset": 0,
+            "galaxies": 0,
+            "systems": 0,
+            "planets": 0,
+            "matches": 0,
+        }
+    elif checkpoint["done"]:
+        print(f"[observer] {checkpoint_path} is already complete.", file=sys.stderr)
+        return checkpoint
+    else:
+        print(
+            f"[observer] Resuming from {checkpoint['cursor']} after {checkpoint['planets']} planets.",
+            file=sys.stderr,
+        )
+
+    if out_path:
+        out = open(out_path, "ab")
+        out.truncate(checkpoint["out_offset"])
+        out.seek(checkpoint["out_offset"])
+    else:
+        out = sys.stdout.buffer
+
+    cursor = checkpoint["cursor"]
+    last_coordinates = tuple(cursor[0]) if cursor else None
+    started = time.monotonic()
+    next_progress = started + progress_interval
+    next_checkpoint = started + checkpoint_interval
+    searched_since_start = 0
+    position = cursor
+
+    try:
+        for record in universe.iter_planets(region, "xyz", cursor=cursor):
+            if record.planet_index == 0:
+                if record.coordinates != last_coordinates:
+                    last_coordinates = record.coordinates
+                    checkpoint["galaxies"] += 1
+
+                position = (record.coordinates, record.system_index)
+                now = time.monotonic()
+                if checkpoint_path and now >= next_checkpoint:
+                    out.flush()
+                    checkpoint["cursor"] = position
+                    checkpoint["out_offset"] = out.tell() if out_path else 0
+                    save_checkpoint(checkpoint_path, checkpoint)
+                    next_checkpoint = now + checkpoint_interval
+                if now >= next_progress:
+                    report_progress(checkpoint, started, searched_since_start, position)
+                    next_progress = now + progress_interval
+
+                checkpoint["systems"] += 1
+
+            checkpoint["planets"] += 1
+            searched_since_start += 1
+
+            planet = record.planet
+            if planet.matches(criteria):
+                checkpoint["matches"] += 1
+                match = {
+                    "coordinates": list(record.coordinates),
+                    "galaxy": record.galaxy_name,
+                    "system_index": record.system_index,
+                    "system": record.system_name,
+                    "planet_index": record.planet_index,
+                    "planet": planet.name,
+                    "url": planet_url(
+                        record.coordinates, record.system_index, planet.name
+                    ),
+                    "attributes": {
+                        attribute: getattr(planet, attribute) for attribute in criteria
+                    },
+                }
+                out.write(json.dumps(match).encode("utf-8") + b"\n")
+                out.flush()
+    finally:
+        if out_path:
+            checkpoint["out_offset"] = out.tell()
+            out.close()
+
+    checkpoint["cursor"] = None
+    checkpoint["done"] = True
+    if checkpoint_path:
+        save_checkpoint(checkpoint_path, checkpoint)
+    if position:
+        report_progress(checkpoint, started, searched_since_start, position)
+    return checkpoint
+
+
+def positive_int(text):
+    value = int(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"{text} is not a positive integer")
+    return value
+
+
+def open_unit_interval(text):
+    value = float(text)
+    if not 0 < value < 1:
+        raise argparse.ArgumentTypeError(f"{text} is not between 0 and 1")
+    return value
+
+
+def observer_main(universe, argv):
+    parser = argparse.ArgumentParser(prog="atlas --observer")
+    parser.add_argument("--observer", action="store_true")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="processes for the interactive search and --stats",
+    )
+    parser.add_argument(
+        "--query",
+        help="run unattended, e.g. 'type=Diamond and rings and temp<300'",
+    )
+    parser.add_argument(
+        "--region",
+        help="x,y,z ranges as start:stop (stop excluded) or single values, e.g. '0:10,0:10,0:1000'",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="estimate planet distributions from uniform random samples",
+    )
+    parser.add_argument("--tolerance", type=float, default=0.005)
+    parser.add_argument("--confidence", type=open_unit_interval, default=0.95)
+    parser.add_argument("--batch-size", type=positive_int, default=500)
+    parser.add_argument("--max-samples", type=positive_int, default=1000000)
+    parser.add_argument("--stats-seed", type=int)
+    parser.add_argument(
+        "--stats-timestamp",
+        type=int,
+        help="sample the universe as it was at this Unix time, defaults to now",
+    )
+    parser.add_argument(
+        "--out", help="NDJSON file to append matches to, or the --stats JSON report"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help="resumable cursor file, defaults to <out>.checkpoint",
+    )
+    parser.add_argument("--progress-interval", type=float, default=10.0)
+    parser.add_argument("--checkpoint-interval", type=float, default=30.0)
+    args, _ = parser.parse_known_args(argv)
+
+    if args.stats:
+        return statistics_observer(
+            universe,
+            args.workers,
+            args.tolerance,
+            args.confidence,
+            args.batch_size,
+            args.max_samples,
+            args.stats_seed,
+            args.out,
+            args.stats_timestamp,
+        )
+
+    if args.query is None:
+        return observer(universe, args.workers)
+
+    try:
+        return batch_observer(
+            universe,
+            args.query,
+            args.region,
+            args.out,
+            args.checkpoint,
+            args.progress_interval,
+            args.checkpoint_interval,
+        )
+    except ValueError as e:
+        parser.error(str(e))
@@ -0,0 +1,138 @@
+# pymodules/__atlas_observer_query.py
+
+import re
+import operator
+
+from types import MappingProxyType
+
+from pymodules.__universe_base import MAX_COORDINATE, PLANET_ATTRIBUTE_STAGES
+
+
+QUERY_ALIASES = MappingProxyType(
+    {
+        "type": "planet_type",
+        "life": "life_forms",
+        "rings": "planet_rings",
+        "temp": "surface_temperature",
+        "temperature": "surface_temperature",
+        "tilt": "axial_tilt",
+        "radius": "orbital_radius",
+    }
+)
+QUERY_FIELDS = (frozenset(PLANET_ATTRIBUTE_STAGES) - {"profile"}) | {
+    "name",
+    "surface_temperature",
+}
+QUERY_TEXT_FIELDS = frozenset(
+    {"planet_type", "life_forms", "atmosphere", "name", "elements", "possible_elements"}
+)
+QUERY_OPERATORS = MappingProxyType(
+    {
+        "=": operator.eq,
+        "==": operator.eq,
+        "!=": operator.ne,
+        "<": operator.lt,
+        "<=": operator.le,
+        ">": operator.gt,
+        ">=": operator.ge,
+    }
+)
+
+QUERY_SEPARATOR = re.compile(r"\s+and\s+", re.IGNORECASE)
+QUERY_COMPARISON = re.compile(r"^([A-Za-z_]\w*)\s*(==|!=|<=|>=|=|<|>)\s*(.+)$")
+QUERY_FLAG = re.compile(r"^(not\s+)?([A-Za-z_]\w*)$", re.IGNORECASE)
+
+
+def query_attribute(field):
+    attribute = QUERY_ALIASES.get(field.lower(), field)
+    if attribute not in QUERY_FIELDS:
+        raise ValueError(f"Unknown query field {field!r}.")
+    return attribute
+
+
+def query_value(text):
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "'\"":
+        return text[1:-1]
+    if text.lower() in ("true", "yes"):
+        return True
+    if text.lower() in ("false", "no"):
+        return False
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def compare(value, compare_operator, expected):
+    if isinstance(value, (list, tuple)):
+        contained = any(compare(item, operator.eq, expected) for item in value)
+        return contained if compare_operator is operator.eq else not contained
+
+    if isinstance(expected, str):
+        return compare_operator(str(value).lower(), expected.lower())
+
+    return compare_operator(value, expected)
+
+
+def term_predicate(compare_operator, expected):
+    return lambda value: compare(value, compare_operator, expected)
+
+
+def combine_predicates(first, second):
+    return lambda value: first(value) and second(value)
+
+
+def parse_query(text):
+    criteria = {}
+    for term in QUERY_SEPARATOR.split(text.strip()):
+        comparison = QUERY_COMPARISON.match(term)
+        flag = QUERY_FLAG.match(term)
+        if comparison:
+            field, symbol, value = comparison.groups()
+            attribute = query_attribute(field)
+            expected = query_value(value)
+            compare_operator = QUERY_OPERATORS[symbol]
+            if compare_operator not in (operator.eq, operator.ne) and (
+                isinstance(expected, str) or attribute in QUERY_TEXT_FIELDS
+            ):
+                raise ValueError(f"Only = and != can be used in {term!r}.")
+            predicate = term_predicate(compare_operator, expected)
+        elif flag:
+            negated, field = flag.groups()
+            attribute = query_attribute(field)
+            predicate = operator.not_ if negated else bool
+        else:
+            raise ValueError(f"Could not parse query term {term!r}.")
+
+        if attribute in criteria:
+            predicate = combine_predicates(criteria[attribute], predicate)
+        criteria[attribute] = predicate
+
+    return criteria
+
+
+def parse_axis(text):
+    bounds = text.split(":")
+    if len(bounds) == 1:
+        start = int(bounds[0])
+        return range(start, start + 1)
+    if len(bounds) == 2:
+        start = int(bounds[0]) if bounds[0] else 0
+        stop = int(bounds[1]) if bounds[1] else MAX_COORDINATE + 1
+        return range(start, stop)
+    raise ValueError(f"Could not parse region axis {text!r}.")
+
+
+def parse_region(text):
+    axes = text.split(",")
+    if len(axes) != 3:
+        raise ValueError("A region needs three axes, e.g. '0:10,0:10,0:100'.")
+
+    region = tuple(parse_axis(axis.strip()) for axis in axes)
+    for axis in region:
+        if axis.start < 0 or axis.stop > MAX_COORDINATE + 1:
+            raise ValueError(
+                f"Coordinates out of range. Must be between 0 and {MAX_COORDINATE}."
+            )
+    return region
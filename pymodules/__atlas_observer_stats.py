@@ -0,0 +1,236 @@
+# pymodules/__atlas_observer_stats.py
+
+import sys
+import json
+import math
+import time
+import random
+import multiprocessing
+
+from collections import deque
+from statistics import NormalDist
+
+from pymodules.__atlas_config import config
+from pymodules.__atlas_seedmaster import create_seed_deriver
+
+from pymodules.__universe_base import MAX_COORDINATE, Universe
+from pymodules.__universe_clock import CosmicClock
+from pymodules.__universe_constants import PhysicalConstants
+
+
+STATISTICS_CATEGORIES = ("planet_type", "atmosphere", "life_forms", "planet_rings")
+
+
+def init_sampler(seed, universe_format):
+    global sampler_universe
+    config.initialize()
+    sampler_universe = Universe(
+        seed, PhysicalConstants(), create_seed_deriver(seed, universe_format)
+    )
+
+
+def new_totals():
+    return {
+        "samples": 0,
+        "void_galaxies": 0,
+        "systems": 0,
+        "planets": 0,
+        "weight": 0.0,
+        "weight_squared": 0.0,
+        "values": {category: {} for category in STATISTICS_CATEGORIES},
+    }
+
+
+def sample_batch(batch_seed, size, timestamp):
+    rng = random.Random(batch_seed)
+    clock = CosmicClock(timestamp, config.cosmic_origin_time)
+    totals = new_totals()
+
+    for _ in range(size):
+        x = rng.randint(0, MAX_COORDINATE)
+        y = rng.randint(0, MAX_COORDINATE)
+        z = rng.randint(0, MAX_COORDINATE)
+        galaxy = sampler_universe.create_galaxy(x, y, z, clock)
+        num_systems = galaxy.num_systems_at(clock)
+
+        totals["samples"] += 1
+        if num_systems <= 0:
+            totals["void_galaxies"] += 1
+            continue
+
+        solar_system = galaxy.create_solar_system(rng.randrange(num_systems))
+        planet = solar_system.planets[rng.randrange(solar_system.num_planets)]
+
+        weight = num_systems * solar_system.num_planets
+        totals["systems"] += num_systems
+        totals["planets"] += solar_system.num_planets
+        totals["weight"] += weight
+        totals["weight_squared"] += weight * weight
+
+        for category in STATISTICS_CATEGORIES:
+            sums = totals["values"][category].setdefault(
+                str(getattr(planet, category)), [0.0, 0.0]
+            )
+            sums[0] += weight
+            sums[1] += weight * weight
+
+    return totals
+
+
+def merge_totals(totals, batch):
+    for key in ("samples", "void_galaxies", "systems", "planets"):
+        totals[key] += batch[key]
+    totals["weight"] += batch["weight"]
+    totals["weight_squared"] += batch["weight_squared"]
+    for category, values in batch["values"].items():
+        for value, (weight, weight_squared) in values.items():
+            sums = totals["values"][category].setdefault(value, [0.0, 0.0])
+            sums[0] += weight
+            sums[1] += weight_squared
+
+
+def estimate(totals, confidence):
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    total_weight = totals["weight"]
+    distributions = {}
+    widest = 0.0
+
+    for category, values in totals["values"].items():
+        rows = []
+        for value, (weight, weight_squared) in values.items():
+            share = weight / total_weight
+            variance = (
+                (1 - 2 * share) * weight_squared
+                + share * share * totals["weight_squared"]
+            ) / (total_weight * total_weight)
+            half_width = z * math.sqrt(max(variance, 0.0))
+            widest = max(widest, half_width)
+            rows.append((value, share, half_width))
+        rows.sort(key=lambda row: row[1], reverse=True)
+        distributions[category] = rows
+
+    return distributions, widest
+
+
+def print_statistics(totals, distributions, confidence, elapsed, out=sys.stdout):
+    samples = totals["samples"]
+    galaxies = samples - totals["void_galaxies"]
+    effective = (
+        totals["weight"] ** 2 / totals["weight_squared"]
+        if totals["weight_squared"]
+        else 0
+    )
+
+    print(f"Samples: {samples} ({samples / elapsed:.0f}/s)", file=out)
+    print(f"Effective sample size: {effective:.0f}", file=out)
+    print(
+        f"Singularity voids: {totals['void_galaxies'] / samples * 100:.2f}%", file=out
+    )
+    if galaxies:
+        print(f"Mean systems per galaxy: {totals['systems'] / galaxies:.0f}", file=out)
+        print(f"Mean planets per system: {totals['planets'] / galaxies:.3f}", file=out)
+
+    for category, rows in distributions.items():
+        print("-" * 50, file=out)
+        print(f"{category} ({confidence * 100:.0f}% confidence)", file=out)
+        for value, share, half_width in rows:
+            print(
+                f"  {value:<24} {share * 100:7.3f}% ± {half_width * 100:.3f}%",
+                file=out,
+            )
+
+
+def statistics_observer(
+    universe,
+    workers=1,
+    tolerance=0.005,
+    confidence=0.95,
+    batch_size=500,
+    max_samples=1000000,
+    seed=None,
+    out_path=None,
+    timestamp=None,
+):
+    seed = random.randrange(2**63) if seed is None else seed
+    seeds = random.Random(seed)
+    if timestamp is None:
+        timestamp = CosmicClock(origin_time=config.cosmic_origin_time).timestamp
+    totals = new_totals()
+    started = time.monotonic()
+    widest = math.inf
+    distributions = {}
+    submitted = 0
+
+    print(
+        f"[statistics] seed={seed} timestamp={timestamp} tolerance=±{tolerance * 100:.2f}% workers={workers}",
+        file=sys.stderr,
+    )
+
+    def next_batch():
+        nonlocal submitted
+        size = min(batch_size, max_samples - submitted)
+        submitted += size
+        return seeds.getrandbits(64), size, timestamp
+
+    if workers > 1:
+        pool = multiprocessing.Pool(
+            workers, init_sampler, (universe.seed, config.universe_format)
+        )
+        pending = deque(
+            pool.apply_async(sample_batch, next_batch())
+            for _ in range(workers * 2)
+            if submitted < max_samples
+        )
+    else:
+        pool = None
+        init_sampler(universe.seed, config.universe_format)
+        pending = deque()
+
+    try:
+        while totals["samples"] < max_samples and widest > tolerance:
+            if pool:
+                batch = pending.popleft().get()
+                if submitted < max_samples:
+                    pending.append(pool.apply_async(sample_batch, next_batch()))
+            else:
+                batch = sample_batch(*next_batch())
+
+            merge_totals(totals, batch)
+            if totals["weight"]:
+                distributions, widest = estimate(totals, confidence)
+            print(
+                f"[statistics] samples={totals['samples']} widest interval=±{widest * 100:.3f}%",
+                file=sys.stderr,
+            )
+    finally:
+        if pool:
+            pool.terminate()
+
+    elapsed = max(time.monotonic() - started, 1e-9)
+    print_statistics(totals, distributions, confidence, elapsed)
+
+    if out_path:
+        with open(out_path, "w") as out_file:
+            json.dump(
+                {
+                    "seed": seed,
+                    "timestamp": timestamp,
+                    "tolerance": tolerance,
+                    "confidence": confidence,
+                    "batch_size": batch_size,
+                    "max_samples": max_samples,
+                    "samples": totals["samples"],
+                    "void_galaxies": totals["void_galaxies"],
+                    "distributions": {
+                        category: [
+                            {"value": value, "share": share, "half_width": half_width}
+                            for value, share, half_width in rows
+                        ]
+                        for category, rows in distributions.items()
+                    },
+                },
+                out_file,
+                indent=2,
+            )
+
+    return distributions
@@ -0,0 +1,295 @@
+# pymodules/__atlas_search_index.py
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+
+import numpy as np
+
+from array import array
+from types import MappingProxyType
+
+from pymodules.__atlas_config import config
+from pymodules.__atlas_fixed_vars import SEARCH_INDEX_PATH
+from pymodules.__atlas_observer_query import parse_query, parse_region
+from pymodules.__atlas_seedmaster import create_seed_deriver
+from pymodules.__atlas_stargate import generate_planet_url
+
+from pymodules.__universe_clock import CosmicClock
+from pymodules.__universe_name_generator import generate_name
+
+
+INDEX_COLUMNS = MappingProxyType(
+    {
+        "x": ("I", "<u4"),
+        "y": ("I", "<u4"),
+        "z": ("I", "<u4"),
+        "system_index": ("Q", "<u8"),
+        "planet_index": ("B", "u1"),
+        "planet_type": ("B", "u1"),
+        "life_forms": ("B", "u1"),
+        "atmosphere": ("B", "u1"),
+        "planet_rings": ("B", "u1"),
+    }
+)
+INDEX_ENUMS = ("planet_type", "life_forms", "atmosphere", "planet_rings")
+INDEX_FORMAT = 1
+
+
+def parse_systems(text):
+    start, _, stop = text.partition(":")
+    return range(int(start or 0), int(stop))
+
+
+def replace_directory(staging, path):
+    if not os.path.exists(path):
+        os.rename(staging, path)
+        return
+
+    retired = tempfile.mkdtemp(
+        prefix=f".{os.path.basename(path)}-old-", dir=os.path.dirname(path)
+    )
+    os.rename(path, os.path.join(retired, "index"))
+    os.rename(staging, path)
+    shutil.rmtree(retired, ignore_errors=True)
+
+
+def build_index(
+    universe,
+    region_text,
+    systems_text,
+    path=SEARCH_INDEX_PATH,
+    progress_interval=10.0,
+):
+    region = parse_region(region_text)
+    systems = parse_systems(systems_text)
+    clock = CosmicClock(origin_time=config.cosmic_origin_time)
+
+    columns = {name: array(typecode) for name, (typecode, _) in INDEX_COLUMNS.items()}
+    codes = {attribute: {} for attribute in INDEX_ENUMS}
+    codes["planet_rings"] = {False: 0, True: 1}
+
+    started = time.monotonic()
+    next_progress = started + progress_interval
+    for record in universe.iter_planets(region, "xyz", clock, systems):
+        planet = record.planet
+        x, y, z = record.coordinates
+        columns["x"].append(x)
+        columns["y"].append(y)
+        columns["z"].append(z)
+        columns["system_index"].append(record.system_index)
+        columns["planet_index"].append(record.planet_index)
+        for attribute in INDEX_ENUMS:
+            values = codes[attribute]
+            columns[attribute].append(
+                values.setdefault(getattr(planet, attribute), len(values))
+            )
+
+        if time.monotonic() >= next_progress:
+            print(
+                f"[index] planets={len(columns['x'])} at ({x}, {y}, {z}) system #{record.system_index + 1}",
+                file=sys.stderr,
+                flush=True,
+            )
+            next_progress = time.monotonic() + progress_interval
+
+    path = os.path.abspath(path)
+    parent, name = os.path.split(path)
+    os.makedirs(parent, exist_ok=True)
+
+    meta = {
+        "format": INDEX_FORMAT,
+        "seed_hash": config.seed_hash,
+        "universe_format": config.universe_format,
+        "region": region_text,
+        "systems": systems_text,
+        "timestamp": clock.timestamp,
+        "count": len(columns["x"]),
+        "enums": {attribute: list(codes[attribute]) for attribute in INDEX_ENUMS},
+    }
+    staging = tempfile.mkdtemp(prefix=f".{name}-", dir=parent)
+    try:
+        for column, (_, dtype) in INDEX_COLUMNS.items():
+            np.save(
+                os.path.join(staging, f"{column}.npy"),
+                np.frombuffer(columns[column], dtype),
+            )
+        with open(os.path.join(staging, "meta.json"), "w") as meta_file:
+            json.dump(meta, meta_file, indent=2)
+        replace_directory(staging, path)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    print(
+        f"[index] {meta['count']} planets written to {path} in {time.monotonic() - started:.1f}s",
+        file=sys.stderr,
+    )
+    return meta
+
+
+def meta_stamp(stat):
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class SearchIndex:
+    def __init__(self, path=SEARCH_INDEX_PATH, seed_deriver=None):
+        with open(os.path.join(path, "meta.json")) as meta_file:
+            self.stamp = meta_stamp(os.fstat(meta_file.fileno()))
+            self.meta = json.load(meta_file)
+
+        if (
+            self.meta["seed_hash"] != config.seed_hash
+            or self.meta["universe_format"] != config.universe_format
+        ):
+            raise ValueError(
+                f"The index in {path} was built for another universe, rebuild it with --index --build."
+            )
+
+        self.path = path
+        self.enums = self.meta["enums"]
+        self.columns = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+            for name in INDEX_COLUMNS
+        }
+        self.seed_deriver = seed_deriver or create_seed_deriver(
+            config.seed, config.universe_format
+        )
+
+    def is_stale(self):
+        try:
+            return (
+                meta_stamp(os.stat(os.path.join(self.path, "meta.json")))
+                != self.stamp
+            )
+        except FileNotFoundError:
+            return True
+
+    def __len__(self):
+        return self.meta["count"]
+
+    def search(self, query, near=None, limit=20):
+        mask = np.ones(len(self), dtype=bool)
+        for attribute, predicate in parse_query(query).items():
+            if attribute not in self.enums:
+                raise ValueError(
+                    f"{attribute!r} is not indexed, use one of {', '.join(INDEX_ENUMS)}."
+                )
+            allowed = [predicate(value) for value in self.enums[attribute]]
+            if all(allowed):
+                continue
+            if not any(allowed):
+                mask[:] = False
+                break
+            if allowed.count(True) == 1:
+                mask &= self.columns[attribute] == allowed.index(True)
+            else:
+                mask &= np.array(allowed)[self.columns[attribute]]
+
+        matches = np.flatnonzero(mask)
+        total = len(matches)
+
+        distances = None
+        if near is not None:
+            distances = sum(
+                (self.columns[axis][matches].astype(np.int64) - origin) ** 2
+                for axis, origin in zip("xyz", near)
+            )
+            if total > limit:
+                nearest = np.argpartition(distances, limit)[:limit]
+                matches, distances = matches[nearest], distances[nearest]
+            order = np.argsort(distances, kind="stable")
+            matches, distances = matches[order], distances[order]
+
+        matches = matches[:limit]
+        results = [self.describe(row) for row in matches.tolist()]
+        if distances is not None:
+            for result, distance in zip(results, np.sqrt(distances[:limit]).tolist()):
+                result["distance"] = distance
+
+        return {"total": total, "results": results}
+
+    def describe(self, row):
+        coordinates = tuple(int(self.columns[axis][row]) for axis in "xyz")
+        system_index = int(self.columns["system_index"][row])
+        planet_index = int(self.columns["planet_index"][row])
+
+        galaxy_seed = self.seed_deriver.galaxy_seed(*coordinates)
+        system_seed = self.seed_deriver.system_seed(galaxy_seed, system_index)
+        planet_name = generate_name(
+            self.seed_deriver.planet_seed(system_seed, planet_index), "planet"
+        )
+
+        result = {
+            "coordinates": list(coordinates),
+            "system_index": system_index,
+            "planet_index": planet_index,
+            "planet": planet_name,
+            "url": generate_planet_url(
+                coordinates, system_index, planet_name, system_index // 50 + 1
+            ),
+        }
+        for attribute in INDEX_ENUMS:
+            result[attribute] = self.enums[attribute][int(self.columns[attribute][row])]
+        return result
+
+
+def parse_near(text):
+    near = tuple(int(value) for value in text.split(","))
+    if len(near) != 3:
+        raise ValueError("--near needs x,y,z coordinates.")
+    return near
+
+
+def non_negative_int(text):
+    value = int(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"{text} is negative")
+    return value
+
+
+def index_main(universe, argv):
+    parser = argparse.ArgumentParser(prog="atlas --index")
+    parser.add_argument("--index", action="store_true")
+    parser.add_argument("--path", default=SEARCH_INDEX_PATH)
+    parser.add_argument(
+        "--build",
+        action="store_true",
+        help="enumerate --region and --systems and write the index",
+    )
+    parser.add_argument("--region", default="0,0,0:10")
+    parser.add_argument(
+        "--systems",
+        default="0:1000",
+        help="system indices to index in every galaxy, as start:stop",
+    )
+    parser.add_argument(
+        "--search",
+        help="query the index, e.g. 'type=Crystalline and life=Robotic Entities'",
+    )
+    parser.add_argument("--near", help="sort by distance to x,y,z")
+    parser.add_argument("--limit", type=non_negative_int, default=20)
+    args, _ = parser.parse_known_args(argv)
+
+    try:
+        if args.build:
+            build_index(universe, args.region, args.systems, args.path)
+
+        if args.search:
+            started = time.perf_counter()
+            found = SearchIndex(args.path).search(
+                args.search, parse_near(args.near) if args.near else None, args.limit
+            )
+            elapsed = (time.perf_counter() - started) * 1000
+            for result in found["results"]:
+                print(json.dumps(result))
+            print(
+                f"[index] {found['total']} matches in {elapsed:.1f} ms",
+                file=sys.stderr,
+            )
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
@@ -1,22 +1,175 @@
 # pymodules/__atlas_seedmaster.py
 
 import base64
+import random
+import struct
 import hashlib
+import functools
 
 from pymodules.__atlas_config import config
 
 
-def seedmaster(iterations):
-    result = str(config.seed).encode("utf-8")
+def seedmaster(iterations, seed=None):
+    if seed is None:
+        seed = config.seed
+
+    result = str(seed).encode("utf-8")
 
     for _ in range(iterations):
         result = base64.b64encode(result)
 
     if iterations == 0:
-        return config.seed
+        return seed
     else:
         return result.decode("utf-8")
 
 
 def consistent_hash(input_string):
     return int(hashlib.md5(input_string.encode()).hexdigest(), 16)
+
+
+class SeedDeriver:
+    def __init__(self, seed):
+        self.seed = seed
+
+        self.galaxy_salt = seedmaster(12, seed)
+        self.system_salt = seedmaster(8, seed)
+        self.planet_salt = seedmaster(4, seed)
+        self.star_salt = seedmaster(2, seed)
+
+        self.galaxy_state = hashlib.sha256(f"{seed}-{self.galaxy_salt}-".encode())
+        self.salted_state = functools.lru_cache(maxsize=4096)(self.build_salted_state)
+
+    def build_salted_state(self, parent_seed, salt):
+        return hashlib.sha256(f"{parent_seed}-{salt}-".encode())
+
+    def derive(self, state, suffix):
+        state = state.copy()
+        state.update(suffix.encode())
+        return int.from_bytes(state.digest(), "big")
+
+    def galaxy_seed(self, x, y, z):
+        return self.derive(self.galaxy_state, f"{x}-{y}-{z}")
+
+    def galaxy_seeds(self, coordinates):
+        derive = self.derive
+        galaxy_state = self.galaxy_state
+        return [derive(galaxy_state, f"{x}-{y}-{z}") for x, y, z in coordinates]
+
+    def system_seed(self, galaxy_seed, index):
+        return self.derive(self.salted_state(galaxy_seed, self.system_salt), f"{index}")
+
+    def planet_seed(self, system_seed, index):
+        return self.derive(self.salted_state(system_seed, self.planet_salt), f"{index}")
+
+    def star_seed(self, system_seed, index):
+        return self.derive(self.salted_state(system_seed, self.star_salt), f"{index}")
+
+    def planet_attribute_seed(self, planet_seed, planet_name):
+        return int.from_bytes(
+            hashlib.sha256(
+                f"{planet_seed}-{planet_name}-{self.planet_salt}".encode()
+            ).digest(),
+            "big",
+        )
+
+    def planet_rng(self, attribute_seed):
+        return random.Random(attribute_seed)
+
+    def attribute_rng(self, rng, attribute_seed, attribute):
+        return rng
+
+
+SEED_PAIR = struct.Struct("<2Q")
+SEED_TRIPLE = struct.Struct("<3Q")
+STREAM_WORDS = struct.Struct("<8Q")
+
+
+class KeyedStream:
+    __slots__ = ("state", "block", "words")
+
+    def __init__(self, state):
+        self.state = state
+        self.block = 0
+        self.words = []
+
+    def next64(self):
+        if not self.words:
+            state = self.state.copy()
+            state.update(self.block.to_bytes(8, "little"))
+            self.block += 1
+            self.words = list(STREAM_WORDS.unpack(state.digest()))
+        return self.words.pop()
+
+    def randbelow(self, n):
+        return (self.next64() * n) >> 64
+
+    def random(self):
+        return (self.next64() >> 11) * 2**-53
+
+    def uniform(self, a, b):
+        return a + (b - a) * self.random()
+
+    def randint(self, a, b):
+        return a + self.randbelow(b - a + 1)
+
+    def choice(self, seq):
+        return seq[self.randbelow(len(seq))]
+
+    def sample(self, population, k):
+        pool = list(population)
+        for i in range(k):
+            j = i + self.randbelow(len(pool) - i)
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+
+
+class KeyedSeedDeriver:
+    def __init__(self, seed):
+        self.seed = seed
+
+        key = hashlib.blake2b(str(seed).encode(), digest_size=32).digest()
+        self.seed_state = hashlib.blake2b(key=key, digest_size=8)
+        self.stream_state = hashlib.blake2b(key=key, digest_size=64)
+
+    def derive(self, data):
+        state = self.seed_state.copy()
+        state.update(data)
+        return int.from_bytes(state.digest(), "little")
+
+    def galaxy_seed(self, x, y, z):
+        return self.derive(b"galaxy:" + SEED_TRIPLE.pack(x, y, z))
+
+    def galaxy_seeds(self, coordinates):
+        derive = self.derive
+        pack = SEED_TRIPLE.pack
+        return [derive(b"galaxy:" + pack(x, y, z)) for x, y, z in coordinates]
+
+    def system_seed(self, galaxy_seed, index):
+        return self.derive(b"system:" + SEED_PAIR.pack(galaxy_seed, index))
+
+    def planet_seed(self, system_seed, index):
+        return self.derive(b"planet:" + SEED_PAIR.pack(system_seed, index))
+
+    def star_seed(self, system_seed, index):
+        return self.derive(b"star:" + SEED_PAIR.pack(system_seed, index))
+
+    def planet_attribute_seed(self, planet_seed, planet_name):
+        return self.derive(b"attributes:" + planet_seed.to_bytes(8, "little"))
+
+    def planet_rng(self, attribute_seed):
+        return None
+
+    def attribute_rng(self, rng, attribute_seed, attribute):
+        state = self.stream_state.copy()
+        state.update(attribute_seed.to_bytes(8, "little") + attribute.encode())
+        return KeyedStream(state)
+
+
+def create_seed_deriver(seed, universe_format=1):
+    if universe_format == 1:
+        return SeedDeriver(seed)
+    elif universe_format == 2:
+        return KeyedSeedDeriver(seed)
+    else:
+        raise ValueError(f"Unknown universe format: {universe_format}")
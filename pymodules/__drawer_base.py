@@ -14,7 +14,7 @@ from pymodules.__drawer_class_system import generate_solar_system_image
 from pymodules.__drawer_class_galaxy import generate_galaxy_image
 
 
-async def handle_image_generation(objs):
+async def handle_image_generation(objs, clock=None):
     loop = asyncio.get_event_loop()
     results = []
 
@@ -26,15 +26,17 @@ async def handle_image_generation(objs):
         for obj in objs:
             if isinstance(obj, Planet):
                 futures.append(
-                    loop.run_in_executor(executor, generate_planet_image, obj)
+                    loop.run_in_executor(executor, generate_planet_image, obj, clock)
                 )
             elif isinstance(obj, SolarSystem):
                 futures.append(
-                    loop.run_in_executor(executor, generate_solar_system_image, obj)
+                    loop.run_in_executor(
+                        executor, generate_solar_system_image, obj, clock
+                    )
                 )
             elif isinstance(obj, Galaxy):
                 futures.append(
-                    loop.run_in_executor(executor, generate_galaxy_image, obj)
+                    loop.run_in_executor(executor, generate_galaxy_image, obj, clock)
                 )
             else:
                 raise ValueError("Unknown object type for image generation, wyd bro?")
@@ -5,10 +5,12 @@ import random
 
 from PIL import Image, ImageDraw, ImageFilter
 
+from pymodules.__universe_clock import CosmicClock
+
 from pymodules.__drawer_watermark import generate_watermark
 
 
-def generate_galaxy_image(galaxy):
+def generate_galaxy_image(galaxy, clock=None):
     img_size = 800
     image = Image.new("RGBA", (img_size, img_size), "black")
     draw = ImageDraw.Draw(image)
@@ -16,6 +18,10 @@ def generate_galaxy_image(galaxy):
     center_x = img_size // 2
     center_y = img_size // 2
 
+    num_systems = galaxy.num_systems_at(
+        clock or CosmicClock(origin_time=galaxy.cosmic_origin_time)
+    )
+
     rng = random.Random(galaxy.seed)
 
     rotation_angle = rng.uniform(0, 2 * math.pi)
@@ -28,8 +34,8 @@ def generate_galaxy_image(galaxy):
         arm_tightness = 0.5
         core_density = 0.1
 
-        if galaxy.num_systems < 50000:
-            num_points = galaxy.num_systems
+        if num_systems < 50000:
+            num_points = num_systems
         else:
             num_points = 50000
 
@@ -69,8 +75,8 @@ def generate_galaxy_image(galaxy):
 
     elif galaxy.galaxy_type == "Elliptical":
 
-        if galaxy.num_systems < 100000:
-            num_points = galaxy.num_systems
+        if num_systems < 100000:
+            num_points = num_systems
         else:
             num_points = 100000
 
@@ -102,7 +108,7 @@ def generate_galaxy_image(galaxy):
         max_radius = img_size // 3
         spread = 0.3
 
-        for i in range(galaxy.num_systems // 100):
+        for i in range(num_systems // 100):
             angle = rng.uniform(0, 2 * math.pi)
             radius = rng.gauss(max_radius / 2, spread * max_radius)
             x = center_x + radius * math.cos(angle)
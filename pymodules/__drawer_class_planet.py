@@ -1,14 +1,27 @@
 # pymodules/__drawer_class_planet.py
 
+import os
 import math
+import json
 import random
-import time
+import threading
+
+from types import MappingProxyType
 
 from PIL import Image, ImageDraw, ImageFilter, ImageFont
+from PIL.PngImagePlugin import PngInfo
 
+from pymodules.__atlas_cache import get_cached_surface_path
 from pymodules.__atlas_config import config
+from pymodules.__atlas_memory_cache import LRUCache
 from pymodules.__atlas_seedmaster import consistent_hash
-from pymodules.__atlas_fixed_vars import VISUAL_DEBUG
+from pymodules.__atlas_fixed_vars import (
+    VISUAL_DEBUG,
+    SURFACE_CACHE_SIZE,
+    HALO_CACHE_SIZE,
+)
+
+from pymodules.__universe_clock import CosmicClock
 
 from pymodules.__drawer_watermark import generate_watermark
 from pymodules.__drawer_cplanet_depth import (
@@ -16,6 +29,8 @@ from pymodules.__drawer_cplanet_depth import (
     depth_gradient,
     soft_polar_transform,
 )
+from pymodules.__drawer_cplanet_sphere import surface_to_texture, render_sphere
+from pymodules.__drawer_cplanet_inside import effect_box, effect_layer
 from pymodules.__drawer_cplanet_rings import draw_full_ring, draw_ontop_ring
 from pymodules.__drawer_cplanet_type import (
     get_planet_color_map,
@@ -57,55 +72,8 @@ from pymodules.__drawer_cplanet_life import (
 )
 
 
-def generate_planet_image(planet):
-    spaced_planet_name = planet.name.replace("_", " ")
-    planet_type = planet.planet_type.replace("_", " ")
-
-    img_size = 800
-    image = Image.new("RGBA", (img_size, img_size), "black")
-
-    planet_surface = Image.new("RGBA", (img_size, img_size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(planet_surface)
-
-    center_x = img_size // 2
-    center_y = img_size // 2
-
-    current_time = time.time()
-    time_elapsed_seconds = current_time - config.cosmic_origin_time
-
-    angle_velocity_rotation = 2 * math.pi / planet.rotation_period_seconds
-    angle_rotation = (
-        planet.initial_angle_rotation + time_elapsed_seconds * angle_velocity_rotation
-    ) % (2 * math.pi)
-
-    angle_velocity_orbit = 2 * math.pi / planet.orbital_period_seconds
-    orbital_angle = (
-        planet.initial_orbital_angle + time_elapsed_seconds * angle_velocity_orbit
-    ) % (2 * math.pi)
-
-    tilt_factor = math.sin(math.radians(planet.axial_tilt))
-    shape_seed = consistent_hash(
-        f"{config.seed}-{spaced_planet_name}-{planet_type}-{planet.diameter}-{planet.density}-{planet.gravity}-_safe_shaper"
-    )
-    planet_radius = int(200 * (planet.diameter / max(planet.diameter, 1)))
-
-    rng = random.Random(shape_seed)
-
-    planet_color_map = get_planet_color_map()
-    base_color = planet_color_map.get(planet.planet_type, "white")
-
-    rndback = generate_rndback(planet_radius, base_color, seed=shape_seed)
-
-    try:
-        font = ImageFont.truetype("arial.ttf", 14)
-    except IOError:
-        font = ImageFont.load_default()
-
-    planet_surface.paste(
-        rndback, (center_x - planet_radius, center_y - planet_radius), rndback
-    )
-
-    draw_functions = {
+PLANET_DRAW_FUNCTIONS = MappingProxyType(
+    {
         "Gas Giant": draw_gas_giant_elements,
         "Anomaly": draw_anomaly_elements,
         "Rocky": draw_rocky_elements,
@@ -134,12 +102,61 @@ def generate_planet_image(planet):
         "Aquifer": draw_aquifer_elements,
         "Exotic": draw_exotic_elements,
     }
+)
+
+PLANET_ATMOSPHERES = MappingProxyType(
+    {
+        "Breathable": ((144, 238, 144, 150), 13),  # lightgreen con opacidad
+        "Thick": ((169, 169, 169, 200), 17),  # gray con opacidad
+        "Thin": ((211, 211, 211, 100), 11),  # lightgray con opacidad
+        "Carbon Dioxide": ((165, 42, 42, 150), 15),  # brown con opacidad
+        "Methane": ((0, 0, 139, 150), 15),  # darkblue con opacidad
+        "Nitrogen": ((0, 0, 255, 150), 15),  # blue con opacidad
+        "Oxygen-Rich": ((255, 255, 255, 150), 15),  # white con opacidad
+        "Sulfur Dioxide": ((255, 255, 0, 150), 15),  # yellow con opacidad
+        "Superheated": ((255, 0, 0, 200), 18),  # red con opacidad
+        "Acidic": ((0, 100, 0, 150), 15),  # darkgreen con opacidad
+        "Toxic": ((128, 0, 128, 150), 15),  # purple con opacidad
+        "Hydrogen": ((255, 182, 193, 150), 15),  # lightpink con opacidad
+        "Helium": ((255, 255, 224, 150), 15),  # lightyellow con opacidad
+        "Ammonia": ((240, 230, 140, 150), 15),  # khaki con opacidad
+        "Ionic": ((0, 191, 255, 150), 18),  # deepskyblue con opacidad
+        "Plasma": ((255, 105, 180, 200), 18),  # hotpink con opacidad
+        "Exotic Gases": ((186, 85, 211, 150), 18),  # mediumorchid con opacidad
+        "Water Vapor": ((173, 216, 230, 150), 15),  # lightblue con opacidad
+        "Frozen": ((240, 248, 255, 150), 15),  # aliceblue con opacidad
+    }
+)
+DEFAULT_ATMOSPHERE = ((169, 169, 169, 150), 15)  # gray con opacidad por defecto
+
+planet_surfaces = LRUCache(SURFACE_CACHE_SIZE)
+planet_textures = LRUCache(SURFACE_CACHE_SIZE)
+atmosphere_halos = LRUCache(HALO_CACHE_SIZE)
+
+
+def draw_planet_surface(
+    planet_type, spaced_planet_name, planet_radius, shape_seed, img_size
+):
+    center_x = img_size // 2
+    center_y = img_size // 2
+    rng = random.Random(shape_seed)
+
+    planet_surface = Image.new("RGBA", (img_size, img_size), (0, 0, 0, 0))
+
+    planet_color_map = get_planet_color_map()
+    base_color = planet_color_map.get(planet_type, "white")
+
+    rndback = generate_rndback(planet_radius, base_color, seed=shape_seed)
+
+    planet_surface.paste(
+        rndback, (center_x - planet_radius, center_y - planet_radius), rndback
+    )
 
     surface_layer = Image.new("RGBA", (img_size, img_size), (0, 0, 0, 0))
     surface_draw = ImageDraw.Draw(surface_layer)
 
-    if planet_type in draw_functions:
-        draw_functions[planet_type](
+    if planet_type in PLANET_DRAW_FUNCTIONS:
+        PLANET_DRAW_FUNCTIONS[planet_type](
             surface_draw,
             center_x,
             center_y,
@@ -152,16 +169,163 @@ def generate_planet_image(planet):
         raise ValueError(f"Unknown planet type: {planet_type}")
 
     planet_surface = Image.alpha_composite(planet_surface, surface_layer)
+    return planet_surface, rng.getstate()
+
+
+def read_cached_surface(cache_filepath):
+    try:
+        with Image.open(cache_filepath) as cached_image:
+            cached_image.load()
+            state = json.loads(cached_image.text["rng_state"])
+            cached = (
+                cached_image.convert("RGBA"),
+                (state[0], tuple(state[1]), state[2]),
+            )
+            os.utime(cache_filepath)
+    except FileNotFoundError:
+        return None
+    return cached
+
+
+def get_planet_surface(
+    planet_type, spaced_planet_name, planet_radius, shape_seed, img_size
+):
+    key = (shape_seed, planet_radius, img_size)
+    cached = planet_surfaces.get(key)
+    if cached is None:
+        cached = load_planet_surface(
+            planet_type, spaced_planet_name, planet_radius, shape_seed, img_size
+        )
+        planet_surfaces[key] = cached
+    return cached
+
+
+def load_planet_surface(
+    planet_type, spaced_planet_name, planet_radius, shape_seed, img_size
+):
+    cached = None
+    cache_filepath = get_cached_surface_path(shape_seed, planet_radius, img_size)
+    if config.enable_cache:
+        cached = read_cached_surface(cache_filepath)
+    if cached is None:
+        cached = draw_planet_surface(
+            planet_type, spaced_planet_name, planet_radius, shape_seed, img_size
+        )
+        if config.enable_cache:
+            metadata = PngInfo()
+            metadata.add_text("rng_state", json.dumps(cached[1]))
+            temporary_filepath = f"{cache_filepath}.{threading.get_ident()}.tmp"
+            cached[0].save(
+                temporary_filepath, "PNG", pnginfo=metadata, compress_level=1
+            )
+            os.replace(temporary_filepath, cache_filepath)
+
+    return cached
+
+
+def get_planet_texture(
+    planet_type, spaced_planet_name, planet_surface, planet_radius, shape_seed, img_size
+):
+    key = (shape_seed, planet_radius, img_size)
+    texture = planet_textures.get(key)
+    if texture is None:
+        far_surface, _ = load_planet_surface(
+            planet_type,
+            f"{spaced_planet_name} far side",
+            planet_radius,
+            consistent_hash(f"{shape_seed}-_far_side"),
+            img_size,
+        )
+        texture = surface_to_texture(planet_surface, far_surface, planet_radius)
+        planet_textures[key] = texture
+    return texture
+
+
+def get_atmosphere_halo(atmosphere_type, planet_radius, img_size):
+    key = (atmosphere_type, planet_radius, img_size)
+    cached = atmosphere_halos.get(key)
+    if cached is not None:
+        return cached
+
+    atmosphere_color, atmosphere_width = PLANET_ATMOSPHERES.get(
+        atmosphere_type, DEFAULT_ATMOSPHERE
+    )
+    center = img_size // 2
+    reach = planet_radius + atmosphere_width + 5
+    box = effect_box(
+        (img_size, img_size),
+        (center - reach, center - reach, center + reach, center + reach),
+        blur_radius=5,
+    )
+    halo, halo_draw = effect_layer(box)
+    halo_draw.ellipse(
+        (
+            center - reach - box[0],
+            center - reach - box[1],
+            center + reach - box[0],
+            center + reach - box[1],
+        ),
+        outline=atmosphere_color,
+        width=atmosphere_width,
+    )
+
+    cached = (box[:2], halo.filter(ImageFilter.GaussianBlur(radius=5)))
+    atmosphere_halos[key] = cached
+    return cached
+
+
+def generate_planet_image(planet, clock=None):
+    spaced_planet_name = planet.name.replace("_", " ")
+    planet_type = planet.planet_type.replace("_", " ")
+
+    img_size = 800
+    image = Image.new("RGBA", (img_size, img_size), "black")
+
+    center_x = img_size // 2
+    center_y = img_size // 2
+
+    clock = clock or CosmicClock()
+    angle_rotation = planet.rotation_angle_at(clock)
+    orbital_angle = planet.orbital_angle_at(clock)
+
+    tilt_factor = math.sin(math.radians(planet.axial_tilt))
+    shape_seed = consistent_hash(
+        f"{config.seed}-{spaced_planet_name}-{planet_type}-{planet.diameter}-{planet.density}-{planet.gravity}-_safe_shaper"
+    )
+    planet_radius = int(200 * (planet.diameter / max(planet.diameter, 1)))
+
+    try:
+        font = ImageFont.truetype("arial.ttf", 14)
+    except IOError:
+        font = ImageFont.load_default()
 
-    planet_surface_rotated = planet_surface.rotate(
-        -math.degrees(angle_rotation),
-        resample=Image.BICUBIC,
-        center=(center_x, center_y),
+    planet_surface, rng_state = get_planet_surface(
+        planet_type, spaced_planet_name, planet_radius, shape_seed, img_size
     )
+    rng = random.Random()
+    rng.setstate(rng_state)
+
+    if config.planet_renderer == "sphere":
+        texture = get_planet_texture(
+            planet_type,
+            spaced_planet_name,
+            planet_surface,
+            planet_radius,
+            shape_seed,
+            img_size,
+        )
+        globe = render_sphere(texture, planet_radius, img_size, angle_rotation)
+        image.paste(globe, (0, 0), globe)
+    else:
+        planet_surface_rotated = planet_surface.rotate(
+            -math.degrees(angle_rotation),
+            resample=Image.BICUBIC,
+            center=(center_x, center_y),
+        )
 
-    image.paste(planet_surface_rotated, (0, 0), planet_surface_rotated)
+        image.paste(planet_surface_rotated, (0, 0), planet_surface_rotated)
 
-    image = soft_polar_transform(image, scale_factor=0.85, depth_factor=0.70)
+        image = soft_polar_transform(image, scale_factor=0.85, depth_factor=0.70)
 
     depth_gradient(image, planet_radius, img_size, orbital_angle)
 
@@ -197,90 +361,10 @@ def generate_planet_image(planet):
         )
 
     if planet.atmosphere != "None":
-        atmosphere_type = planet.atmosphere
-
-        if atmosphere_type == "Breathable":
-            atmosphere_color = (144, 238, 144, 150)  # lightgreen con opacidad
-            atmosphere_width = 13
-        elif atmosphere_type == "Thick":
-            atmosphere_color = (169, 169, 169, 200)  # gray con opacidad
-            atmosphere_width = 17
-        elif atmosphere_type == "Thin":
-            atmosphere_color = (211, 211, 211, 100)  # lightgray con opacidad
-            atmosphere_width = 11
-        elif atmosphere_type == "Carbon Dioxide":
-            atmosphere_color = (165, 42, 42, 150)  # brown con opacidad
-            atmosphere_width = 15
-        elif atmosphere_type == "Methane":
-            atmosphere_color = (0, 0, 139, 150)  # darkblue con opacidad
-            atmosphere_width = 15
-        elif atmosphere_type == "Nitrogen":
-            atmosphere_color = (0, 0, 255, 150)  # blue con opacidad
-            atmosphere_width = 15
-        elif atmosphere_type == "Oxygen-Rich":
-            atmosphere_color = (255, 255, 255, 150)  # white con opacidad
-            atmosphere_width = 15
-        elif atmosphere_type == "Sulfur Dioxide":
-            atmosphere_color = (255, 255, 0, 150)  # yellow con opacidad
-            atmosphere_width = 15
-        elif atmosphere_type == "Superheated":
-            atmosphere_color = (255, 0, 0, 200)  # red con opacidad
-            atmosphere_width = 18
-        elif atmosphere_type == "Acidic":
-            atmosphere_color = (0, 100, 0, 150)  # darkgreen con opacidad
-            atmosphere_width = 15
-        elif atmosphere_type == "Toxic":
-            atmosphere_color = (128, 0, 128, 150)  # purple con opacidad
-            atmosphere_width = 15
-        elif atmosphere_type == "Hydrogen":
-            atmosphere_color = (255, 182, 193, 150)  # lightpink con opacidad
-            atmosphere_width = 15
-        elif atmosphere_type == "Helium":
-            atmosphere_color = (255, 255, 224, 150)  # lightyellow con opacidad
-            atmosphere_width = 15
-        elif atmosphere_type == "Ammonia":
-            atmosphere_color = (240, 230, 140, 150)  # khaki con opacidad
-            atmosphere_width = 15
-        elif atmosphere_type == "Ionic":
-            atmosphere_color = (0, 191, 255, 150)  # deepskyblue con opacidad
-            atmosphere_width = 18
-        elif atmosphere_type == "Plasma":
-            atmosphere_color = (255, 105, 180, 200)  # hotpink con opacidad
-            atmosphere_width = 18
-        elif atmosphere_type == "Exotic Gases":
-            atmosphere_color = (186, 85, 211, 150)  # mediumorchid con opacidad
-            atmosphere_width = 18
-        elif atmosphere_type == "Water Vapor":
-            atmosphere_color = (173, 216, 230, 150)  # lightblue con opacidad
-            atmosphere_width = 15
-        elif atmosphere_type == "Frozen":
-            atmosphere_color = (240, 248, 255, 150)  # aliceblue con opacidad
-            atmosphere_width = 15
-        elif atmosphere_type == "None":
-            atmosphere_width = 0
-            atmosphere_color = None
-        else:
-            atmosphere_color = (169, 169, 169, 150)  # gray con opacidad por defecto
-            atmosphere_width = 15
-
-        if atmosphere_color:
-            atmosphere_img = Image.new("RGBA", (img_size, img_size), (0, 0, 0, 0))
-            atmosphere_draw = ImageDraw.Draw(atmosphere_img)
-
-            atmosphere_draw.ellipse(
-                (
-                    center_x - planet_radius - atmosphere_width - 5,
-                    center_y - planet_radius - atmosphere_width - 5,
-                    center_x + planet_radius + atmosphere_width + 5,
-                    center_y + planet_radius + atmosphere_width + 5,
-                ),
-                outline=atmosphere_color,
-                width=atmosphere_width,
-            )
-
-            atmosphere_img = atmosphere_img.filter(ImageFilter.GaussianBlur(radius=5))
-
-            image.paste(atmosphere_img, (0, 0), atmosphere_img)
+        halo_position, halo = get_atmosphere_halo(
+            planet.atmosphere, planet_radius, img_size
+        )
+        image.paste(halo, halo_position, halo)
 
     draw_life_functions = {
         "Intelligent Life": draw_intelligent_life,
@@ -1,18 +1,17 @@
 # pymodules/__drawer_class_system.py
 
 import math
-import time
 import random
 import hashlib
 
 from PIL import Image, ImageDraw, ImageFont
 
-from pymodules.__atlas_config import config
+from pymodules.__universe_clock import CosmicClock
 
 from pymodules.__drawer_watermark import generate_watermark
 
 
-def generate_solar_system_image(solar_system):
+def generate_solar_system_image(solar_system, clock=None):
 
     img_size = 800
     image = Image.new("RGB", (img_size, img_size), "black")
@@ -57,7 +56,7 @@ def generate_solar_system_image(solar_system):
     min_orbit_radius = star_radius * 2 + 50
     max_orbit_radius = img_size // 2 - 50
 
-    current_time = time.time()
+    clock = clock or CosmicClock()
 
     for i in range(1, num_planets + 1):
         planet = solar_system.get_planet(i - 1)
@@ -100,26 +99,12 @@ def generate_solar_system_image(solar_system):
                         [x_start, y_start, x_end, y_end], fill="slategray", width=1
                     )
 
-            orbital_period = planet.orbital_period_seconds
-            angle_velocity_orbit = 2 * math.pi / orbital_period
-
-            time_elapsed_seconds = current_time - config.cosmic_origin_time
-
-            angle_orbit = (
-                planet.initial_orbital_angle
-                + time_elapsed_seconds * angle_velocity_orbit
-            ) % (2 * math.pi)
+            angle_orbit = planet.orbital_angle_at(clock)
 
             planet_x = center_x + semi_major_axis * math.cos(angle_orbit)
             planet_y = center_y + semi_minor_axis * math.sin(angle_orbit)
 
-            rotation_period_seconds = planet.rotation_period_seconds
-            angle_velocity_rotation = 2 * math.pi / rotation_period_seconds
-
-            angle_rotation = (
-                planet.initial_angle_rotation
-                + time_elapsed_seconds * angle_velocity_rotation
-            ) % (2 * math.pi)
+            angle_rotation = planet.rotation_angle_at(clock)
 
             planet_color = {
                 "Gas Giant": "#FFA500",
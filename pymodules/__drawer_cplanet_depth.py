@@ -2,6 +2,9 @@
 
 import math
 import random
+import functools
+
+import numpy as np
 
 from pymodules.__atlas_fixed_vars import VISUAL_DEBUG
 
@@ -76,12 +79,13 @@ def depth_gradient(planet_img, planet_radius, img_size, sun_angle, opacity=255):
     return planet_img
 
 
-def soft_polar_transform(image, scale_factor=1.0, depth_factor=0.5):
-    width, height = image.size
+@functools.lru_cache(maxsize=8)
+def soft_polar_lookup(width, height, scale_factor, depth_factor):
     center_x, center_y = width // 2, height // 2
     radius = min(center_x, center_y)
 
-    new_image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    destination = []
+    source = []
 
     for y in range(height):
         for x in range(width):
@@ -104,6 +108,27 @@ def soft_polar_transform(image, scale_factor=1.0, depth_factor=0.5):
                 )
 
                 if 0 <= polar_x < width and 0 <= polar_y < height:
-                    new_image.putpixel((x, y), image.getpixel((polar_x, polar_y)))
+                    destination.append(y * width + x)
+                    source.append(polar_y * width + polar_x)
+
+    destination = np.array(destination, dtype=np.intp)
+    source = np.array(source, dtype=np.intp)
+    destination.flags.writeable = False
+    source.flags.writeable = False
+
+    return destination, source
+
+
+def soft_polar_transform(image, scale_factor=1.0, depth_factor=0.5):
+    width, height = image.size
+
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+
+    destination, source = soft_polar_lookup(width, height, scale_factor, depth_factor)
+
+    pixels = np.asarray(image).reshape(-1, 4)
+    remapped = np.zeros_like(pixels)
+    remapped[destination] = pixels[source]
 
-    return new_image
+    return Image.fromarray(remapped.reshape(height, width, 4), "RGBA")
@@ -11,6 +11,32 @@ def consistent_hash(input_string):
     return int(hashlib.md5(input_string.encode()).hexdigest(), 16)
 
 
+def effect_box(size, bounds, blur_radius=0):
+    width, height = size
+    padding = 3 * math.ceil(blur_radius) + 2 if blur_radius else 1
+    return (
+        max(0, math.floor(min(bounds[0], bounds[2])) - padding),
+        max(0, math.floor(min(bounds[1], bounds[3])) - padding),
+        min(width, math.ceil(max(bounds[0], bounds[2])) + padding),
+        min(height, math.ceil(max(bounds[1], bounds[3])) + padding),
+    )
+
+
+def effect_layer(box):
+    layer = Image.new(
+        "RGBA", (max(box[2] - box[0], 0), max(box[3] - box[1], 0)), (0, 0, 0, 0)
+    )
+    return layer, ImageDraw.Draw(layer)
+
+
+def composite_effect(draw, layer, box, blur_radius=0):
+    if box[2] <= box[0] or box[3] <= box[1]:
+        return
+    if blur_radius:
+        layer = layer.filter(ImageFilter.GaussianBlur(radius=blur_radius))
+    draw.bitmap(box[:2], layer, fill=None)
+
+
 def generate_noise_texture(
     draw,
     center_x,
@@ -23,11 +49,11 @@ def generate_noise_texture(
 ):
 
     size = planet_radius * 2
-    random.seed(
+    rng = random.Random(
         f"{seed}-{spaced_planet_name}-{planet_radius}-{opacity}-{blur_radius}-{center_x}-{center_y}"
     )
 
-    noise = [[random.random() for _ in range(size)] for _ in range(size)]
+    noise = [[rng.random() for _ in range(size)] for _ in range(size)]
 
     def smooth_noise(x, y):
         corners = (
@@ -82,13 +108,15 @@ def generate_clouds(draw, center_x, center_y, radius, color, global_seed, planet
         y = center_y + distance * math.sin(angle) * 5
         points.append((x, y))
 
-    temp_image = Image.new("RGBA", draw.im.size, (0, 0, 0, 0))
-    temp_draw = ImageDraw.Draw(temp_image)
-    temp_draw.polygon(points, fill=color_with_alpha)
-
-    blurred_image = temp_image.filter(ImageFilter.GaussianBlur(radius=6))
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    box = effect_box(draw.im.size, (min(xs), min(ys), max(xs), max(ys)), blur_radius=6)
+    temp_image, temp_draw = effect_layer(box)
+    temp_draw.polygon(
+        [(x - box[0], y - box[1]) for x, y in points], fill=color_with_alpha
+    )
 
-    draw.bitmap((0, 0), blurred_image, fill=None)
+    composite_effect(draw, temp_image, box, blur_radius=6)
 
 
 def generate_cloud_bands(
@@ -290,17 +318,25 @@ def draw_arcs(
     arc_width_range=(2, 5),
 ):
     num_arcs = rng.randint(*num_arcs_range)
-    temp_image = Image.new("RGBA", draw.im.size, (0, 0, 0, 0))
-    temp_draw = ImageDraw.Draw(temp_image)
+    arcs = []
 
     for i in range(num_arcs):
         arc_radius = rng.randint(*radius_range)
         arc_width = rng.randint(*arc_width_range)
         arc_start_angle = rng.uniform(0, 2 * math.pi)
         arc_end_angle = arc_start_angle + rng.uniform(math.pi / 4, math.pi / 2)
-        arc_x = center_x
-        arc_y = center_y
+        arcs.append((arc_radius, arc_width, arc_start_angle, arc_end_angle))
 
+    reach = max(arc[0] for arc in arcs)
+    box = effect_box(
+        draw.im.size,
+        (center_x - reach, center_y - reach, center_x + reach, center_y + reach),
+    )
+    temp_image, temp_draw = effect_layer(box)
+    arc_x = center_x - box[0]
+    arc_y = center_y - box[1]
+
+    for arc_radius, arc_width, arc_start_angle, arc_end_angle in arcs:
         temp_draw.arc(
             [
                 (arc_x - arc_radius, arc_y - arc_radius),
@@ -312,7 +348,7 @@ def draw_arcs(
             width=arc_width,
         )
 
-    draw.bitmap((0, 0), temp_image, fill=None)
+    composite_effect(draw, temp_image, box)
 
 
 def draw_depths(
@@ -385,21 +421,27 @@ def draw_vents_with_smoke(
             plume_x = vent_x + rng.randint(-vent_radius, vent_radius)
             plume_y = vent_y - vent_radius - rng.randint(10, 20)
 
-            smoke_image = Image.new("RGBA", draw.im.size, (0, 0, 0, 0))
-            smoke_draw = ImageDraw.Draw(smoke_image)
+            plume_bounds = (
+                plume_x - plume_width,
+                plume_y - plume_height,
+                plume_x + plume_width,
+                plume_y + plume_height,
+            )
+            box = effect_box(draw.im.size, plume_bounds)
+            smoke_image, smoke_draw = effect_layer(box)
 
             smoke_draw.ellipse(
                 (
-                    plume_x - plume_width,
-                    plume_y - plume_height,
-                    plume_x + plume_width,
-                    plume_y + plume_height,
+                    plume_bounds[0] - box[0],
+                    plume_bounds[1] - box[1],
+                    plume_bounds[2] - box[0],
+                    plume_bounds[3] - box[1],
                 ),
                 fill=(105, 105, 105, smoke_opacity),
                 outline=None,
             )
 
-            draw.bitmap((0, 0), smoke_image, fill=None)
+            composite_effect(draw, smoke_image, box)
 
 
 def draw_flows(
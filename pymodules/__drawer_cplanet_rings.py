@@ -1,107 +1,191 @@
 # pymodules/__drawer_cplanet_rings.py
 
 import math
+import bisect
+import functools
+import itertools
+
+import numpy as np
 
 from PIL import Image, ImageDraw
 
 
-def draw_full_ring(
-    image,
-    center_x,
-    center_y,
-    planet_radius,
-    ring_inner_radius,
-    ring_outer_radius,
-    rng,
-    tilt_factor=0.3,
-    rotation_angle=0.0,
-):
-    img_size = image.size[0]
-    ring_layer = Image.new("RGBA", (img_size, img_size), (0, 0, 0, 0))
-    ring_draw = ImageDraw.Draw(ring_layer)
+RING_POINT_SIZES = (0.5, 1.0, 1.5, 2.0)
+RING_POINT_WEIGHTS = tuple(itertools.accumulate((0.4, 0.3, 0.2, 0.1)))
 
-    num_points = rng.randint(500, 1500)
 
-    for _ in range(num_points):
-        angle = rng.uniform(math.pi, 2 * math.pi)
-        distance = rng.uniform(ring_inner_radius, ring_outer_radius)
+@functools.lru_cache(maxsize=None)
+def ring_point_stamps():
+    stamps = []
+    for point_size in RING_POINT_SIZES:
+        stamp = Image.new("L", (9, 9), 0)
+        ImageDraw.Draw(stamp).ellipse(
+            [(4 - point_size, 4 - point_size), (4 + point_size, 4 + point_size)],
+            fill=255,
+        )
+        stamps.append(np.nonzero(np.asarray(stamp)))
 
-        x = int(center_x + distance * math.cos(angle))
-        y = int(center_y + distance * tilt_factor * math.sin(angle))
+    width = max(len(stamp_y) for stamp_y, _ in stamps)
+    offsets_x = np.zeros((len(stamps), width), dtype=np.int64)
+    offsets_y = np.zeros((len(stamps), width), dtype=np.int64)
+    filled = np.zeros((len(stamps), width), dtype=bool)
+    for i, (stamp_y, stamp_x) in enumerate(stamps):
+        offsets_x[i, : len(stamp_x)] = stamp_x - 4
+        offsets_y[i, : len(stamp_y)] = stamp_y - 4
+        filled[i, : len(stamp_x)] = True
 
-        point_size = rng.choices(
-            [0.5, 1.0, 1.5, 2.0], weights=[0.4, 0.3, 0.2, 0.1], k=1
-        )[0]
-        opacity = 255
-        gray_value = rng.randint(20, 50)
-        color = (gray_value, gray_value, gray_value, opacity)
+    return offsets_x, offsets_y, filled
 
-        ring_draw.ellipse(
-            [(x - point_size, y - point_size), (x + point_size, y + point_size)],
-            fill=color,
-        )
 
-    ring_mask = Image.new("L", (img_size, img_size), 255)
-    mask_draw = ImageDraw.Draw(ring_mask)
-    mask_draw.ellipse(
+@functools.lru_cache(maxsize=8)
+def planet_disc(center_x, center_y, planet_radius, img_size):
+    disc = Image.new("L", (img_size, img_size), 0)
+    ImageDraw.Draw(disc).ellipse(
         [
             int(center_x - planet_radius),
             int(center_y - planet_radius),
             int(center_x + planet_radius),
             int(center_y + planet_radius),
         ],
-        fill=0,
-    )
-    ring_layer.putalpha(ring_mask)
-
-    rotated_ring_layer = ring_layer.rotate(
-        -math.degrees(rotation_angle),
-        resample=Image.BICUBIC,
-        center=(center_x, center_y),
+        fill=255,
     )
-
-    image.paste(rotated_ring_layer, (0, 0), rotated_ring_layer)
+    return np.asarray(disc) > 0
 
 
-def draw_ontop_ring(
-    image,
+def generate_ring_particles(
+    rng,
     center_x,
     center_y,
     ring_inner_radius,
     ring_outer_radius,
-    rng,
-    tilt_factor=0.3,
-    rotation_angle=0.0,
+    tilt_factor,
+    start_angle,
+    end_angle,
 ):
-    img_size = image.size[0]
-    topring_layer = Image.new("RGBA", (img_size, img_size), (0, 0, 0, 0))
-    topring_draw = ImageDraw.Draw(topring_layer)
-
     num_points = rng.randint(500, 1500)
+    total_weight = RING_POINT_WEIGHTS[-1] + 0.0
+    particles = np.empty((num_points, 4), dtype=np.int64)
 
-    for _ in range(num_points):
-        angle = rng.uniform(0, math.pi)
+    for i in range(num_points):
+        angle = rng.uniform(start_angle, end_angle)
         distance = rng.uniform(ring_inner_radius, ring_outer_radius)
 
         x = int(center_x + distance * math.cos(angle))
         y = int(center_y + distance * tilt_factor * math.sin(angle))
 
-        point_size = rng.choices(
-            [0.5, 1.0, 1.5, 2.0], weights=[0.4, 0.3, 0.2, 0.1], k=1
-        )[0]
-        opacity = 255
+        size_index = bisect.bisect(
+            RING_POINT_WEIGHTS,
+            rng.random() * total_weight,
+            0,
+            len(RING_POINT_WEIGHTS) - 1,
+        )
         gray_value = rng.randint(20, 50)
-        color = (gray_value, gray_value, gray_value, opacity)
+        particles[i] = (x, y, size_index, gray_value)
 
-        topring_draw.ellipse(
-            [(x - point_size, y - point_size), (x + point_size, y + point_size)],
-            fill=color,
-        )
+    return particles
 
-    rotated_topring_layer = topring_layer.rotate(
-        -math.degrees(rotation_angle),
-        resample=Image.BICUBIC,
-        center=(center_x, center_y),
+
+def splat_ring(image, particles, center_x, center_y, rotation_angle, hidden_radius=0):
+    img_size = image.size[0]
+
+    offset_x = particles[:, 0] - center_x
+    offset_y = particles[:, 1] - center_y
+    cos_angle = math.cos(rotation_angle)
+    sin_angle = math.sin(rotation_angle)
+    xs = np.rint(center_x + offset_x * cos_angle - offset_y * sin_angle)
+    ys = np.rint(center_y + offset_x * sin_angle + offset_y * cos_angle)
+
+    offsets_x, offsets_y, filled = ring_point_stamps()
+    sizes = particles[:, 2]
+    pixels_x = (xs[:, None] + offsets_x[sizes]).astype(np.int64)
+    pixels_y = (ys[:, None] + offsets_y[sizes]).astype(np.int64)
+    shades = np.broadcast_to(particles[:, 3, None], pixels_x.shape).astype(np.uint8)
+
+    stamped = filled[sizes]
+    pixels_x = pixels_x[stamped]
+    pixels_y = pixels_y[stamped]
+    shades = shades[stamped]
+
+    visible = (
+        (pixels_x >= 0)
+        & (pixels_x < img_size)
+        & (pixels_y >= 0)
+        & (pixels_y < img_size)
+    )
+    pixels_x = pixels_x[visible]
+    pixels_y = pixels_y[visible]
+    shades = shades[visible]
+
+    if hidden_radius:
+        disc = planet_disc(center_x, center_y, hidden_radius, img_size)
+        visible = ~disc[pixels_y, pixels_x]
+        pixels_x = pixels_x[visible]
+        pixels_y = pixels_y[visible]
+        shades = shades[visible]
+
+    if not len(pixels_x):
+        return
+
+    left, top = pixels_x.min(), pixels_y.min()
+    band = np.zeros(
+        (pixels_y.max() - top + 1, pixels_x.max() - left + 1, 4), dtype=np.uint8
+    )
+    band[pixels_y - top, pixels_x - left, :3] = shades[:, None]
+    band[pixels_y - top, pixels_x - left, 3] = 255
+
+    band_image = Image.fromarray(band, "RGBA")
+    image.paste(band_image, (int(left), int(top)), band_image)
+
+
+def draw_full_ring(
+    image,
+    center_x,
+    center_y,
+    planet_radius,
+    ring_inner_radius,
+    ring_outer_radius,
+    rng,
+    tilt_factor=0.3,
+    rotation_angle=0.0,
+):
+    particles = generate_ring_particles(
+        rng,
+        center_x,
+        center_y,
+        ring_inner_radius,
+        ring_outer_radius,
+        tilt_factor,
+        math.pi,
+        2 * math.pi,
+    )
+    splat_ring(
+        image,
+        particles,
+        center_x,
+        center_y,
+        rotation_angle,
+        hidden_radius=planet_radius,
     )
 
-    image.paste(rotated_topring_layer, (0, 0), rotated_topring_layer)
+
+def draw_ontop_ring(
+    image,
+    center_x,
+    center_y,
+    ring_inner_radius,
+    ring_outer_radius,
+    rng,
+    tilt_factor=0.3,
+    rotation_angle=0.0,
+):
+    particles = generate_ring_particles(
+        rng,
+        center_x,
+        center_y,
+        ring_inner_radius,
+        ring_outer_radius,
+        tilt_factor,
+        0,
+        math.pi,
+    )
+    splat_ring(image, particles, center_x, center_y, rotation_angle)
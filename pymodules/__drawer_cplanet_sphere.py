@@ -0,0 +1,91 @@
+# pymodules/__drawer_cplanet_sphere.py
+
+import math
+import functools
+
+import numpy as np
+
+from PIL import Image
+
+TEXTURE_WIDTH = 1024
+TEXTURE_HEIGHT = 512
+TEXTURE_BLEND = math.pi / 8
+
+
+def hemisphere_lookup(longitude, latitude, planet_radius, img_size):
+    center = img_size // 2
+    scale = planet_radius - 0.5
+    sweep = np.clip(longitude / (math.pi / 2 + TEXTURE_BLEND), -1, 1)
+
+    source_x = center + np.cos(latitude) * sweep * scale
+    source_y = center + np.sin(latitude) * scale
+    source_x = np.clip(source_x.astype(np.int64), 0, img_size - 1)
+    source_y = np.clip(source_y.astype(np.int64), 0, img_size - 1)
+
+    return (source_y * img_size + source_x).ravel()
+
+
+@functools.lru_cache(maxsize=8)
+def equirectangular_lookup(planet_radius, img_size, width, height):
+    longitude = (np.arange(width) + 0.5) / width * 2 * math.pi - math.pi
+    latitude = (np.arange(height) + 0.5) / height * math.pi - math.pi / 2
+    longitude, latitude = np.meshgrid(longitude, latitude)
+
+    far_longitude = longitude - np.copysign(math.pi, longitude)
+    near = np.clip(
+        (math.pi / 2 + TEXTURE_BLEND - np.abs(longitude)) / (2 * TEXTURE_BLEND), 0, 1
+    )
+    near = (near * near * (3 - 2 * near)).ravel()[:, None]
+
+    return (
+        hemisphere_lookup(longitude, latitude, planet_radius, img_size),
+        hemisphere_lookup(far_longitude, latitude, planet_radius, img_size),
+        near,
+    )
+
+
+def surface_to_texture(
+    surface, far_surface, planet_radius, width=TEXTURE_WIDTH, height=TEXTURE_HEIGHT
+):
+    img_size = surface.size[0]
+    near_lookup, far_lookup, near = equirectangular_lookup(
+        planet_radius, img_size, width, height
+    )
+    near_pixels = np.asarray(surface.convert("RGBA")).reshape(-1, 4)[near_lookup]
+    far_pixels = np.asarray(far_surface.convert("RGBA")).reshape(-1, 4)[far_lookup]
+
+    texture = near_pixels * near + far_pixels * (1 - near)
+    return np.rint(texture).astype(np.uint8).reshape(height, width, 4)
+
+
+@functools.lru_cache(maxsize=8)
+def orthographic_lookup(planet_radius, img_size, width, height):
+    offsets = (np.arange(img_size) - img_size // 2 + 0.5) / planet_radius
+    x, y = np.meshgrid(offsets, offsets)
+    inside = (x * x + y * y) < 1.0
+
+    destination = np.flatnonzero(inside)
+    x = x[inside]
+    y = y[inside]
+    z = np.sqrt(1.0 - x * x - y * y)
+
+    column = (np.arctan2(x, z) + math.pi) / (2 * math.pi) * width
+    row = ((np.arcsin(y) + math.pi / 2) / math.pi * height).astype(np.int64)
+    row_offset = np.clip(row, 0, height - 1) * width
+
+    return destination, column, row_offset
+
+
+def render_sphere(texture, planet_radius, img_size, rotation):
+    height, width = texture.shape[:2]
+    destination, column, row_offset = orthographic_lookup(
+        planet_radius, img_size, width, height
+    )
+
+    shift = rotation / (2 * math.pi) * width
+    columns = np.floor(column - shift).astype(np.int64) % width
+
+    frame = np.zeros((img_size * img_size, 4), dtype=np.uint8)
+    frame[destination] = texture.reshape(-1, 4)[row_offset + columns]
+
+    return Image.fromarray(frame.reshape(img_size, img_size, 4), "RGBA")
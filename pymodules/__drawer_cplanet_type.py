@@ -2,9 +2,12 @@
 
 import math
 
-from PIL import Image, ImageDraw, ImageFilter, ImageColor
+from PIL import ImageColor
 
 from pymodules.__drawer_cplanet_inside import (
+    effect_box,
+    effect_layer,
+    composite_effect,
     generate_noise_texture,
     generate_clouds,
     generate_cloud_bands,
@@ -1737,8 +1740,19 @@ def draw_diamond_elements(
         reflection_radius = rng.randint(10, 80)
         reflection_x = center_x + rng.randint(-planet_radius, planet_radius)
         reflection_y = center_y + rng.randint(-planet_radius, planet_radius)
-        temp_image = Image.new("RGBA", draw.im.size, (0, 0, 0, 0))
-        temp_draw = ImageDraw.Draw(temp_image)
+        box = effect_box(
+            draw.im.size,
+            (
+                reflection_x - reflection_radius,
+                reflection_y - reflection_radius,
+                reflection_x + reflection_radius,
+                reflection_y + reflection_radius,
+            ),
+            blur_radius=10,
+        )
+        temp_image, temp_draw = effect_layer(box)
+        reflection_x -= box[0]
+        reflection_y -= box[1]
         for r in range(reflection_radius, 0, -1):
             alpha = int(255 * (r / reflection_radius) * 0.5)
             temp_draw.ellipse(
@@ -1750,8 +1764,7 @@ def draw_diamond_elements(
                 ),
                 fill=(255, 255, 255, alpha),
             )
-        blurred_reflection = temp_image.filter(ImageFilter.GaussianBlur(radius=10))
-        draw.bitmap((0, 0), blurred_reflection, fill=None)
+        composite_effect(draw, temp_image, box, blur_radius=10)
 
     num_sparks = rng.randint(50, 75)
     for i in range(num_sparks):
@@ -1,53 +1,328 @@
 # pymodules/__universe_base.py
 
 import math
-import time
 import random
-import hashlib
+import threading
 
-from pymodules.__atlas_seedmaster import seedmaster
+import numpy as np
+
+from types import MappingProxyType
+from collections import namedtuple
+from collections.abc import Mapping
+
+from pymodules.__atlas_seedmaster import create_seed_deriver
 from pymodules.__atlas_config import config
+from pymodules.__atlas_memory_cache import LRUCache
+
+from pymodules.__universe_name_generator import generate_name, generate_names
+from pymodules.__universe_elements import sample_elements
+from pymodules.__universe_clock import CosmicClock
+from pymodules.__universe_planet_profiles import (
+    PLANET_PROFILES,
+    PLANET_TYPES,
+    DEFAULT_PROFILE,
+    ATMOSPHERE_FACTORS,
+    VARIABLE_ATMOSPHERE_FACTORS,
+)
+
+
+STAR_TYPES = {
+    star_type: MappingProxyType(
+        {"Type": star_type, "Color": color, "Radius Factor": radius_factor}
+    )
+    for star_type, color, radius_factor in (
+        ("Red Dwarf", "red", 0.5),
+        ("Yellow Dwarf", "yellow", 1.0),
+        ("Blue Giant", "blue", 2.0),
+        ("Red Giant", "orange", 3.0),
+        ("White Dwarf", "white", 0.3),
+        ("Neutron Star", "purple", 0.2),
+    )
+}
+
+GALAXY_TYPES = ("Dwarf", "Spiral", "Elliptical")
+
+GALAXY_SYSTEM_RANGES = MappingProxyType(
+    {
+        "Dwarf": (500, 10**5, 10**7),
+        "Spiral": (1500, 10**9, 5 * 10**10),
+        "Elliptical": (5000, 10**10, 10**11),
+    }
+)
+DEFAULT_SYSTEM_RANGE = (3500, 10**8, 10**9)
+
+MAX_COORDINATE = 10**7
+GALAXY_ORIGIN = 4999999
+MAX_GALAXY_DISTANCE = math.sqrt(3 * (GALAXY_ORIGIN**2))
+SINGULARITY_TIME = 59999997000000
+
+PLANET_STAGES = MappingProxyType(
+    {
+        "classification": ("planet_type", "profile"),
+        "surface": (
+            "atmosphere",
+            "diameter",
+            "volume",
+            "density",
+            "base_surface_temperature",
+            "possible_elements",
+        ),
+        "orbit": (
+            "k2_planet",
+            "Q_planet",
+            "base_rotation_seconds",
+            "k_factor",
+            "mass",
+            "gravity",
+            "orbital_radius",
+            "orbital_radius_m",
+            "orbital_period_seconds",
+            "orbital_speed",
+            "tidal_effect",
+            "moment_of_inertia",
+            "axial_tilt",
+            "eccentricity_factor",
+            "rotation_period_seconds",
+        ),
+        "composition": ("elements", "life_forms"),
+        "rings": (
+            "planet_rings",
+            "initial_angle_rotation",
+            "initial_orbital_angle",
+            "atmosphere_factor",
+        ),
+    }
+)
+PLANET_STAGE_REQUIREMENTS = MappingProxyType(
+    {
+        "classification": (),
+        "surface": ("classification",),
+        "orbit": ("surface",),
+        "composition": ("surface",),
+        "rings": ("orbit",),
+    }
+)
+PLANET_STAGE_BITS = MappingProxyType(
+    {stage: 1 << index for index, stage in enumerate(PLANET_STAGES)}
+)
+PLANET_ATTRIBUTE_STAGES = MappingProxyType(
+    {
+        attribute: stage
+        for stage, attributes in PLANET_STAGES.items()
+        for attribute in attributes
+    }
+)
+PLANET_ATTRIBUTE_ORDER = MappingProxyType(
+    {attribute: index for index, attribute in enumerate(PLANET_ATTRIBUTE_STAGES)}
+)
+PLANET_STAGE_LOCK = threading.RLock()
+
+PlanetRecord = namedtuple(
+    "PlanetRecord",
+    [
+        "coordinates",
+        "system_index",
+        "planet_index",
+        "galaxy_name",
+        "system_name",
+        "planet",
+    ],
+)
+
+
+def iter_coordinates(region, order="xyz", start=None):
+    if sorted(order) != ["x", "y", "z"]:
+        raise ValueError(
+            f"Invalid axis order {order!r}, expected a permutation of 'xyz'."
+        )
 
-from pymodules.__universe_name_generator import generate_name
-from pymodules.__universe_elements import periodic_table
+    axes = tuple(region["xyz".index(axis)] for axis in order)
+    positions = tuple(order.index(axis) for axis in "xyz")
+    start = tuple(start) if start is not None else None
+
+    for outer in axes[0]:
+        for middle in axes[1]:
+            for inner in axes[2]:
+                point = (outer, middle, inner)
+                x, y, z = (point[position] for position in positions)
+                if not (
+                    0 <= x <= MAX_COORDINATE
+                    and 0 <= y <= MAX_COORDINATE
+                    and 0 <= z <= MAX_COORDINATE
+                ):
+                    raise ValueError(
+                        f"Coordinates out of range. Must be between 0 and {MAX_COORDINATE}."
+                    )
+                if start is not None:
+                    if (x, y, z) != start:
+                        continue
+                    start = None
+                yield x, y, z
 
 
 class Universe:
-    def __init__(self, seed, constants):
+    def __init__(self, seed, constants, seed_deriver=None):
         self.seed = seed
         self.constants = constants
-        self.galaxies = {}
+        self.seed_deriver = seed_deriver or create_seed_deriver(
+            seed, config.universe_format
+        )
+        self.galaxies = LRUCache(config.galaxy_cache_size)
 
-    def get_galaxy(self, x, y, z):
-        max_coordinate = 10**7
+    def get_galaxy(self, x, y, z, clock=None):
         if not (
-            0 <= x <= max_coordinate
-            and 0 <= y <= max_coordinate
-            and 0 <= z <= max_coordinate
+            0 <= x <= MAX_COORDINATE
+            and 0 <= y <= MAX_COORDINATE
+            and 0 <= z <= MAX_COORDINATE
         ):
             raise ValueError(
-                f"Coordinates out of range. Must be between 0 and {max_coordinate}."
+                f"Coordinates out of range. Must be between 0 and {MAX_COORDINATE}."
             )
 
-        if (x, y, z) not in self.galaxies:
-            galaxy_seed = int(
-                hashlib.sha256(
-                    f"{self.seed}-{seedmaster(12)}-{x}-{y}-{z}".encode()
-                ).hexdigest(),
-                16,
+        galaxy = self.galaxies.get((x, y, z))
+        if galaxy is None:
+            galaxy = self.create_galaxy(x, y, z, clock)
+            self.galaxies[(x, y, z)] = galaxy
+        return galaxy
+
+    def create_galaxy(self, x, y, z, clock=None):
+        galaxy_seed = self.seed_deriver.galaxy_seed(x, y, z)
+        rng = random.Random()
+        galaxy_name = generate_name(galaxy_seed, "galaxy", rng)
+        galaxy_type = rng.choice(GALAXY_TYPES)
+
+        return Galaxy(
+            galaxy_seed,
+            galaxy_name,
+            self.constants,
+            galaxy_type,
+            coordinates=(x, y, z),
+            cosmic_origin_time=config.cosmic_origin_time,
+            seed_deriver=self.seed_deriver,
+            clock=clock,
+        )
+
+    def iter_planets(self, region, order="xyz", clock=None, systems=None, cursor=None):
+        start, first_system = cursor if cursor is not None else (None, 0)
+        for x, y, z in iter_coordinates(region, order, start):
+            galaxy_clock = clock or CosmicClock(origin_time=config.cosmic_origin_time)
+            galaxy = self.create_galaxy(x, y, z, galaxy_clock)
+            galaxy_name = galaxy.name
+
+            system_indices = range(galaxy.num_systems_at(galaxy_clock))
+            if systems is not None:
+                system_indices = system_indices[systems.start : systems.stop]
+            system_indices = system_indices[first_system:]
+            first_system = 0
+
+            for system_index in system_indices:
+                solar_system = galaxy.create_solar_system(system_index)
+                for planet_index in solar_system.planets:
+                    yield PlanetRecord(
+                        (x, y, z),
+                        system_index,
+                        planet_index,
+                        galaxy_name,
+                        solar_system.name,
+                        solar_system.planets[planet_index],
+                    )
+
+    def cache_stats(self):
+        galaxies = self.galaxies.values()
+        systems = {"size": 0, "hits": 0, "misses": 0, "evictions": 0}
+        for galaxy in galaxies:
+            for key, value in galaxy.solar_systems.stats().items():
+                if key in systems:
+                    systems[key] += value
+
+        return {"galaxies": self.galaxies.stats(), "systems": systems}
+
+    def query_sector(self, x_range, y_range, z_range, clock=None):
+        for axis in (x_range, y_range, z_range):
+            if len(axis) and not (0 <= min(axis) and max(axis) <= MAX_COORDINATE):
+                raise ValueError(
+                    f"Coordinates out of range. Must be between 0 and {MAX_COORDINATE}."
+                )
+
+        clock = clock or CosmicClock(origin_time=config.cosmic_origin_time)
+
+        x, y, z = (
+            axis.ravel()
+            for axis in np.meshgrid(
+                np.asarray(x_range, dtype=np.int64),
+                np.asarray(y_range, dtype=np.int64),
+                np.asarray(z_range, dtype=np.int64),
+                indexing="ij",
             )
-            galaxy_name = generate_name(galaxy_seed, "galaxy")
-            galaxy_type = random.choice(["Dwarf", "Spiral", "Elliptical"])
-
-            self.galaxies[(x, y, z)] = Galaxy(
-                galaxy_seed,
-                galaxy_name,
-                self.constants,
-                galaxy_type,
-                coordinates=(x, y, z),
-                cosmic_origin_time=config.cosmic_origin_time,
+        )
+        count = len(x)
+
+        distance_to_origin = np.sqrt(
+            (x - GALAXY_ORIGIN) ** 2
+            + (y - GALAXY_ORIGIN) ** 2
+            + (z - GALAXY_ORIGIN) ** 2
+        )
+        proximity_factor = np.maximum(0, 1 - distance_to_origin / MAX_GALAXY_DISTANCE)
+
+        names = []
+        galaxy_types = []
+        base_min_systems = np.empty(count, dtype=np.int64)
+        base_max_systems = np.empty(count, dtype=np.int64)
+        black_holes = np.empty(count, dtype=np.int64)
+        pulsars = np.empty(count, dtype=np.int64)
+        quasars = np.empty(count, dtype=np.int64)
+
+        name_rng = random.Random()
+        galaxy_rng = random.Random()
+        seeds = self.seed_deriver.galaxy_seeds(zip(x.tolist(), y.tolist(), z.tolist()))
+        for i, galaxy_seed in enumerate(seeds):
+            names.append(generate_name(galaxy_seed, "galaxy", name_rng))
+            galaxy_type = name_rng.choice(GALAXY_TYPES)
+            galaxy_types.append(galaxy_type)
+
+            base_min, low, high = GALAXY_SYSTEM_RANGES.get(
+                galaxy_type, DEFAULT_SYSTEM_RANGE
             )
-        return self.galaxies[(x, y, z)]
+            galaxy_rng.seed(galaxy_seed)
+            base_min_systems[i] = base_min
+            base_max_systems[i] = galaxy_rng.randint(low, high)
+            black_holes[i] = galaxy_rng.randint(1, 10)
+            pulsars[i] = galaxy_rng.randint(0, 50)
+            quasars[i] = galaxy_rng.randint(0, 2)
+
+        if -clock.elapsed_seconds >= SINGULARITY_TIME:
+            base_min_systems[:] = 0
+            base_max_systems[:] = 0
+
+        growth_systems = (clock.elapsed_minutes * proximity_factor * 10).astype(
+            np.int64
+        )
+        base_num_systems = (
+            base_min_systems + (base_max_systems - base_min_systems) * proximity_factor
+        ).astype(np.int64)
+        num_systems = np.maximum(
+            np.minimum(base_num_systems + growth_systems, base_max_systems), 0
+        )
+
+        galaxy_types = np.array(galaxy_types, dtype=object)
+        void = num_systems <= 0
+        galaxy_types[void] = "Singularity Void"
+        black_holes[void] = 0
+        pulsars[void] = 0
+        quasars[void] = 0
+
+        return {
+            "x": x,
+            "y": y,
+            "z": z,
+            "name": np.array(names, dtype=object),
+            "galaxy_type": galaxy_types,
+            "proximity_factor": proximity_factor,
+            "num_systems": num_systems,
+            "black_holes": black_holes,
+            "pulsars": pulsars,
+            "quasars": quasars,
+        }
 
 
 class Galaxy:
@@ -59,117 +334,192 @@ class Galaxy:
         galaxy_type="spiral",
         coordinates=(0, 0, 0),
         cosmic_origin_time=None,
+        seed_deriver=None,
+        clock=None,
     ):
         self.seed = seed
         self.name = name
         self.constants = constants
+        self.seed_deriver = seed_deriver or create_seed_deriver(
+            config.seed, config.universe_format
+        )
         self.coordinates = coordinates
         self.galaxy_type = galaxy_type
         self.cosmic_origin_time = cosmic_origin_time
-        random.seed(seed)
-
-        if self.galaxy_type == "Dwarf":
-            self.base_min_systems = 500
-            self.base_max_systems = random.randint(10**5, 10**7)
-        elif self.galaxy_type == "Spiral":
-            self.base_min_systems = 1500
-            self.base_max_systems = random.randint(10**9, 5 * 10**10)
-        elif self.galaxy_type == "Elliptical":
-            self.base_min_systems = 5000
-            self.base_max_systems = random.randint(10**10, 10**11)
-        else:
-            self.base_min_systems = 3500
-            self.base_max_systems = random.randint(10**8, 10**9)
+        clock = clock or CosmicClock(origin_time=cosmic_origin_time)
+        rng = random.Random(seed)
+
+        self.base_min_systems, low, high = GALAXY_SYSTEM_RANGES.get(
+            self.galaxy_type, DEFAULT_SYSTEM_RANGE
+        )
+        self.base_max_systems = rng.randint(low, high)
 
         self.distance_to_origin = math.sqrt(
-            (self.coordinates[0] - 4999999) ** 2
-            + (self.coordinates[1] - 4999999) ** 2
-            + (self.coordinates[2] - 4999999) ** 2
+            (self.coordinates[0] - GALAXY_ORIGIN) ** 2
+            + (self.coordinates[1] - GALAXY_ORIGIN) ** 2
+            + (self.coordinates[2] - GALAXY_ORIGIN) ** 2
         )
 
-        self.max_distance = math.sqrt(3 * (4999999**2))
+        self.max_distance = MAX_GALAXY_DISTANCE
 
         self.proximity_factor = max(
             0, 1 - (self.distance_to_origin / self.max_distance)
         )
 
-        if cosmic_origin_time - time.time() >= 59999997000000:
-            self.num_systems = 0
-            self.galaxy_type = "Singularity Void"
-            self.black_holes = 0
-            self.pulsars = 0
-            self.quasars = 0
-        else:
-            self.calculate_num_systems()
+        if -clock.elapsed_seconds >= SINGULARITY_TIME:
+            self.base_min_systems = 0
+            self.base_max_systems = 0
 
-        self.solar_systems = {}
+        self.num_systems_cache = (None, 0)
+        self.solar_systems = LRUCache(config.system_cache_size)
 
-        if self.num_systems <= 0:
+        if self.num_systems_at(clock) <= 0:
             self.galaxy_type = "Singularity Void"
             self.black_holes = 0
             self.pulsars = 0
             self.quasars = 0
         else:
-            self.black_holes = random.randint(1, 10)
-            self.pulsars = random.randint(0, 50)
-            self.quasars = random.randint(0, 2)
+            self.black_holes = rng.randint(1, 10)
+            self.pulsars = rng.randint(0, 50)
+            self.quasars = rng.randint(0, 2)
+
+    @property
+    def num_systems(self):
+        return self.num_systems_at(CosmicClock(origin_time=self.cosmic_origin_time))
 
-    def calculate_num_systems(self):
-        tiempo_transcurrido = time.time() - self.cosmic_origin_time
-        minutos_transcurridos = tiempo_transcurrido // 60
+    def num_systems_at(self, clock):
+        elapsed_minutes = clock.elapsed_minutes
+        cached_minutes, num_systems = self.num_systems_cache
+        if cached_minutes == elapsed_minutes:
+            return num_systems
 
-        growth_systems = int(minutos_transcurridos * self.proximity_factor * 10)
+        growth_systems = int(elapsed_minutes * self.proximity_factor * 10)
 
         base_num_systems = int(
             self.base_min_systems
             + (self.base_max_systems - self.base_min_systems) * self.proximity_factor
         )
 
-        self.num_systems = max(
+        num_systems = max(
             min(base_num_systems + growth_systems, self.base_max_systems), 0
         )
+        self.num_systems_cache = (elapsed_minutes, num_systems)
+        return num_systems
 
-    def get_solar_system(self, index):
-        self.calculate_num_systems()
-        if index < 0 or index >= self.num_systems:
+    def get_solar_system(self, index, clock=None):
+        num_systems = self.num_systems_at(
+            clock or CosmicClock(origin_time=self.cosmic_origin_time)
+        )
+        if index < 0 or index >= num_systems:
             raise ValueError(
-                f"Solar System index out of range. Must be between 0 and {self.num_systems - 1}."
+                f"Solar System index out of range. Must be between 0 and {num_systems - 1}."
             )
-        if index not in self.solar_systems:
-            system_seed = int(
-                hashlib.sha256(
-                    f"{self.seed}-{seedmaster(8)}-{index}".encode()
-                ).hexdigest(),
-                16,
+        solar_system = self.solar_systems.get(index)
+        if solar_system is None:
+            solar_system = self.create_solar_system(index)
+            self.solar_systems[index] = solar_system
+        return solar_system
+
+    def create_solar_system(self, index):
+        system_seed = self.seed_deriver.system_seed(self.seed, index)
+        return SolarSystem(system_seed, index, self.constants, self.seed_deriver)
+
+    def system_names(self, start, stop, clock=None):
+        num_systems = self.num_systems_at(
+            clock or CosmicClock(origin_time=self.cosmic_origin_time)
+        )
+        start = max(start, 0)
+        stop = min(stop, num_systems)
+
+        return generate_names(
+            (
+                self.seed_deriver.system_seed(self.seed, index) + index
+                for index in range(start, stop)
+            ),
+            "system",
+        )
+
+
+class LazyPlanets(Mapping):
+    __slots__ = (
+        "system_seed",
+        "num_planets",
+        "constants",
+        "seed_deriver",
+        "materialized",
+    )
+
+    def __init__(self, system_seed, num_planets, constants, seed_deriver):
+        self.system_seed = system_seed
+        self.num_planets = num_planets
+        self.constants = constants
+        self.seed_deriver = seed_deriver
+        self.materialized = {}
+
+    def planet_seed(self, index):
+        return self.seed_deriver.planet_seed(self.system_seed, index)
+
+    def planet_name(self, index):
+        return generate_name(self.planet_seed(index), "planet")
+
+    def __getitem__(self, index):
+        planet = self.materialized.get(index)
+        if planet is None:
+            if index not in self:
+                raise KeyError(index)
+
+            planet_seed = self.planet_seed(index)
+            planet_name = generate_name(planet_seed, "planet")
+            planet = self.materialized.setdefault(
+                index,
+                Planet(planet_seed, planet_name, self.constants, self.seed_deriver),
             )
-            self.solar_systems[index] = SolarSystem(system_seed, index, self.constants)
-        return self.solar_systems[index]
+        return planet
+
+    def __contains__(self, index):
+        return isinstance(index, int) and 0 <= index < self.num_planets
+
+    def __iter__(self):
+        return iter(range(self.num_planets))
+
+    def __len__(self):
+        return self.num_planets
 
 
 class SolarSystem:
-    def __init__(self, seed, index, constants):
+    __slots__ = (
+        "seed",
+        "index",
+        "constants",
+        "seed_deriver",
+        "rng",
+        "name",
+        "num_planets",
+        "planets",
+        "star_system_type",
+        "stars",
+    )
+
+    def __init__(self, seed, index, constants, seed_deriver=None):
         self.seed = seed
         self.index = index
         self.constants = constants
-        random.seed(seed)
-        self.name = generate_name(seed + index, "system")
-        self.num_planets = random.randint(1, 6)
-        self.planets = {}
+        self.seed_deriver = seed_deriver or create_seed_deriver(
+            config.seed, config.universe_format
+        )
+        self.rng = random.Random()
+        self.name = generate_name(seed + index, "system", self.rng)
+        self.num_planets = self.rng.randint(1, 6)
+        self.planets = LazyPlanets(
+            self.seed, self.num_planets, self.constants, self.seed_deriver
+        )
 
         self.star_system_type = self.determine_star_system_type()
         self.stars = self.generate_stars()
-
-        for i in range(self.num_planets):
-            planet_seed = int(
-                hashlib.sha256(f"{self.seed}-{seedmaster(4)}-{i}".encode()).hexdigest(),
-                16,
-            )
-            planet_name = generate_name(planet_seed, "planet")
-
-            self.planets[i] = Planet(planet_seed, planet_name, self.constants)
+        del self.rng
 
     def determine_star_system_type(self):
-        system_type = random.choices(
+        system_type = self.rng.choices(
             ["single", "binary", "tertiary"],
             weights=[0.7, 0.25, 0.05],
             k=1,
@@ -182,59 +532,115 @@ class SolarSystem:
             if self.star_system_type == "single"
             else 2 if self.star_system_type == "binary" else 3
         )
-        stars = []
-        for i in range(star_count):
-            star_seed = int(
-                hashlib.sha256(f"{self.seed}-{seedmaster(2)}-{i}".encode()).hexdigest(),
-                16,
-            )
-            stars.append(self.generate_star(star_seed))
-        return stars
+        return tuple(
+            self.generate_star(self.seed_deriver.star_seed(self.seed, i))
+            for i in range(star_count)
+        )
 
     def generate_star(self, seed):
-        random.seed(seed)
-
-        star_types = {
-            "Red Dwarf": {"color": "red", "radius_factor": 0.5},
-            "Yellow Dwarf": {"color": "yellow", "radius_factor": 1.0},
-            "Blue Giant": {"color": "blue", "radius_factor": 2.0},
-            "Red Giant": {"color": "orange", "radius_factor": 3.0},
-            "White Dwarf": {"color": "white", "radius_factor": 0.3},
-            "Neutron Star": {"color": "purple", "radius_factor": 0.2},
-        }
-
-        star_type = random.choice(list(star_types.keys()))
-        star_properties = star_types[star_type]
-
-        return {
-            "Type": star_type,
-            "Color": star_properties["color"],
-            "Radius Factor": star_properties["radius_factor"],
-        }
+        rng = random.Random(seed)
+        return STAR_TYPES[rng.choice(list(STAR_TYPES))]
 
     def get_planet(self, index):
         return self.planets.get(index, None)
 
+    def planet_names(self):
+        return generate_names(
+            (self.planets.planet_seed(index) for index in self.planets), "planet"
+        )
+
+    def get_planet_by_name(self, planet_name):
+        planet_name = planet_name.lower()
+        for index in self.planets:
+            if self.planets.planet_name(index).lower() == planet_name:
+                return self.planets[index]
+        return None
+
 
 class Planet:
-    def __init__(self, seed, name, constants):
+    __slots__ = (
+        "seed",
+        "name",
+        "constants",
+        "seed_deriver",
+        "attribute_seed",
+        "stage_rngs",
+        "resolved_stages",
+        *(
+            attribute
+            for attributes in PLANET_STAGES.values()
+            for attribute in attributes
+        ),
+    )
+
+    def __init__(self, seed, name, constants, seed_deriver=None):
         self.seed = seed
         self.name = name
         self.constants = constants
+        self.seed_deriver = seed_deriver or create_seed_deriver(
+            config.seed, config.universe_format
+        )
+        self.attribute_seed = self.generate_planet_seed()
+        self.stage_rngs = {}
+        self.resolved_stages = 0
 
-        self.initialize_planet_attributes()
+    def __getattr__(self, name):
+        stage = PLANET_ATTRIBUTE_STAGES.get(name)
+        if stage is None:
+            raise AttributeError(f"'Planet' object has no attribute '{name}'")
+
+        self.resolve_stage(stage)
+        return object.__getattribute__(self, name)
+
+    def resolve_stage(self, stage):
+        stage_bit = PLANET_STAGE_BITS[stage]
+        if self.resolved_stages & stage_bit:
+            return
+
+        with PLANET_STAGE_LOCK:
+            if self.resolved_stages & stage_bit:
+                return
+
+            for requirement in PLANET_STAGE_REQUIREMENTS[stage]:
+                self.resolve_stage(requirement)
+
+            getattr(self, f"generate_{stage}")()
+            self.resolved_stages |= stage_bit
 
     def initialize_planet_attributes(self):
+        for stage in PLANET_STAGES:
+            self.resolve_stage(stage)
+
+    def matches(self, criteria):
+        for attribute in sorted(
+            criteria,
+            key=lambda attribute: PLANET_ATTRIBUTE_ORDER.get(
+                attribute, len(PLANET_ATTRIBUTE_ORDER)
+            ),
+        ):
+            expected = criteria[attribute]
+            value = getattr(self, attribute)
 
-        planet_seed = self.generate_planet_seed()
-        random.seed(planet_seed)
+            if callable(expected):
+                if not expected(value):
+                    return False
+            elif value != expected:
+                return False
 
+        return True
+
+    def generate_classification(self):
         self.planet_type = self.choose_planet_type()
+        self.profile = PLANET_PROFILES.get(self.planet_type, DEFAULT_PROFILE)
+
+    def generate_surface(self):
         self.atmosphere = self.choose_atmosphere()
         self.diameter, self.volume = self.calculate_diameter_and_volume()
         self.density = self.calculate_density()
-        self.surface_temperature = self.calculate_surface_temperature()
+        self.base_surface_temperature = self.calculate_surface_temperature()
         self.possible_elements = self.calculate_possible_elements()
+
+    def generate_orbit(self):
         self.k2_planet, self.Q_planet, self.base_rotation_seconds = (
             self.calculate_internal_factors()
         )
@@ -249,228 +655,80 @@ class Planet:
         self.axial_tilt = self.calculate_axial_tilt()
         self.eccentricity_factor = self.calculate_eccentricity_factor()
         self.rotation_period_seconds = self.calculate_rotation_period()
-        self.elements = self.generate_elements_for_planet(planet_seed)
+        self.stage_rngs.pop("main", None)
+
+    def generate_composition(self):
+        self.elements = self.generate_elements_for_planet(self.attribute_seed)
         self.life_forms = self.calculate_life_probability()
-        self.planet_rings = self.decide_planet_rings(planet_seed)
-        self.initial_angle_rotation = random.uniform(0, 2 * math.pi)
-        self.initial_orbital_angle = random.uniform(0, 2 * math.pi)
-        self.correct_temperature_orbital_distance()
+        self.stage_rngs.pop("composition", None)
+
+    def generate_rings(self):
+        self.planet_rings = self.decide_planet_rings(self.attribute_seed)
+        self.initial_angle_rotation = self.attribute_rng(
+            "initial_angle_rotation", "rings"
+        ).uniform(0, 2 * math.pi)
+        self.initial_orbital_angle = self.attribute_rng(
+            "initial_orbital_angle", "rings"
+        ).uniform(0, 2 * math.pi)
+        self.atmosphere_factor = self.calculate_atmosphere_factor()
+        self.stage_rngs.pop("rings", None)
 
     def generate_planet_seed(self):
-        return int(
-            hashlib.sha256(
-                f"{self.seed}-{self.name}-{seedmaster(4)}".encode()
-            ).hexdigest(),
-            16,
-        )
+        return self.seed_deriver.planet_attribute_seed(self.seed, self.name)
+
+    def attribute_rng(self, attribute, stream="main"):
+        rng = self.stage_rngs.get(stream)
+        if rng is None:
+            rng = self.seed_deriver.planet_rng(self.attribute_seed)
+            self.stage_rngs[stream] = rng
+        return self.seed_deriver.attribute_rng(rng, self.attribute_seed, attribute)
 
     def choose_planet_type(self):
-        return random.choice(
-            [
-                "Rocky",
-                "Gas Giant",
-                "Icy",
-                "Oceanic",
-                "Desert",
-                "Lava",
-                "Arid",
-                "Tundra",
-                "Swamp",
-                "Forest",
-                "Savannah",
-                "Cave",
-                "Crystalline",
-                "Anomaly",
-                "Metallic",
-                "Toxic",
-                "Radioactive",
-                "Magma",
-                "Molten Core",
-                "Carbon",
-                "Diamond",
-                "Super Earth",
-                "Sub Earth",
-                "Frozen Gas Giant",
-                "Nebulous",
-                "Aquifer",
-                "Exotic",
-            ]
-        )
+        return self.attribute_rng("planet_type").choice(PLANET_TYPES)
 
     def choose_atmosphere(self):
-        if self.planet_type in ["Gas Giant", "Frozen Gas Giant", "Nebulous", "Anomaly"]:
-            possible_atmospheres = [
-                "Hydrogen",
-                "Helium",
-                "Methane",
-                "Ammonia",
-                "Carbon Dioxide",
-                "Toxic",
-                "Ionic",
-                "Plasma",
-                "Exotic Gases",
-                "Water Vapor",
-            ]
-        elif self.planet_type in [
-            "Rocky",
-            "Oceanic",
-            "Desert",
-            "Lava",
-            "Arid",
-            "Tundra",
-            "Swamp",
-        ]:
-            possible_atmospheres = [
-                "Thick",
-                "Thin",
-                "None",
-                "Breathable",
-                "Carbon Dioxide",
-                "Methane",
-                "Nitrogen",
-                "Oxygen-Rich",
-                "Sulfur Dioxide",
-                "Superheated",
-                "Acidic",
-            ]
-        else:
-            possible_atmospheres = [
-                "Exotic Gases",
-                "Plasma",
-                "Ionic",
-                "None",
-                "Frozen",
-                "Acidic",
-                "Toxic",
-                "Superheated",
-                "Hydrogen",
-                "Helium",
-            ]
-        return random.choice(possible_atmospheres)
+        return self.attribute_rng("atmosphere").choice(self.profile.atmospheres)
 
     def generate_elements_for_planet(self, seed):
-        elements, weights = zip(*periodic_table)
-
-        random.seed(seed)
+        rng = self.attribute_rng("elements", "composition")
 
         possible_elements = self.possible_elements
 
-        preselected_elements = random.sample(
+        preselected_elements = rng.sample(
             possible_elements, min(2, len(possible_elements))
         )
 
-        remaining_elements = [el for el in elements if el not in preselected_elements]
-        remaining_weights = [
-            weights[i]
-            for i, el in enumerate(elements)
-            if el not in preselected_elements
-        ]
-
-        total_elements = random.randint(5, 10)
-
-        num_elements_to_select = total_elements - len(preselected_elements)
-
-        num_elements_to_select = min(num_elements_to_select, len(remaining_elements))
-
-        additional_elements = []
-        while len(additional_elements) < num_elements_to_select and remaining_elements:
-            selected_element = random.choices(
-                remaining_elements, weights=remaining_weights, k=1
-            )[0]
-            additional_elements.append(selected_element)
+        total_elements = rng.randint(5, 10)
 
-            index = remaining_elements.index(selected_element)
-            remaining_elements.pop(index)
-            remaining_weights.pop(index)
-
-        selected_elements = preselected_elements + additional_elements
+        additional_elements = sample_elements(
+            rng,
+            preselected_elements,
+            total_elements - len(preselected_elements),
+        )
 
-        return selected_elements
+        return tuple(preselected_elements + additional_elements)
 
     def calculate_possible_elements(self):
-        elements_mapping = {
-            "Rocky": ["Silicon", "Iron", "Magnesium", "Oxygen"],
-            "Gas Giant": ["Hydrogen", "Helium", "Neon", "Argon"],
-            "Icy": ["Nitrogen", "Oxygen", "Hydrogen", "Sulfur"],
-            "Oceanic": ["Oxygen", "Hydrogen", "Sodium", "Chlorine"],
-            "Desert": ["Silicon", "Oxygen", "Iron", "Aluminum"],
-            "Lava": ["Magnesium", "Silicon", "Iron", "Sulfur"],
-            "Arid": ["Silicon", "Oxygen", "Iron", "Calcium"],
-            "Tundra": ["Nitrogen", "Oxygen", "Carbon", "Iron"],
-            "Swamp": ["Carbon", "Oxygen", "Phosphorus", "Nitrogen"],
-            "Forest": ["Oxygen", "Carbon", "Nitrogen", "Phosphorus"],
-            "Savannah": ["Oxygen", "Carbon", "Silicon", "Phosphorus"],
-            "Cave": ["Silicon", "Calcium", "Iron", "Carbon"],
-            "Crystalline": ["Silicon", "Carbon", "Oxygen", "Iron"],
-            "Anomaly": ["Copernicium", "Nihonium", "Flerovium", "Moscovium"],
-            "Metallic": ["Iron", "Nickel", "Titanium", "Cobalt"],
-            "Toxic": ["Sulfur", "Chlorine", "Phosphorus", "Fluorine"],
-            "Radioactive": ["Uranium", "Thorium", "Plutonium", "Radium"],
-            "Magma": ["Magnesium", "Silicon", "Iron", "Sulfur"],
-            "Molten Core": ["Iron", "Nickel", "Magnesium", "Sulfur"],
-            "Carbon": ["Carbon", "Oxygen", "Silicon", "Iron"],
-            "Diamond": ["Carbon", "Silicon", "Nitrogen", "Oxygen"],
-            "Super Earth": ["Iron", "Magnesium", "Silicon", "Oxygen"],
-            "Sub Earth": ["Silicon", "Iron", "Carbon", "Oxygen"],
-            "Frozen Gas Giant": ["Hydrogen", "Helium", "Neon", "Methane"],
-            "Nebulous": ["Hydrogen", "Helium", "Neon", "Argon"],
-            "Aquifer": ["Oxygen", "Hydrogen", "Sodium", "Chlorine"],
-            "Exotic": ["Oganesson", "Livermorium", "Tennessine", "Flerovium"],
-        }
-
-        possible_elements = elements_mapping.get(
-            self.planet_type,
-            [elem for elem, prob in periodic_table if prob > 0.0000000001],
-        )
-
-        return possible_elements
+        return self.profile.elements
 
     def calculate_diameter_and_volume(self):
-        diameter_ranges = {
-            "Rocky": (0.7, 1.2),
-            "Gas Giant": (10, 15),
-            "Icy": (0.7, 1.5),
-            "Oceanic": (0.8, 1.5),
-            "Desert": (0.7, 1.2),
-            "Lava": (0.8, 1.5),
-            "Arid": (0.7, 1.2),
-            "Tundra": (0.7, 1.5),
-            "Swamp": (0.8, 1.5),
-            "Forest": (0.8, 1.5),
-            "Savannah": (0.8, 1.5),
-            "Cave": (0.7, 1.2),
-            "Crystalline": (0.7, 1.2),
-            "Anomaly": (0.1, 3),
-            "Metallic": (1, 2.5),
-            "Toxic": (0.7, 1.5),
-            "Radioactive": (1, 2),
-            "Magma": (0.8, 1.5),
-            "Molten Core": (0.8, 1.5),
-            "Carbon": (0.7, 1.5),
-            "Diamond": (0.7, 1.5),
-            "Super Earth": (1, 2),
-            "Sub Earth": (0.5, 1),
-            "Frozen Gas Giant": (10, 15),
-            "Nebulous": (5, 15),
-            "Aquifer": (0.8, 1.5),
-            "Exotic": (0.5, 3),
-        }
-
-        diameter_range = diameter_ranges.get(self.planet_type, (0.5, 2))
-
-        diameter = random.uniform(*diameter_range) * self.constants.D_EARTH
+        diameter = (
+            self.attribute_rng("diameter").uniform(*self.profile.diameter)
+            * self.constants.D_EARTH
+        )
         volume = (4 / 3) * math.pi * (diameter * 1e3 / 2) ** 3
 
         return diameter, volume
 
     def calculate_life_probability(self):
+        rng = self.attribute_rng("life_forms", "composition")
         score = 0
 
-        if -20 <= self.surface_temperature <= 50:
+        if -20 <= self.base_surface_temperature <= 50:
             score += 20
         elif (
-            -100 <= self.surface_temperature < -20
-            or 50 < self.surface_temperature <= 100
+            -100 <= self.base_surface_temperature < -20
+            or 50 < self.base_surface_temperature <= 100
         ):
             score += 10
         else:
@@ -509,7 +767,7 @@ class Planet:
                     "Vegetable Animals",
                 ]
             )
-            if random.random() < 0.0005:
+            if rng.random() < 0.0005:
                 return "Vegetable Animals"
         elif 40 <= score < 60:
             possible_life_forms.extend(["Animal Life", "Vegetation", "Bacteria"])
@@ -517,18 +775,18 @@ class Planet:
             possible_life_forms.extend(["Bacteria", "Vegetation"])
 
         if "Silicon" in self.elements:
-            if random.random() < 0.02:
+            if rng.random() < 0.02:
                 return "Silicon-Based Life"
 
-        if random.random() < 0.0001:
+        if rng.random() < 0.0001:
             return "Non-Physical Entity"
 
         if self.atmosphere in ["Methane", "Ammonia"]:
-            if random.random() < 0.00001:
+            if rng.random() < 0.00001:
                 return "Conscious Gas"
 
         if self.planet_type in ["Metallic", "Crystalline"]:
-            if random.random() < 0.001:
+            if rng.random() < 0.001:
                 return "Robotic Entities"
 
         if (
@@ -537,45 +795,13 @@ class Planet:
             and "Moscovium" in self.elements
             and "Z-Divinium" in self.elements
         ):
-            if random.random() < 0.00001:
+            if rng.random() < 0.00001:
                 return "Have I just found God?"
 
-        return random.choice(possible_life_forms)
+        return rng.choice(possible_life_forms)
 
     def calculate_density(self):
-        density_ranges = {
-            "Rocky": (3000, 5500),
-            "Gas Giant": (500, 1600),
-            "Icy": (500, 2000),
-            "Oceanic": (1000, 3000),
-            "Desert": (2000, 4000),
-            "Lava": (3000, 5000),
-            "Arid": (2000, 4000),
-            "Tundra": (1500, 3000),
-            "Swamp": (1000, 3000),
-            "Forest": (1000, 3000),
-            "Savannah": (1000, 3000),
-            "Cave": (2000, 4000),
-            "Crystalline": (2000, 4000),
-            "Anomaly": (500, 10000),
-            "Metallic": (5000, 8000),
-            "Toxic": (3000, 6000),
-            "Radioactive": (4000, 7000),
-            "Magma": (4000, 7000),
-            "Molten Core": (5000, 8000),
-            "Carbon": (3500, 5000),
-            "Diamond": (3000, 7000),
-            "Super Earth": (4000, 6000),
-            "Sub Earth": (3000, 5000),
-            "Frozen Gas Giant": (500, 1000),
-            "Nebulous": (100, 300),
-            "Aquifer": (2000, 3000),
-            "Exotic": (1000, 20000),
-        }
-
-        density_range = density_ranges.get(self.planet_type, (3000, 6000))
-
-        return random.uniform(*density_range)
+        return self.attribute_rng("density").uniform(*self.profile.density)
 
     def calculate_tidal_effect(self):
 
@@ -596,208 +822,22 @@ class Planet:
         return tidal_effect
 
     def calculate_surface_temperature(self):
-        temperature_ranges = {
-            "Rocky": (-150, 50),
-            "Gas Giant": (-150, 150),
-            "Icy": (-150, 0),
-            "Oceanic": (0, 40),
-            "Desert": (50, 200),
-            "Lava": (500, 1200),
-            "Arid": (50, 150),
-            "Tundra": (-100, 0),
-            "Swamp": (10, 50),
-            "Forest": (10, 30),
-            "Savannah": (20, 40),
-            "Cave": (0, 40),
-            "Crystalline": (-50, 500),
-            "Anomaly": (-273, 1500),
-            "Metallic": (-50, 400),
-            "Toxic": (100, 400),
-            "Radioactive": (-50, 500),
-            "Magma": (700, 1500),
-            "Molten Core": (1000, 2000),
-            "Carbon": (-50, 300),
-            "Diamond": (-50, 1000),
-            "Super Earth": (-50, 400),
-            "Sub Earth": (-100, 300),
-            "Frozen Gas Giant": (-200, -50),
-            "Nebulous": (-200, 50),
-            "Aquifer": (-10, 50),
-            "Exotic": (-273, 1500),
-        }
-
-        temperature_range = temperature_ranges.get(self.planet_type, (-100, 500))
-
-        return random.uniform(*temperature_range)
+        return self.attribute_rng("surface_temperature").uniform(
+            *self.profile.temperature
+        )
 
     def calculate_internal_factors(self):
-        internal_factors = {
-            "Rocky": {
-                "k2_planet": (0.2, 0.4),
-                "Q_planet": (50, 200),
-                "base_rotation_seconds": (0.5 * 3600, 12 * 3600),
-            },
-            "Gas Giant": {
-                "k2_planet": (0.4, 0.6),
-                "Q_planet": (10000, 1000000),
-                "base_rotation_seconds": (2 * 3600, 6 * 3600),
-            },
-            "Icy": {
-                "k2_planet": (0.3, 0.5),
-                "Q_planet": (200, 600),
-                "base_rotation_seconds": (1 * 3600, 8 * 3600),
-            },
-            "Oceanic": {
-                "k2_planet": (0.2, 0.35),
-                "Q_planet": (100, 300),
-                "base_rotation_seconds": (0.5 * 3600, 5 * 3600),
-            },
-            "Desert": {
-                "k2_planet": (0.25, 0.4),
-                "Q_planet": (50, 200),
-                "base_rotation_seconds": (1 * 3600, 8 * 3600),
-            },
-            "Lava": {
-                "k2_planet": (0.3, 0.5),
-                "Q_planet": (100, 400),
-                "base_rotation_seconds": (2 * 3600, 11 * 3600),
-            },
-            "Arid": {
-                "k2_planet": (0.25, 0.4),
-                "Q_planet": (50, 200),
-                "base_rotation_seconds": (1 * 3600, 10 * 3600),
-            },
-            "Tundra": {
-                "k2_planet": (0.3, 0.5),
-                "Q_planet": (100, 300),
-                "base_rotation_seconds": (1 * 3600, 6 * 3600),
-            },
-            "Swamp": {
-                "k2_planet": (0.2, 0.35),
-                "Q_planet": (100, 300),
-                "base_rotation_seconds": (0.8 * 3600, 7 * 3600),
-            },
-            "Forest": {
-                "k2_planet": (0.2, 0.4),
-                "Q_planet": (100, 300),
-                "base_rotation_seconds": (1 * 3600, 6 * 3600),
-            },
-            "Savannah": {
-                "k2_planet": (0.2, 0.4),
-                "Q_planet": (100, 300),
-                "base_rotation_seconds": (1 * 3600, 7 * 3600),
-            },
-            "Cave": {
-                "k2_planet": (0.3, 0.5),
-                "Q_planet": (200, 500),
-                "base_rotation_seconds": (0.5 * 3600, 8 * 3600),
-            },
-            "Crystalline": {
-                "k2_planet": (0.3, 0.6),
-                "Q_planet": (1000, 5000),
-                "base_rotation_seconds": (0.5 * 3600, 12 * 3600),
-            },
-            "Anomaly": {
-                "k2_planet": (0.1, 0.8),
-                "Q_planet": (1000, 10000000),
-                "base_rotation_seconds": (0.1 * 3600, 100 * 3600),
-            },
-            "Metallic": {
-                "k2_planet": (0.4, 0.7),
-                "Q_planet": (500, 2000),
-                "base_rotation_seconds": (2 * 3600, 12 * 3600),
-            },
-            "Toxic": {
-                "k2_planet": (0.2, 0.5),
-                "Q_planet": (100, 500),
-                "base_rotation_seconds": (0.5 * 3600, 10 * 3600),
-            },
-            "Radioactive": {
-                "k2_planet": (0.3, 0.6),
-                "Q_planet": (500, 3000),
-                "base_rotation_seconds": (1 * 3600, 20 * 3600),
-            },
-            "Magma": {
-                "k2_planet": (0.3, 0.5),
-                "Q_planet": (100, 400),
-                "base_rotation_seconds": (3 * 3600, 15 * 3600),
-            },
-            "Molten Core": {
-                "k2_planet": (0.4, 0.7),
-                "Q_planet": (500, 2000),
-                "base_rotation_seconds": (3 * 3600, 15 * 3600),
-            },
-            "Carbon": {
-                "k2_planet": (0.3, 0.5),
-                "Q_planet": (200, 600),
-                "base_rotation_seconds": (1 * 3600, 8 * 3600),
-            },
-            "Diamond": {
-                "k2_planet": (0.4, 0.6),
-                "Q_planet": (500, 2000),
-                "base_rotation_seconds": (2 * 3600, 12 * 3600),
-            },
-            "Super Earth": {
-                "k2_planet": (0.4, 0.6),
-                "Q_planet": (200, 400),
-                "base_rotation_seconds": (0.5 * 3600, 10 * 3600),
-            },
-            "Sub Earth": {
-                "k2_planet": (0.35, 0.5),
-                "Q_planet": (150, 300),
-                "base_rotation_seconds": (2 * 3600, 12 * 3600),
-            },
-            "Frozen Gas Giant": {
-                "k2_planet": (0.4, 0.6),
-                "Q_planet": (10000, 1000000),
-                "base_rotation_seconds": (3 * 3600, 6 * 3600),
-            },
-            "Nebulous": {
-                "k2_planet": (0.2, 0.5),
-                "Q_planet": (1000, 5000),
-                "base_rotation_seconds": (5 * 3600, 12 * 3600),
-            },
-            "Aquifer": {
-                "k2_planet": (0.2, 0.4),
-                "Q_planet": (100, 300),
-                "base_rotation_seconds": (1 * 3600, 6 * 3600),
-            },
-            "Exotic": {
-                "k2_planet": (0.1, 0.8),
-                "Q_planet": (1000, 10000000),
-                "base_rotation_seconds": (0.3 * 3600, 30 * 3600),
-            },
-            "default": {
-                "k2_planet": (0.2, 0.7),
-                "Q_planet": (50, 5000),
-                "base_rotation_seconds": (5 * 3600, 50 * 3600),
-            },
-        }
-
-        factors = internal_factors.get(self.planet_type, internal_factors["default"])
+        profile = self.profile
+        rng = self.attribute_rng("internal_factors")
 
-        base_rotation_seconds = random.uniform(*factors["base_rotation_seconds"])
-        k2_planet = random.uniform(*factors["k2_planet"])
-        Q_planet = random.uniform(*factors["Q_planet"])
+        base_rotation_seconds = rng.uniform(*profile.base_rotation_seconds)
+        k2_planet = rng.uniform(*profile.k2_planet)
+        Q_planet = rng.uniform(*profile.Q_planet)
 
         return k2_planet, Q_planet, base_rotation_seconds
 
     def calculate_k_factor(self):
-        k_factor_map = {
-            "Gas Giant": 0.4,
-            "Frozen Gas Giant": 0.4,
-            "Metallic": 0.35,
-            "Radioactive": 0.35,
-            "Magma": 0.35,
-            "Molten Core": 0.35,
-            "Carbon": 0.35,
-            "Diamond": 0.35,
-            "Crystalline": 0.5,
-            "Anomaly": 0.5,
-            "Exotic": 0.5,
-        }
-
-        return k_factor_map.get(self.planet_type, 0.3)
+        return self.profile.k_factor
 
     def calculate_mass(self):
         return self.density * self.volume
@@ -806,7 +846,7 @@ class Planet:
         return self.constants.G * (self.mass / (self.diameter * 1e3 / 2) ** 2)
 
     def calculate_orbital_radius(self):
-        orbital_radius = random.uniform(0.1, 40)
+        orbital_radius = self.attribute_rng("orbital_radius").uniform(0.1, 40)
         orbital_radius_m = orbital_radius * 1.496e11
         return orbital_radius, orbital_radius_m
 
@@ -825,12 +865,13 @@ class Planet:
         )
 
     def calculate_axial_tilt(self):
-        return random.uniform(0, 45)
+        return self.attribute_rng("axial_tilt").uniform(0, 45)
 
     def calculate_moment_of_inertia(self):
         return self.k_factor * self.mass * (self.diameter * 1e3 / 2) ** 2
 
     def calculate_rotation_period(self):
+        rng = self.attribute_rng("rotation_period")
         rotation_period_seconds = self.base_rotation_seconds * math.sqrt(
             self.moment_of_inertia / (self.mass * self.gravity * self.diameter * 1e3)
         )
@@ -842,7 +883,7 @@ class Planet:
 
         eccentricity_factor = self.eccentricity_factor
 
-        distance_influence = (1 / (self.orbital_radius**1.5)) * random.uniform(0.9, 1.1)
+        distance_influence = (1 / (self.orbital_radius**1.5)) * rng.uniform(0.9, 1.1)
         rotation_period_seconds *= max(1, eccentricity_factor * distance_influence)
 
         if (
@@ -851,7 +892,7 @@ class Planet:
             and rotation_period_seconds > 2 * self.orbital_period_seconds
         ):
             divisor = 2 + (1 - self.orbital_radius) * 10
-            rotation_period_seconds = random.uniform(
+            rotation_period_seconds = rng.uniform(
                 6 * 3600, rotation_period_seconds / divisor
             )
 
@@ -860,10 +901,10 @@ class Planet:
         return max(min_rotation_period, rotation_period_seconds)
 
     def calculate_eccentricity_factor(self):
-        return random.uniform(0, 0.5)
+        return self.attribute_rng("eccentricity_factor").uniform(0, 0.5)
 
     def decide_planet_rings(self, seed):
-        random.seed(seed)
+        rng = self.attribute_rng("planet_rings", "rings")
 
         roche_limit = (
             2.44 * (self.diameter * 1e3 / 2) * (self.density / 3000) ** (1 / 3)
@@ -877,7 +918,7 @@ class Planet:
         mass_factor = self.mass / self.constants.M_EARTH
         rotation_factor = min(1.5, 1 / (self.rotation_period_seconds / 86400))
         temperature_factor = 1 / (
-            1 + math.exp(-0.001 * (self.surface_temperature - 150))
+            1 + math.exp(-0.001 * (self.base_surface_temperature - 150))
         )
         axial_tilt_factor = 1 - (self.axial_tilt / 90)
 
@@ -890,20 +931,31 @@ class Planet:
         ) * 20
         ring_probability = min(ring_probability, 7)
 
-        decision = random.uniform(0, 100) <= ring_probability
+        decision = rng.uniform(0, 100) <= ring_probability
         return decision
 
-    def correct_temperature_orbital_distance(self):
-        current_time = time.time()
+    def calculate_atmosphere_factor(self):
+        rng = self.attribute_rng("atmosphere_factor", "rings")
+        atmosphere_factor = ATMOSPHERE_FACTORS.get(self.atmosphere, 1.0)
+        for atmosphere, factor_range in VARIABLE_ATMOSPHERE_FACTORS:
+            factor = rng.uniform(*factor_range)
+            if atmosphere == self.atmosphere:
+                atmosphere_factor = factor
+
+        return atmosphere_factor
 
-        time_elapsed_seconds = current_time - config.cosmic_origin_time
+    @property
+    def surface_temperature(self):
+        return self.surface_temperature_at(CosmicClock())
 
-        orbital_period = self.orbital_period_seconds
-        angle_velocity_orbit = 2 * math.pi / orbital_period
+    def orbital_angle_at(self, clock):
+        return clock.angle(self.initial_orbital_angle, self.orbital_period_seconds)
 
-        angle_orbit = (
-            self.initial_orbital_angle + time_elapsed_seconds * angle_velocity_orbit
-        ) % (2 * math.pi)
+    def rotation_angle_at(self, clock):
+        return clock.angle(self.initial_angle_rotation, self.rotation_period_seconds)
+
+    def surface_temperature_at(self, clock):
+        angle_orbit = self.orbital_angle_at(clock)
 
         semi_major_axis = self.orbital_radius
         eccentricity = self.eccentricity_factor
@@ -917,31 +969,5 @@ class Planet:
             current_distance = 0.1
 
         distance_factor = 1 / (current_distance**0.5)
-        self.surface_temperature *= distance_factor
-
-        atmosphere_factors = {
-            "Thick": 1.2,
-            "Thin": 0.9,
-            "None": 0.7,
-            "Breathable": 1.0,
-            "Carbon Dioxide": 1.3,
-            "Methane": 1.1,
-            "Nitrogen": 0.95,
-            "Oxygen-Rich": 1.0,
-            "Sulfur Dioxide": 1.4,
-            "Superheated": 1.6,
-            "Acidic": 1.5,
-            "Hydrogen": 1.2,
-            "Helium": 0.8,
-            "Ammonia": 1.1,
-            "Water Vapor": 1.3,
-            "Exotic Gases": random.uniform(0.8, 1.5),
-            "Ionic": random.uniform(0.8, 1.3),
-            "Plasma": random.uniform(1.0, 1.4),
-            "Frozen": 0.5,
-            "Toxic": 1.4,
-        }
-
-        atmosphere_factor = atmosphere_factors.get(self.atmosphere, 1.0)
 
-        self.surface_temperature *= atmosphere_factor
+        return self.base_surface_temperature * distance_factor * self.atmosphere_factor
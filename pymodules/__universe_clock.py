@@ -0,0 +1,25 @@
+# pymodules/__universe_clock.py
+
+import math
+import time
+
+from pymodules.__atlas_config import config
+
+
+class CosmicClock:
+    __slots__ = ("origin_time", "timestamp", "elapsed_seconds", "elapsed_minutes")
+
+    def __init__(self, timestamp=None, origin_time=None):
+        self.origin_time = (
+            config.cosmic_origin_time if origin_time is None else origin_time
+        )
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.elapsed_seconds = self.timestamp - self.origin_time
+        self.elapsed_minutes = self.elapsed_seconds // 60
+
+    def at(self, timestamp):
+        return CosmicClock(timestamp, self.origin_time)
+
+    def angle(self, initial_angle, period_seconds):
+        angle_velocity = 2 * math.pi / period_seconds
+        return (initial_angle + self.elapsed_seconds * angle_velocity) % (2 * math.pi)
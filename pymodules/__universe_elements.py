@@ -1,5 +1,11 @@
 # pymodules/__universe_elements.py
 
+import functools
+
+from bisect import bisect
+from itertools import accumulate
+
+
 periodic_table = [
     ("Hydrogen", 0.7),
     ("Helium", 0.28),
@@ -122,3 +128,41 @@ periodic_table = [
     ("Oganesson", 0.00000001),
     ("Z-Divinium", 0.000000001),
 ]
+
+
+element_names = tuple(element for element, _ in periodic_table)
+element_weights = tuple(weight for _, weight in periodic_table)
+element_index = {element: index for index, element in enumerate(element_names)}
+
+
+@functools.lru_cache(maxsize=2048)
+def remaining_elements(excluded):
+    names = list(element_names)
+    weights = list(element_weights)
+
+    for index in sorted(
+        (element_index[element] for element in excluded if element in element_index),
+        reverse=True,
+    ):
+        del names[index]
+        del weights[index]
+
+    return tuple(names), tuple(accumulate(weights))
+
+
+def sample_elements(rng, excluded, count):
+    excluded = frozenset(excluded)
+    selected = []
+
+    while len(selected) < count:
+        names, cum_weights = remaining_elements(excluded)
+        if not names:
+            break
+
+        total = cum_weights[-1] + 0.0
+        element = names[bisect(cum_weights, rng.random() * total, 0, len(names) - 1)]
+
+        selected.append(element)
+        excluded = excluded | {element}
+
+    return selected
@@ -3,570 +3,582 @@
 import random
 
 
-def generate_name(seed, type="galaxy"):
-    random.seed(seed)
+GALAXY_PREFIXES = (
+    "Andro",
+    "Vega",
+    "Cygnus",
+    "Orion",
+    "Luna",
+    "Terra",
+    "Hilla",
+    "Proto",
+    "Zena",
+    "Quasar",
+    "Nebula",
+    "Omega",
+    "Alpha",
+    "Beta",
+    "Delta",
+    "Gamma",
+    "Theta",
+    "Epsilon",
+    "Iota",
+    "Kappa",
+    "Lambda",
+    "Mu",
+    "Nu",
+    "Xi",
+    "Omicron",
+    "Pi",
+    "Rho",
+    "Sigma",
+    "Tau",
+    "Upsilon",
+    "Phi",
+    "Chi",
+    "Psi",
+    "Zeta",
+    "Nova",
+    "Aster",
+    "Stella",
+    "Astria",
+    "Galax",
+    "Cosmo",
+    "Lunara",
+    "Solaris",
+    "Polaris",
+    "Orbis",
+    "Pulsar",
+    "Helios",
+    "Cygni",
+    "Vespera",
+    "Andaris",
+    "Altair",
+    "Draco",
+    "Hydra",
+    "Sirius",
+)
 
-    galaxy_prefixes = [
-        "Andro",
-        "Vega",
-        "Cygnus",
-        "Orion",
-        "Luna",
-        "Terra",
-        "Hilla",
-        "Proto",
-        "Zena",
-        "Quasar",
-        "Nebula",
-        "Omega",
-        "Alpha",
-        "Beta",
-        "Delta",
-        "Gamma",
-        "Theta",
-        "Epsilon",
-        "Iota",
-        "Kappa",
-        "Lambda",
-        "Mu",
-        "Nu",
-        "Xi",
-        "Omicron",
-        "Pi",
-        "Rho",
-        "Sigma",
-        "Tau",
-        "Upsilon",
-        "Phi",
-        "Chi",
-        "Psi",
-        "Zeta",
-        "Nova",
-        "Aster",
-        "Stella",
-        "Astria",
-        "Galax",
-        "Cosmo",
-        "Lunara",
-        "Solaris",
-        "Polaris",
-        "Orbis",
-        "Pulsar",
-        "Helios",
-        "Cygni",
-        "Vespera",
-        "Andaris",
-        "Altair",
-        "Draco",
-        "Hydra",
-        "Sirius",
-    ]
+GALAXY_SUFFIXES = (
+    "mede",
+    "nia",
+    "lus",
+    "ion",
+    "aris",
+    "os",
+    "rex",
+    "nor",
+    "ara",
+    "lis",
+    "tor",
+    "dex",
+    "ran",
+    "cor",
+    "mel",
+    "zon",
+    "lox",
+    "mir",
+    "nus",
+    "tir",
+    "gorn",
+    "zor",
+    "fus",
+    "tar",
+    "tron",
+    "nox",
+    "ver",
+    "grix",
+    "nor",
+    "rax",
+    "bor",
+    "fex",
+    "mor",
+    "dar",
+    "tix",
+    "vir",
+    "ron",
+    "zen",
+    "xor",
+    "nim",
+    "thar",
+    "gix",
+    "vir",
+    "xen",
+    "pol",
+    "fax",
+    "lin",
+    "dex",
+    "fin",
+    "yor",
+)
 
-    galaxy_suffixes = [
-        "mede",
-        "nia",
-        "lus",
-        "ion",
-        "aris",
-        "os",
-        "rex",
-        "nor",
-        "ara",
-        "lis",
-        "tor",
-        "dex",
-        "ran",
-        "cor",
-        "mel",
-        "zon",
-        "lox",
-        "mir",
-        "nus",
-        "tir",
-        "gorn",
-        "zor",
-        "fus",
-        "tar",
-        "tron",
-        "nox",
-        "ver",
-        "grix",
-        "nor",
-        "rax",
-        "bor",
-        "fex",
-        "mor",
-        "dar",
-        "tix",
-        "vir",
-        "ron",
-        "zen",
-        "xor",
-        "nim",
-        "thar",
-        "gix",
-        "vir",
-        "xen",
-        "pol",
-        "fax",
-        "lin",
-        "dex",
-        "fin",
-        "yor",
-    ]
+PLANET_PREFIXES = (
+    "Xen",
+    "Helio",
+    "Astra",
+    "Sol",
+    "Gaia",
+    "Ant",
+    "Lip",
+    "Harred",
+    "Triton",
+    "Gene",
+    "Vic",
+    "Chrono",
+    "Pyro",
+    "Hydro",
+    "Geo",
+    "Are",
+    "Nebul",
+    "Vortex",
+    "Stellar",
+    "Quanta",
+    "Auror",
+    "Zephyr",
+    "Aero",
+    "Electro",
+    "Lumen",
+    "Nox",
+    "Loop",
+    "Terra",
+    "Venus",
+    "Viv",
+    "Yeep",
+    "Mercur",
+    "Mars",
+    "Hoos",
+    "Glac",
+    "Jupit",
+    "Saturn",
+    "Nept",
+    "Uran",
+    "Pluto",
+    "Kepl",
+    "Anom",
+    "At",
+    "Eris",
+    "Ceres",
+    "Makemake",
+    "Haumea",
+    "Orcus",
+    "Heri",
+    "Varuna",
+    "Gons",
+    "Mihi",
+    "Colbik",
+    "Ixion",
+    "Kla",
+    "Quaor",
+    "Zool",
+    "Sedna",
+    "Altrius",
+    "Fract",
+    "Maha",
+    "Proteus",
+    "Nereid",
+    "Larissa",
+    "Pin",
+    "Nes",
+    "Charon",
+    "Sycorax",
+    "Moob",
+    "Yok",
+    "Miranda",
+    "Oberon",
+    "Kling",
+    "Glie",
+    "Angh",
+    "Titania",
+    "Umbriel",
+    "Dione",
+    "Quid",
+    "Goon",
+    "Hue",
+    "Zhen",
+    "Rhea",
+    "Tethys",
+    "Iapetus",
+    "Ton",
+    "Xumur",
+    "Tand",
+    "Zertos",
+    "Cloud",
+    "Xod",
+    "Mimas",
+    "Zho",
+    "Enceladus",
+    "Yuk",
+    "Moll",
+    "Hoc",
+    "Son",
+    "Phoebe",
+    "Janus",
+    "Epimetheus",
+)
 
-    planet_prefixes = [
-        "Xen",
-        "Helio",
-        "Astra",
-        "Sol",
-        "Gaia",
-        "Ant",
-        "Lip",
-        "Harred",
-        "Triton",
-        "Gene",
-        "Vic",
-        "Chrono",
-        "Pyro",
-        "Hydro",
-        "Geo",
-        "Are",
-        "Nebul",
-        "Vortex",
-        "Stellar",
-        "Quanta",
-        "Auror",
-        "Zephyr",
-        "Aero",
-        "Electro",
-        "Lumen",
-        "Nox",
-        "Loop",
-        "Terra",
-        "Venus",
-        "Viv",
-        "Yeep",
-        "Mercur",
-        "Mars",
-        "Hoos",
-        "Glac",
-        "Jupit",
-        "Saturn",
-        "Nept",
-        "Uran",
-        "Pluto",
-        "Kepl",
-        "Anom",
-        "At",
-        "Eris",
-        "Ceres",
-        "Makemake",
-        "Haumea",
-        "Orcus",
-        "Heri",
-        "Varuna",
-        "Gons",
-        "Mihi",
-        "Colbik",
-        "Ixion",
-        "Kla",
-        "Quaor",
-        "Zool",
-        "Sedna",
-        "Altrius",
-        "Fract",
-        "Maha",
-        "Proteus",
-        "Nereid",
-        "Larissa",
-        "Pin",
-        "Nes",
-        "Charon",
-        "Sycorax",
-        "Moob",
-        "Yok",
-        "Miranda",
-        "Oberon",
-        "Kling",
-        "Glie",
-        "Angh",
-        "Titania",
-        "Umbriel",
-        "Dione",
-        "Quid",
-        "Goon",
-        "Hue",
-        "Zhen",
-        "Rhea",
-        "Tethys",
-        "Iapetus",
-        "Ton",
-        "Xumur",
-        "Tand",
-        "Zertos",
-        "Cloud",
-        "Xod",
-        "Mimas",
-        "Zho",
-        "Enceladus",
-        "Yuk",
-        "Moll",
-        "Hoc",
-        "Son",
-        "Phoebe",
-        "Janus",
-        "Epimetheus",
-    ]
+PLANET_SUFFIXES = (
+    "tor",
+    "ron",
+    "zor",
+    "dex",
+    "nar",
+    "lus",
+    "ion",
+    "rel",
+    "vor",
+    "tan",
+    "mir",
+    "ros",
+    "gar",
+    "lis",
+    "min",
+    "zon",
+    "dax",
+    "ril",
+    "gan",
+    "vir",
+    "lon",
+    "sil",
+    "mos",
+    "zar",
+    "tos",
+    "fel",
+    "mon",
+    "lor",
+    "vis",
+    "rex",
+    "tus",
+    "lin",
+    "fin",
+    "lar",
+    "nor",
+    "lum",
+    "vin",
+    "sar",
+    "dor",
+    "cor",
+    "mar",
+    "ras",
+    "tal",
+    "gon",
+    "zin",
+    "mel",
+    "zel",
+    "rix",
+    "ral",
+    "tar",
+    "zir",
+    "lam",
+    "ton",
+    "val",
+    "din",
+    "kar",
+    "kal",
+    "mex",
+    "san",
+    "gol",
+    "fen",
+    "pon",
+    "mil",
+    "gil",
+    "van",
+    "mur",
+    "sal",
+    "xim",
+    "zul",
+    "nir",
+    "len",
+    "ram",
+    "dol",
+    "von",
+    "zan",
+    "ten",
+    "mor",
+    "on",
+    "us",
+    "ia",
+    "es",
+    "ar",
+    "ae",
+    "er",
+    "ur",
+    "or",
+    "ax",
+    "ys",
+    "en",
+    "ir",
+    "az",
+    "os",
+    "ix",
+    "as",
+    "ox",
+    "um",
+    "un",
+    "is",
+    "el",
+    "yn",
+    "ex",
+    "an",
+    "yl",
+    "id",
+    "em",
+    "ol",
+    "in",
+    "et",
+    "ac",
+    "il",
+    "ad",
+    "im",
+    "ul",
+    "al",
+    "am",
+    "ut",
+    "op",
+    "av",
+    "it",
+    "ev",
+    "ik",
+    "ug",
+    "iv",
+    "ok",
+    "ip",
+    "ab",
+    "ov",
+    "ud",
+    "eg",
+    "ob",
+    "uc",
+    "uv",
+    "uf",
+    "iz",
+    "og",
+    "at",
+    "af",
+    "eb",
+    "ib",
+    "if",
+    "uk",
+    "ag",
+    "oz",
+    "ek",
+    "a",
+    "e",
+    "i",
+    "o",
+    "u",
+)
 
-    planet_suffixes = [
-        "tor",
-        "ron",
-        "zor",
-        "dex",
-        "nar",
-        "lus",
-        "ion",
-        "rel",
-        "vor",
-        "tan",
-        "mir",
-        "ros",
-        "gar",
-        "lis",
-        "min",
-        "zon",
-        "dax",
-        "ril",
-        "gan",
-        "vir",
-        "lon",
-        "sil",
-        "mos",
-        "zar",
-        "tos",
-        "fel",
-        "mon",
-        "lor",
-        "vis",
-        "rex",
-        "tus",
-        "lin",
-        "fin",
-        "lar",
-        "nor",
-        "lum",
-        "vin",
-        "sar",
-        "dor",
-        "cor",
-        "mar",
-        "ras",
-        "tal",
-        "gon",
-        "zin",
-        "mel",
-        "zel",
-        "rix",
-        "ral",
-        "tar",
-        "zir",
-        "lam",
-        "ton",
-        "val",
-        "din",
-        "kar",
-        "kal",
-        "mex",
-        "san",
-        "gol",
-        "fen",
-        "pon",
-        "mil",
-        "gil",
-        "van",
-        "mur",
-        "sal",
-        "xim",
-        "zul",
-        "nir",
-        "len",
-        "ram",
-        "dol",
-        "von",
-        "zan",
-        "ten",
-        "mor",
-        "on",
-        "us",
-        "ia",
-        "es",
-        "ar",
-        "ae",
-        "er",
-        "ur",
-        "or",
-        "ax",
-        "ys",
-        "en",
-        "ir",
-        "az",
-        "os",
-        "ix",
-        "as",
-        "ox",
-        "um",
-        "un",
-        "is",
-        "el",
-        "yn",
-        "ex",
-        "an",
-        "yl",
-        "id",
-        "em",
-        "ol",
-        "in",
-        "et",
-        "ac",
-        "il",
-        "ad",
-        "im",
-        "ul",
-        "al",
-        "am",
-        "ut",
-        "op",
-        "av",
-        "it",
-        "ev",
-        "ik",
-        "ug",
-        "iv",
-        "ok",
-        "ip",
-        "ab",
-        "ov",
-        "ud",
-        "eg",
-        "ob",
-        "uc",
-        "uv",
-        "uf",
-        "iz",
-        "og",
-        "at",
-        "af",
-        "eb",
-        "ib",
-        "if",
-        "uk",
-        "ag",
-        "oz",
-        "ek",
-        "a",
-        "e",
-        "i",
-        "o",
-        "u",
-    ]
+SYSTEM_WORDS_1 = (
+    "Rhode",
+    "Ice",
+    "Fire",
+    "Wind",
+    "Light",
+    "Shadow",
+    "Storm",
+    "Sky",
+    "Earth",
+    "Ocean",
+    "Thunder",
+    "Star",
+    "Sun",
+    "Moon",
+    "Flame",
+    "Wave",
+    "Forest",
+    "Mountain",
+    "Desert",
+    "Frost",
+    "Blaze",
+    "Spirit",
+    "Mist",
+    "Blade",
+    "Claw",
+    "Wing",
+    "Heart",
+    "Soul",
+    "Dream",
+    "Echo",
+    "Flare",
+    "Raven",
+    "Wolf",
+    "Phoenix",
+    "Lion",
+    "Dragon",
+    "Vortex",
+    "Crystal",
+    "Steel",
+    "Obsidian",
+    "Tempest",
+    "Ember",
+    "Aurora",
+    "Nebula",
+    "Dawn",
+    "Dusk",
+    "Night",
+    "Twilight",
+    "Gale",
+    "Inferno",
+)
 
-    word_list_1 = [
-        "Rhode",
-        "Ice",
-        "Fire",
-        "Wind",
-        "Light",
-        "Shadow",
-        "Storm",
-        "Sky",
-        "Earth",
-        "Ocean",
-        "Thunder",
-        "Star",
-        "Sun",
-        "Moon",
-        "Flame",
-        "Wave",
-        "Forest",
-        "Mountain",
-        "Desert",
-        "Frost",
-        "Blaze",
-        "Spirit",
-        "Mist",
-        "Blade",
-        "Claw",
-        "Wing",
-        "Heart",
-        "Soul",
-        "Dream",
-        "Echo",
-        "Flare",
-        "Raven",
-        "Wolf",
-        "Phoenix",
-        "Lion",
-        "Dragon",
-        "Vortex",
-        "Crystal",
-        "Steel",
-        "Obsidian",
-        "Tempest",
-        "Ember",
-        "Aurora",
-        "Nebula",
-        "Dawn",
-        "Dusk",
-        "Night",
-        "Twilight",
-        "Gale",
-        "Inferno",
-    ]
+SYSTEM_WORDS_2 = (
+    "of",
+    "for",
+    "under",
+    "above",
+    "beyond",
+    "beneath",
+    "within",
+    "upon",
+    "between",
+    "around",
+    "towards",
+    "inside",
+    "from",
+    "into",
+    "through",
+    "against",
+    "across",
+    "coming",
+    "amidst",
+    "among",
+    "before",
+    "after",
+)
 
-    word_list_2 = [
-        "of",
-        "for",
-        "under",
-        "above",
-        "beyond",
-        "beneath",
-        "within",
-        "upon",
-        "between",
-        "around",
-        "towards",
-        "inside",
-        "from",
-        "into",
-        "through",
-        "against",
-        "across",
-        "coming",
-        "amidst",
-        "among",
-        "before",
-        "after",
-    ]
+SYSTEM_WORDS_3 = (
+    "Nature",
+    "Chaos",
+    "Order",
+    "Harmony",
+    "Balance",
+    "Power",
+    "Glory",
+    "Destiny",
+    "Fury",
+    "Grace",
+    "Wisdom",
+    "Might",
+    "Courage",
+    "Valor",
+    "Honor",
+    "Wrath",
+    "Silence",
+    "Whispers",
+    "Shadows",
+    "Dreams",
+    "Hope",
+    "Fear",
+    "Fortune",
+    "Victory",
+    "Revenge",
+    "Legends",
+    "Myth",
+    "Secrets",
+    "Legion",
+    "Rebirth",
+    "Despair",
+    "Horizon",
+    "Echoes",
+    "Origins",
+    "Eclipse",
+    "Ascendancy",
+    "Abyss",
+    "Serenity",
+    "Radiance",
+    "Oblivion",
+)
 
-    word_list_3 = [
-        "Nature",
-        "Chaos",
-        "Order",
-        "Harmony",
-        "Balance",
-        "Power",
-        "Glory",
-        "Destiny",
-        "Fury",
-        "Grace",
-        "Wisdom",
-        "Might",
-        "Courage",
-        "Valor",
-        "Honor",
-        "Wrath",
-        "Silence",
-        "Whispers",
-        "Shadows",
-        "Dreams",
-        "Hope",
-        "Fear",
-        "Fortune",
-        "Victory",
-        "Revenge",
-        "Legends",
-        "Myth",
-        "Secrets",
-        "Legion",
-        "Rebirth",
-        "Despair",
-        "Horizon",
-        "Echoes",
-        "Origins",
-        "Eclipse",
-        "Ascendancy",
-        "Abyss",
-        "Serenity",
-        "Radiance",
-        "Oblivion",
-    ]
+TITLES = (
+    "Original",
+    "Alpha",
+    "First",
+    "Ultimate",
+    "Superior",
+    "Elite",
+    "Final",
+    "Apex",
+    "Genesis",
+    "Supreme",
+    "Pioneer",
+    "Pinnacle",
+    "Primal",
+    "Foremost",
+    "Inception",
+    "Sovereign",
+    "Vanguard",
+    "Premier",
+    "Primeval",
+    "Exemplar",
+    "Prototype",
+    "Archetype",
+    "Chief",
+    "Ascendant",
+    "Primary",
+    "Principal",
+    "Cardinal",
+    "Paramount",
+    "Initial",
+    "Prime",
+    "Top",
+    "Leading",
+)
+
+GLITCHED_TITLES = (
+    "Anomaly",
+    "Error",
+    "malloc()",
+    "Glitched",
+    "Void",
+    "Corrupted",
+    "0xFFFFFFFF",
+    "Fragmented",
+    "Distorted",
+    "Collapsed",
+)
+
+RARE_TITLES = (
+    "Singularity",
+    "Undefined",
+    "Entangled",
+)
+
+LEGENDARY_TITLES = ("Atlas",)
+
+LOWERCASE_LETTERS = "abcdefghijklmnopqrstuvwxyz"
+UPPERCASE_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def generate_name(seed, type="galaxy", rng=None):
+    if rng is None:
+        rng = random.Random(seed)
+    else:
+        rng.seed(seed)
 
     if type == "system":
 
-        name = f"{random.choice(word_list_1)} {random.choice(word_list_2)} {random.choice(word_list_3)}"
+        name = f"{rng.choice(SYSTEM_WORDS_1)} {rng.choice(SYSTEM_WORDS_2)} {rng.choice(SYSTEM_WORDS_3)}"
 
-        number = (
-            f"{random.choice('abcdefghijklmnopqrstuvwxyz')}{random.randint(1, 999):03}"
-        )
+        number = f"{rng.choice(LOWERCASE_LETTERS)}{rng.randint(1, 999):03}"
         return f"{name} {number}"
 
-    prefix = random.choice(galaxy_prefixes if type == "galaxy" else planet_prefixes)
-    suffix = random.choice(galaxy_suffixes if type == "galaxy" else planet_suffixes)
+    prefix = rng.choice(GALAXY_PREFIXES if type == "galaxy" else PLANET_PREFIXES)
+    suffix = rng.choice(GALAXY_SUFFIXES if type == "galaxy" else PLANET_SUFFIXES)
 
-    if random.random() < 0.01:
-        number = random.choice(
-            [
-                "Original",
-                "Alpha",
-                "First",
-                "Ultimate",
-                "Superior",
-                "Elite",
-                "Final",
-                "Apex",
-                "Genesis",
-                "Supreme",
-                "Pioneer",
-                "Pinnacle",
-                "Primal",
-                "Foremost",
-                "Inception",
-                "Sovereign",
-                "Vanguard",
-                "Premier",
-                "Primeval",
-                "Exemplar",
-                "Prototype",
-                "Archetype",
-                "Chief",
-                "Ascendant",
-                "Primary",
-                "Principal",
-                "Cardinal",
-                "Paramount",
-                "Initial",
-                "Prime",
-                "Top",
-                "Leading",
-            ]
-        )
-    elif random.random() < 0.001:
-        number = random.choice(
-            [
-                "Anomaly",
-                "Error",
-                "malloc()",
-                "Glitched",
-                "Void",
-                "Corrupted",
-                "0xFFFFFFFF",
-                "Fragmented",
-                "Distorted",
-                "Collapsed",
-            ]
-        )
-    elif random.random() < 0.0001:
-        number = random.choice(
-            [
-                "Singularity",
-                "Undefined",
-                "Entangled",
-            ]
-        )
-    elif random.random() < 0.00001:
-        number = random.choice(["Atlas"])
+    if rng.random() < 0.01:
+        number = rng.choice(TITLES)
+    elif rng.random() < 0.001:
+        number = rng.choice(GLITCHED_TITLES)
+    elif rng.random() < 0.0001:
+        number = rng.choice(RARE_TITLES)
+    elif rng.random() < 0.00001:
+        number = rng.choice(LEGENDARY_TITLES)
     else:
-        number = f"{random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}{random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}-{random.randint(1, 9999)}"
+        number = f"{rng.choice(UPPERCASE_LETTERS)}{rng.choice(UPPERCASE_LETTERS)}-{rng.randint(1, 9999)}"
 
     return f"{prefix}{suffix}_{number}"
+
+
+def generate_names(seeds, type="galaxy"):
+    rng = random.Random()
+    return [generate_name(seed, type, rng) for seed in seeds]
@@ -0,0 +1,409 @@
+# pymodules/__universe_planet_profiles.py
+
+from types import MappingProxyType
+from collections import namedtuple
+
+from pymodules.__universe_elements import periodic_table
+
+
+PlanetProfile = namedtuple(
+    "PlanetProfile",
+    [
+        "diameter",
+        "density",
+        "temperature",
+        "k2_planet",
+        "Q_planet",
+        "base_rotation_seconds",
+        "k_factor",
+        "elements",
+        "atmospheres",
+    ],
+)
+
+GASEOUS_ATMOSPHERES = (
+    "Hydrogen",
+    "Helium",
+    "Methane",
+    "Ammonia",
+    "Carbon Dioxide",
+    "Toxic",
+    "Ionic",
+    "Plasma",
+    "Exotic Gases",
+    "Water Vapor",
+)
+
+TERRESTRIAL_ATMOSPHERES = (
+    "Thick",
+    "Thin",
+    "None",
+    "Breathable",
+    "Carbon Dioxide",
+    "Methane",
+    "Nitrogen",
+    "Oxygen-Rich",
+    "Sulfur Dioxide",
+    "Superheated",
+    "Acidic",
+)
+
+EXOTIC_ATMOSPHERES = (
+    "Exotic Gases",
+    "Plasma",
+    "Ionic",
+    "None",
+    "Frozen",
+    "Acidic",
+    "Toxic",
+    "Superheated",
+    "Hydrogen",
+    "Helium",
+)
+
+TRACE_ELEMENTS = tuple(elem for elem, prob in periodic_table if prob > 0.0000000001)
+
+PLANET_PROFILES = MappingProxyType(
+    {
+        "Rocky": PlanetProfile(
+            diameter=(0.7, 1.2),
+            density=(3000, 5500),
+            temperature=(-150, 50),
+            k2_planet=(0.2, 0.4),
+            Q_planet=(50, 200),
+            base_rotation_seconds=(0.5 * 3600, 12 * 3600),
+            k_factor=0.3,
+            elements=("Silicon", "Iron", "Magnesium", "Oxygen"),
+            atmospheres=TERRESTRIAL_ATMOSPHERES,
+        ),
+        "Gas Giant": PlanetProfile(
+            diameter=(10, 15),
+            density=(500, 1600),
+            temperature=(-150, 150),
+            k2_planet=(0.4, 0.6),
+            Q_planet=(10000, 1000000),
+            base_rotation_seconds=(2 * 3600, 6 * 3600),
+            k_factor=0.4,
+            elements=("Hydrogen", "Helium", "Neon", "Argon"),
+            atmospheres=GASEOUS_ATMOSPHERES,
+        ),
+        "Icy": PlanetProfile(
+            diameter=(0.7, 1.5),
+            density=(500, 2000),
+            temperature=(-150, 0),
+            k2_planet=(0.3, 0.5),
+            Q_planet=(200, 600),
+            base_rotation_seconds=(1 * 3600, 8 * 3600),
+            k_factor=0.3,
+            elements=("Nitrogen", "Oxygen", "Hydrogen", "Sulfur"),
+            atmospheres=EXOTIC_ATMOSPHERES,
+        ),
+        "Oceanic": PlanetProfile(
+            diameter=(0.8, 1.5),
+            density=(1000, 3000),
+            temperature=(0, 40),
+            k2_planet=(0.2, 0.35),
+            Q_planet=(100, 300),
+            base_rotation_seconds=(0.5 * 3600, 5 * 3600),
+            k_factor=0.3,
+            elements=("Oxygen", "Hydrogen", "Sodium", "Chlorine"),
+            atmospheres=TERRESTRIAL_ATMOSPHERES,
+        ),
+        "Desert": PlanetProfile(
+            diameter=(0.7, 1.2),
+            density=(2000, 4000),
+            temperature=(50, 200),
+            k2_planet=(0.25, 0.4),
+            Q_planet=(50, 200),
+            base_rotation_seconds=(1 * 3600, 8 * 3600),
+            k_factor=0.3,
+            elements=("Silicon", "Oxygen", "Iron", "Aluminum"),
+            atmospheres=TERRESTRIAL_ATMOSPHERES,
+        ),
+        "Lava": PlanetProfile(
+            diameter=(0.8, 1.5),
+            density=(3000, 5000),
+            temperature=(500, 1200),
+            k2_planet=(0.3, 0.5),
+            Q_planet=(100, 400),
+            base_rotation_seconds=(2 * 3600, 11 * 3600),
+            k_factor=0.3,
+            elements=("Magnesium", "Silicon", "Iron", "Sulfur"),
+            atmospheres=TERRESTRIAL_ATMOSPHERES,
+        ),
+        "Arid": PlanetProfile(
+            diameter=(0.7, 1.2),
+            density=(2000, 4000),
+            temperature=(50, 150),
+            k2_planet=(0.25, 0.4),
+            Q_planet=(50, 200),
+            base_rotation_seconds=(1 * 3600, 10 * 3600),
+            k_factor=0.3,
+            elements=("Silicon", "Oxygen", "Iron", "Calcium"),
+            atmospheres=TERRESTRIAL_ATMOSPHERES,
+        ),
+        "Tundra": PlanetProfile(
+            diameter=(0.7, 1.5),
+            density=(1500, 3000),
+            temperature=(-100, 0),
+            k2_planet=(0.3, 0.5),
+            Q_planet=(100, 300),
+            base_rotation_seconds=(1 * 3600, 6 * 3600),
+            k_factor=0.3,
+            elements=("Nitrogen", "Oxygen", "Carbon", "Iron"),
+            atmospheres=TERRESTRIAL_ATMOSPHERES,
+        ),
+        "Swamp": PlanetProfile(
+            diameter=(0.8, 1.5),
+            density=(1000, 3000),
+            temperature=(10, 50),
+            k2_planet=(0.2, 0.35),
+            Q_planet=(100, 300),
+            base_rotation_seconds=(0.8 * 3600, 7 * 3600),
+            k_factor=0.3,
+            elements=("Carbon", "Oxygen", "Phosphorus", "Nitrogen"),
+            atmospheres=TERRESTRIAL_ATMOSPHERES,
+        ),
+        "Forest": PlanetProfile(
+            diameter=(0.8, 1.5),
+            density=(1000, 3000),
+            temperature=(10, 30),
+            k2_planet=(0.2, 0.4),
+            Q_planet=(100, 300),
+            base_rotation_seconds=(1 * 3600, 6 * 3600),
+            k_factor=0.3,
+            elements=("Oxygen", "Carbon", "Nitrogen", "Phosphorus"),
+            atmospheres=EXOTIC_ATMOSPHERES,
+        ),
+        "Savannah": PlanetProfile(
+            diameter=(0.8, 1.5),
+            density=(1000, 3000),
+            temperature=(20, 40),
+            k2_planet=(0.2, 0.4),
+            Q_planet=(100, 300),
+            base_rotation_seconds=(1 * 3600, 7 * 3600),
+            k_factor=0.3,
+            elements=("Oxygen", "Carbon", "Silicon", "Phosphorus"),
+            atmospheres=EXOTIC_ATMOSPHERES,
+        ),
+        "Cave": PlanetProfile(
+            diameter=(0.7, 1.2),
+            density=(2000, 4000),
+            temperature=(0, 40),
+            k2_planet=(0.3, 0.5),
+            Q_planet=(200, 500),
+            base_rotation_seconds=(0.5 * 3600, 8 * 3600),
+            k_factor=0.3,
+            elements=("Silicon", "Calcium", "Iron", "Carbon"),
+            atmospheres=EXOTIC_ATMOSPHERES,
+        ),
+        "Crystalline": PlanetProfile(
+            diameter=(0.7, 1.2),
+            density=(2000, 4000),
+            temperature=(-50, 500),
+            k2_planet=(0.3, 0.6),
+            Q_planet=(1000, 5000),
+            base_rotation_seconds=(0.5 * 3600, 12 * 3600),
+            k_factor=0.5,
+            elements=("Silicon", "Carbon", "Oxygen", "Iron"),
+            atmospheres=EXOTIC_ATMOSPHERES,
+        ),
+        "Anomaly": PlanetProfile(
+            diameter=(0.1, 3),
+            density=(500, 10000),
+            temperature=(-273, 1500),
+            k2_planet=(0.1, 0.8),
+            Q_planet=(1000, 10000000),
+            base_rotation_seconds=(0.1 * 3600, 100 * 3600),
+            k_factor=0.5,
+            elements=("Copernicium", "Nihonium", "Flerovium", "Moscovium"),
+            atmospheres=GASEOUS_ATMOSPHERES,
+        ),
+        "Metallic": PlanetProfile(
+            diameter=(1, 2.5),
+            density=(5000, 8000),
+            temperature=(-50, 400),
+            k2_planet=(0.4, 0.7),
+            Q_planet=(500, 2000),
+            base_rotation_seconds=(2 * 3600, 12 * 3600),
+            k_factor=0.35,
+            elements=("Iron", "Nickel", "Titanium", "Cobalt"),
+            atmospheres=EXOTIC_ATMOSPHERES,
+        ),
+        "Toxic": PlanetProfile(
+            diameter=(0.7, 1.5),
+            density=(3000, 6000),
+            temperature=(100, 400),
+            k2_planet=(0.2, 0.5),
+            Q_planet=(100, 500),
+            base_rotation_seconds=(0.5 * 3600, 10 * 3600),
+            k_factor=0.3,
+            elements=("Sulfur", "Chlorine", "Phosphorus", "Fluorine"),
+            atmospheres=EXOTIC_ATMOSPHERES,
+        ),
+        "Radioactive": PlanetProfile(
+            diameter=(1, 2),
+            density=(4000, 7000),
+            temperature=(-50, 500),
+            k2_planet=(0.3, 0.6),
+            Q_planet=(500, 3000),
+            base_rotation_seconds=(1 * 3600, 20 * 3600),
+            k_factor=0.35,
+            elements=("Uranium", "Thorium", "Plutonium", "Radium"),
+            atmospheres=EXOTIC_ATMOSPHERES,
+        ),
+        "Magma": PlanetProfile(
+            diameter=(0.8, 1.5),
+            density=(4000, 7000),
+            temperature=(700, 1500),
+            k2_planet=(0.3, 0.5),
+            Q_planet=(100, 400),
+            base_rotation_seconds=(3 * 3600, 15 * 3600),
+            k_factor=0.35,
+            elements=("Magnesium", "Silicon", "Iron", "Sulfur"),
+            atmospheres=EXOTIC_ATMOSPHERES,
+        ),
+        "Molten Core": PlanetProfile(
+            diameter=(0.8, 1.5),
+            density=(5000, 8000),
+            temperature=(1000, 2000),
+            k2_planet=(0.4, 0.7),
+            Q_planet=(500, 2000),
+            base_rotation_seconds=(3 * 3600, 15 * 3600),
+            k_factor=0.35,
+            elements=("Iron", "Nickel", "Magnesium", "Sulfur"),
+            atmospheres=EXOTIC_ATMOSPHERES,
+        ),
+        "Carbon": PlanetProfile(
+            diameter=(0.7, 1.5),
+            density=(3500, 5000),
+            temperature=(-50, 300),
+            k2_planet=(0.3, 0.5),
+            Q_planet=(200, 600),
+            base_rotation_seconds=(1 * 3600, 8 * 3600),
+            k_factor=0.35,
+            elements=("Carbon", "Oxygen", "Silicon", "Iron"),
+            atmospheres=EXOTIC_ATMOSPHERES,
+        ),
+        "Diamond": PlanetProfile(
+            diameter=(0.7, 1.5),
+            density=(3000, 7000),
+            temperature=(-50, 1000),
+            k2_planet=(0.4, 0.6),
+            Q_planet=(500, 2000),
+            base_rotation_seconds=(2 * 3600, 12 * 3600),
+            k_factor=0.35,
+            elements=("Carbon", "Silicon", "Nitrogen", "Oxygen"),
+            atmospheres=EXOTIC_ATMOSPHERES,
+        ),
+        "Super Earth": PlanetProfile(
+            diameter=(1, 2),
+            density=(4000, 6000),
+            temperature=(-50, 400),
+            k2_planet=(0.4, 0.6),
+            Q_planet=(200, 400),
+            base_rotation_seconds=(0.5 * 3600, 10 * 3600),
+            k_factor=0.3,
+            elements=("Iron", "Magnesium", "Silicon", "Oxygen"),
+            atmospheres=EXOTIC_ATMOSPHERES,
+        ),
+        "Sub Earth": PlanetProfile(
+            diameter=(0.5, 1),
+            density=(3000, 5000),
+            temperature=(-100, 300),
+            k2_planet=(0.35, 0.5),
+            Q_planet=(150, 300),
+            base_rotation_seconds=(2 * 3600, 12 * 3600),
+            k_factor=0.3,
+            elements=("Silicon", "Iron", "Carbon", "Oxygen"),
+            atmospheres=EXOTIC_ATMOSPHERES,
+        ),
+        "Frozen Gas Giant": PlanetProfile(
+            diameter=(10, 15),
+            density=(500, 1000),
+            temperature=(-200, -50),
+            k2_planet=(0.4, 0.6),
+            Q_planet=(10000, 1000000),
+            base_rotation_seconds=(3 * 3600, 6 * 3600),
+            k_factor=0.4,
+            elements=("Hydrogen", "Helium", "Neon", "Methane"),
+            atmospheres=GASEOUS_ATMOSPHERES,
+        ),
+        "Nebulous": PlanetProfile(
+            diameter=(5, 15),
+            density=(100, 300),
+            temperature=(-200, 50),
+            k2_planet=(0.2, 0.5),
+            Q_planet=(1000, 5000),
+            base_rotation_seconds=(5 * 3600, 12 * 3600),
+            k_factor=0.3,
+            elements=("Hydrogen", "Helium", "Neon", "Argon"),
+            atmospheres=GASEOUS_ATMOSPHERES,
+        ),
+        "Aquifer": PlanetProfile(
+            diameter=(0.8, 1.5),
+            density=(2000, 3000),
+            temperature=(-10, 50),
+            k2_planet=(0.2, 0.4),
+            Q_planet=(100, 300),
+            base_rotation_seconds=(1 * 3600, 6 * 3600),
+            k_factor=0.3,
+            elements=("Oxygen", "Hydrogen", "Sodium", "Chlorine"),
+            atmospheres=EXOTIC_ATMOSPHERES,
+        ),
+        "Exotic": PlanetProfile(
+            diameter=(0.5, 3),
+            density=(1000, 20000),
+            temperature=(-273, 1500),
+            k2_planet=(0.1, 0.8),
+            Q_planet=(1000, 10000000),
+            base_rotation_seconds=(0.3 * 3600, 30 * 3600),
+            k_factor=0.5,
+            elements=("Oganesson", "Livermorium", "Tennessine", "Flerovium"),
+            atmospheres=EXOTIC_ATMOSPHERES,
+        ),
+    }
+)
+
+PLANET_TYPES = tuple(PLANET_PROFILES)
+
+DEFAULT_PROFILE = PlanetProfile(
+    diameter=(0.5, 2),
+    density=(3000, 6000),
+    temperature=(-100, 500),
+    k2_planet=(0.2, 0.7),
+    Q_planet=(50, 5000),
+    base_rotation_seconds=(5 * 3600, 50 * 3600),
+    k_factor=0.3,
+    elements=TRACE_ELEMENTS,
+    atmospheres=EXOTIC_ATMOSPHERES,
+)
+
+ATMOSPHERE_FACTORS = MappingProxyType(
+    {
+        "Thick": 1.2,
+        "Thin": 0.9,
+        "None": 0.7,
+        "Breathable": 1.0,
+        "Carbon Dioxide": 1.3,
+        "Methane": 1.1,
+        "Nitrogen": 0.95,
+        "Oxygen-Rich": 1.0,
+        "Sulfur Dioxide": 1.4,
+        "Superheated": 1.6,
+        "Acidic": 1.5,
+        "Hydrogen": 1.2,
+        "Helium": 0.8,
+        "Ammonia": 1.1,
+        "Water Vapor": 1.3,
+        "Frozen": 0.5,
+        "Toxic": 1.4,
+    }
+)
+
+# Drawn on every temperature correction, in this order, whatever the atmosphere.
+VARIABLE_ATMOSPHERE_FACTORS = (
+    ("Exotic Gases", (0.8, 1.5)),
+    ("Ionic", (0.8, 1.3)),
+    ("Plasma", (1.0, 1.4)),
+)
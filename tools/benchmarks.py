@@ -0,0 +1,298 @@
+# tools/benchmarks.py
+
+import os
+import sys
+import math
+import time
+import random
+import hashlib
+import argparse
+import tracemalloc
+import multiprocessing
+
+from itertools import islice
+from types import MappingProxyType
+
+from PIL import Image
+
+from workspace import open_universe, reference_clock
+
+
+def timed(function, repeat=5):
+    best = math.inf
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def pixel_soft_polar_transform(image, scale_factor=1.0, depth_factor=0.5):
+    width, height = image.size
+    center_x, center_y = width // 2, height // 2
+    radius = min(center_x, center_y)
+
+    new_image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+
+    for y in range(height):
+        for x in range(width):
+            dx = x - center_x
+            dy = y - center_y
+            distance = math.sqrt(dx * dx + dy * dy)
+
+            if distance < radius:
+                angle = math.atan2(dy, dx)
+
+                depth_adjustment = 1 + depth_factor * ((distance / radius) ** 2)
+
+                polar_x = int(
+                    center_x
+                    + distance * math.cos(angle) * scale_factor * depth_adjustment
+                )
+                polar_y = int(
+                    center_y
+                    + distance * math.sin(angle) * scale_factor * depth_adjustment
+                )
+
+                if 0 <= polar_x < width and 0 <= polar_y < height:
+                    new_image.putpixel((x, y), image.getpixel((polar_x, polar_y)))
+
+    return new_image
+
+
+def bench_polar(repeat):
+    open_universe()
+    from pymodules.__drawer_cplanet_depth import soft_polar_transform
+
+    rng = random.Random(1)
+    image = Image.frombytes("RGBA", (800, 800), rng.randbytes(800 * 800 * 4))
+
+    started = time.perf_counter()
+    reference = pixel_soft_polar_transform(image, 0.85, 0.70)
+    per_pixel = time.perf_counter() - started
+
+    started = time.perf_counter()
+    remapped = soft_polar_transform(image, 0.85, 0.70)
+    first = time.perf_counter() - started
+    warm = timed(lambda: soft_polar_transform(image, 0.85, 0.70), repeat)
+
+    print(f"soft_polar identical to the per-pixel loop: {remapped == reference}")
+    print(
+        f"soft_polar 800x800: per-pixel loop {per_pixel * 1000:.0f} ms, "
+        f"lookup table first call {first * 1000:.0f} ms, warm {warm * 1000:.1f} ms "
+        f"({per_pixel / warm:.0f}x)"
+    )
+
+
+def bench_seeds(repeat):
+    universe = open_universe()
+    from pymodules.__atlas_seedmaster import seedmaster, create_seed_deriver
+
+    deriver = universe.seed_deriver
+    galaxy_seed = deriver.galaxy_seed(1, 2, 3)
+    count = 5000
+
+    def legacy():
+        for index in range(count):
+            system_seed = int(
+                hashlib.sha256(
+                    f"{galaxy_seed}-{seedmaster(8)}-{index}".encode()
+                ).hexdigest(),
+                16,
+            )
+            for planet_index in range(4):
+                int(
+                    hashlib.sha256(
+                        f"{system_seed}-{seedmaster(4)}-{planet_index}".encode()
+                    ).hexdigest(),
+                    16,
+                )
+            int(
+                hashlib.sha256(f"{system_seed}-{seedmaster(2)}-0".encode()).hexdigest(),
+                16,
+            )
+
+    def derived(seed_deriver):
+        parent_seed = seed_deriver.galaxy_seed(1, 2, 3)
+
+        def run():
+            for index in range(count):
+                system_seed = seed_deriver.system_seed(parent_seed, index)
+                for planet_index in range(4):
+                    seed_deriver.planet_seed(system_seed, planet_index)
+                seed_deriver.star_seed(system_seed, 0)
+
+        return run
+
+    system_seed = deriver.system_seed(galaxy_seed, 7)
+    legacy_seed = int(
+        hashlib.sha256(f"{galaxy_seed}-{seedmaster(8)}-7".encode()).hexdigest(), 16
+    )
+    print(f"SeedDeriver matches seedmaster derivation: {system_seed == legacy_seed}")
+
+    for label, function in (
+        ("seedmaster", legacy),
+        ("SeedDeriver (v1)", derived(deriver)),
+        ("KeyedSeedDeriver (v2)", derived(create_seed_deriver(universe.seed, 2))),
+    ):
+        elapsed = timed(function, repeat)
+        print(
+            f"{label:22} {elapsed / count * 1e6:7.1f} us of seed derivation per system (4 planets, 1 star)"
+        )
+
+    for universe_format in (1, 2):
+        galaxy = open_universe(universe_format).get_galaxy(4999999, 4999999, 4999999)
+        started = time.perf_counter()
+        for index in range(2000):
+            galaxy.create_solar_system(index)
+        elapsed = time.perf_counter() - started
+        print(
+            f"v{universe_format} solar system generation: {elapsed / 2000 * 1e6:.0f} us per system"
+        )
+
+
+def bench_memory(repeat):
+    from equivalence import PLANET_ATTRIBUTES
+
+    for universe_format in (1, 2):
+        galaxy = open_universe(universe_format).get_galaxy(4999999, 4999999, 4999999)
+        galaxy.create_solar_system(0).get_planet(0)
+        count = 2000
+
+        tracemalloc.start()
+        systems = [galaxy.create_solar_system(index) for index in range(1, count + 1)]
+        systems_memory, _ = tracemalloc.get_traced_memory()
+        planets = [
+            solar_system.get_planet(index)
+            for solar_system in systems
+            for index in range(solar_system.num_planets)
+        ]
+        planets_memory, _ = tracemalloc.get_traced_memory()
+        for planet in planets:
+            for attribute in PLANET_ATTRIBUTES:
+                getattr(planet, attribute)
+        resolved_memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"v{universe_format}: {systems_memory / count:.0f} bytes per SolarSystem, "
+            f"{(planets_memory - systems_memory) / len(planets):.0f} bytes per Planet, "
+            f"{(resolved_memory - systems_memory) / len(planets):.0f} with every attribute resolved"
+        )
+
+
+def bench_names(repeat):
+    open_universe()
+    from pymodules.__universe_name_generator import generate_name, generate_names
+
+    seeds = [2**200 + index * 7919 for index in range(20000)]
+    for kind in ("galaxy", "system", "planet"):
+        names = [generate_name(seed, kind) for seed in seeds]
+        identical = generate_names(seeds, kind) == names
+        single = timed(lambda: [generate_name(seed, kind) for seed in seeds], repeat)
+        batch = timed(lambda: generate_names(seeds, kind), repeat)
+        print(
+            f"{kind:7} generate_name {len(seeds) / single:8.0f} names/s, "
+            f"generate_names {len(seeds) / batch:8.0f} names/s, identical: {identical}"
+        )
+
+
+def bench_render_types(repeat):
+    universe = open_universe()
+    from pymodules.__drawer_class_planet import (
+        PLANET_DRAW_FUNCTIONS,
+        draw_planet_surface,
+        generate_planet_image,
+    )
+
+    total = 0.0
+    for planet_type in PLANET_DRAW_FUNCTIONS:
+        started = time.perf_counter()
+        for seed in range(repeat):
+            draw_planet_surface(planet_type, f"Bench {seed}", 200, 1000 + seed, 800)
+        elapsed = (time.perf_counter() - started) / repeat
+        total += elapsed
+        print(f"{planet_type:18} surface {elapsed * 1000:7.1f} ms")
+    print(f"{'all types':18} surface {total * 1000:7.1f} ms")
+
+    clock = reference_clock()
+    planet = (
+        universe.get_galaxy(0, 0, 0, clock).get_solar_system(0, clock).get_planet(1)
+    )
+    started = time.perf_counter()
+    generate_planet_image(planet, clock)
+    cold = time.perf_counter() - started
+    warm = timed(
+        lambda: generate_planet_image(planet, clock.at(clock.timestamp + 900)), repeat
+    )
+    print(
+        f"full planet render: first {cold * 1000:.0f} ms, cached surface {warm * 1000:.0f} ms"
+    )
+
+
+def bench_observer(repeat):
+    universe = open_universe()
+    from pymodules.__atlas_config import config
+    from pymodules.__atlas_observer import (
+        OBSERVER_REGION,
+        init_worker,
+        plan_shards,
+        search_shard,
+    )
+
+    shards = list(islice(plan_shards(universe, OBSERVER_REGION), 48))
+    jobs = [(shard, None, True) for shard in shards]
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1)))
+    print(f"{len(shards)} shards of the observer search on {cpus} CPUs")
+
+    baseline = None
+    for workers in worker_counts:
+        with multiprocessing.Pool(
+            workers, init_worker, (universe.seed, config.universe_format)
+        ) as pool:
+            pool.starmap(search_shard, jobs[:workers])
+            started = time.perf_counter()
+            planets = sum(
+                result["planets"] for result in pool.starmap(search_shard, jobs)
+            )
+            elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(
+            f"{workers:2} workers: {planets / elapsed:8.0f} planets/s, "
+            f"{baseline / elapsed:.2f}x of one worker"
+        )
+
+
+BENCHMARKS = MappingProxyType(
+    {
+        "polar": bench_polar,
+        "seeds": bench_seeds,
+        "memory": bench_memory,
+        "names": bench_names,
+        "render-types": bench_render_types,
+        "observer": bench_observer,
+    }
+)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description="Atlas generation and render benchmarks."
+    )
+    parser.add_argument("benchmarks", nargs="*", help=", ".join(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark {', '.join(unknown)}")
+
+    for name in args.benchmarks or BENCHMARKS:
+        print(f"== {name}")
+        BENCHMARKS[name](max(args.repeat, 1))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,316 @@
+# tools/equivalence.py
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+
+from types import MappingProxyType
+from collections.abc import Mapping
+
+from workspace import ROOT, freeze_time, open_workspace
+
+
+REFERENCES = MappingProxyType(
+    {
+        "baseline": os.path.join(ROOT, "tools", "equivalence_baseline.json"),
+        "series": os.path.join(ROOT, "tools", "equivalence_series.json"),
+    }
+)
+REFERENCE_FORMATS = MappingProxyType({"baseline": (1,), "series": (2,)})
+GALAXIES = (
+    (0, 0, 0),
+    (1, 2, 3),
+    (10, 0, 7),
+    (123, 456, 789),
+    (4999999, 4999999, 4999999),
+    (5000000, 4999990, 4999999),
+)
+SYSTEMS_PER_GALAXY = 12
+GALAXY_ATTRIBUTES = (
+    "seed",
+    "name",
+    "galaxy_type",
+    "num_systems",
+    "black_holes",
+    "pulsars",
+    "quasars",
+)
+SYSTEM_ATTRIBUTES = ("seed", "name", "num_planets", "star_system_type", "stars")
+PLANET_ATTRIBUTES = (
+    "seed",
+    "name",
+    "planet_type",
+    "atmosphere",
+    "diameter",
+    "volume",
+    "density",
+    "surface_temperature",
+    "possible_elements",
+    "k2_planet",
+    "Q_planet",
+    "base_rotation_seconds",
+    "k_factor",
+    "mass",
+    "gravity",
+    "orbital_radius",
+    "orbital_radius_m",
+    "orbital_period_seconds",
+    "orbital_speed",
+    "tidal_effect",
+    "moment_of_inertia",
+    "axial_tilt",
+    "eccentricity_factor",
+    "rotation_period_seconds",
+    "elements",
+    "life_forms",
+    "planet_rings",
+    "initial_angle_rotation",
+    "initial_orbital_angle",
+)
+RENDER_TARGETS = (
+    ((0, 0, 0), None, None),
+    ((10, 0, 7), None, None),
+    ((0, 0, 0), 0, None),
+    ((123, 456, 789), 2, None),
+    ((0, 0, 0), 0, 0),
+    ((0, 0, 0), 0, 1),
+    ((0, 0, 0), 0, 2),
+    ((0, 0, 0), 2, 2),
+    ((0, 0, 0), 5, 1),
+    ((0, 0, 0), 7, 2),
+    ((10, 0, 7), 4, 1),
+    ((10, 0, 7), 6, 2),
+    ((10, 0, 7), 11, 0),
+    ((123, 456, 789), 2, 3),
+)
+
+
+def canonical(value):
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return [canonical(item) for item in value]
+    if isinstance(value, Mapping):
+        return {str(key): canonical(item) for key, item in value.items()}
+    if isinstance(value, (str, int, bool)) or value is None:
+        return value
+    return repr(value)
+
+
+def digest(value):
+    encoded = json.dumps(canonical(value), sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def open_reference_universe(tree, universe_format):
+    config = open_workspace(tree=tree, universe_format=universe_format)
+
+    from pymodules.__universe_base import Universe
+    from pymodules.__universe_constants import PhysicalConstants
+
+    return Universe(config.seed, PhysicalConstants())
+
+
+def snapshot_universe(universe):
+    digests = {}
+    for coordinates in GALAXIES:
+        galaxy = universe.get_galaxy(*coordinates)
+        key = ",".join(map(str, coordinates))
+        digests[key] = digest(
+            {attribute: getattr(galaxy, attribute) for attribute in GALAXY_ATTRIBUTES}
+        )
+
+        indices = list(range(min(galaxy.num_systems, SYSTEMS_PER_GALAXY)))
+        indices.append(galaxy.num_systems - 1)
+        for index in indices:
+            solar_system = galaxy.get_solar_system(index)
+            planets = [
+                solar_system.get_planet(planet_index)
+                for planet_index in range(solar_system.num_planets)
+            ]
+            digests[f"{key}#{index}"] = digest(
+                {
+                    "system": {
+                        attribute: getattr(solar_system, attribute)
+                        for attribute in SYSTEM_ATTRIBUTES
+                    },
+                    "planets": [
+                        {
+                            attribute: getattr(planet, attribute)
+                            for attribute in PLANET_ATTRIBUTES
+                        }
+                        for planet in planets
+                    ],
+                }
+            )
+    return digests
+
+
+def snapshot_renders(universe):
+    from pymodules.__drawer_class_galaxy import generate_galaxy_image
+    from pymodules.__drawer_class_system import generate_solar_system_image
+    from pymodules.__drawer_class_planet import generate_planet_image
+
+    digests = {}
+    for coordinates, system_index, planet_index in RENDER_TARGETS:
+        galaxy = universe.get_galaxy(*coordinates)
+        key = ",".join(map(str, coordinates))
+        if system_index is None:
+            image = generate_galaxy_image(galaxy)
+        elif planet_index is None:
+            key += f"#{system_index}"
+            image = generate_solar_system_image(galaxy.get_solar_system(system_index))
+        else:
+            key += f"#{system_index}/{planet_index}"
+            planet = galaxy.get_solar_system(system_index).get_planet(planet_index)
+            image = generate_planet_image(planet)
+        digests[key] = hashlib.sha256(image.tobytes()).hexdigest()
+    return digests
+
+
+def snapshot(tree, universe_formats, include_renders):
+    import PIL
+
+    result = {"pillow": PIL.__version__, "universes": {}, "renders": {}}
+    for universe_format in universe_formats:
+        universe = open_reference_universe(tree, universe_format)
+        result["universes"][str(universe_format)] = snapshot_universe(universe)
+        if include_renders and universe_format == 1:
+            result["renders"] = snapshot_renders(universe)
+    return result
+
+
+def load_reference(name):
+    with open(REFERENCES[name]) as reference_file:
+        return json.load(reference_file)
+
+
+def write_reference(name, tree, label, include_renders):
+    current = snapshot(
+        tree, sorted(set(REFERENCE_FORMATS[name]) | {1}), include_renders
+    )
+    reference = {
+        "label": label,
+        "pillow": current["pillow"],
+        "universes": {
+            str(universe_format): current["universes"][str(universe_format)]
+            for universe_format in REFERENCE_FORMATS[name]
+        },
+        "renders": current["renders"],
+    }
+    if name == "series":
+        baseline = load_reference("baseline")
+        reference["baseline_render_changes"] = sorted(
+            key
+            for key, value in baseline["renders"].items()
+            if current["renders"].get(key) != value
+        )
+
+    with open(REFERENCES[name], "w") as reference_file:
+        json.dump(reference, reference_file, indent=1, sort_keys=True)
+        reference_file.write("\n")
+    print(f"[equivalence] {name} reference written to {REFERENCES[name]}")
+
+
+def compare_universes(name, reference, current):
+    total_failures = 0
+    for universe_format, digests in reference["universes"].items():
+        actual = current["universes"][universe_format]
+        checked = failures = 0
+        for key, value in digests.items():
+            checked += 1
+            if actual.get(key) != value:
+                failures += 1
+                print(
+                    f"[equivalence] v{universe_format} {key} differs from the {name} reference",
+                    file=sys.stderr,
+                )
+        print(
+            f"[equivalence] v{universe_format} universe: {checked - failures}/{checked} "
+            f"digests match the {name} reference ({reference['label']})"
+        )
+        total_failures += failures
+    return total_failures
+
+
+def compare_renders(baseline, series, current):
+    for reference in (baseline, series):
+        if reference and reference["pillow"] != current["pillow"]:
+            print(
+                f"[equivalence] the {reference['label']} renders were recorded with "
+                f"Pillow {reference['pillow']}, this is {current['pillow']}",
+                file=sys.stderr,
+            )
+
+    identical = changed = failures = 0
+    for key, value in baseline["renders"].items():
+        actual = current["renders"].get(key)
+        if actual == value:
+            identical += 1
+        elif (
+            series
+            and key in series["baseline_render_changes"]
+            and actual == series["renders"][key]
+        ):
+            changed += 1
+        else:
+            failures += 1
+            print(f"[equivalence] render {key} differs", file=sys.stderr)
+
+    print(
+        f"[equivalence] renders: {identical} identical to the baseline, "
+        f"{changed} match a recorded post-series change, {failures} differ"
+    )
+    return failures
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description="Check that the reference seeds still produce the same universe and renders."
+    )
+    parser.add_argument(
+        "--tree",
+        default=ROOT,
+        help="Atlas checkout to generate from, defaults to this one",
+    )
+    parser.add_argument(
+        "--write",
+        choices=sorted(REFERENCES),
+        help="record the --tree output as the baseline or post-series reference",
+    )
+    parser.add_argument(
+        "--label", help="describe the tree a written reference came from"
+    )
+    parser.add_argument(
+        "--baseline-only",
+        action="store_true",
+        help="only compare with the baseline, for trees older than universe format 2",
+    )
+    parser.add_argument("--skip-renders", action="store_true")
+    args = parser.parse_args(argv)
+
+    tree = os.path.abspath(args.tree)
+    freeze_time()
+
+    if args.write:
+        write_reference(
+            args.write, tree, args.label or args.write, not args.skip_renders
+        )
+        return 0
+
+    baseline = load_reference("baseline")
+    series = None if args.baseline_only else load_reference("series")
+    current = snapshot(tree, (1,) if series is None else (1, 2), not args.skip_renders)
+
+    failures = compare_universes("baseline", baseline, current)
+    if series:
+        failures += compare_universes("series", series, current)
+    if not args.skip_renders:
+        failures += compare_renders(baseline, series, current)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
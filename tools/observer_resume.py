@@ -0,0 +1,79 @@
+# tools/observer_resume.py
+
+import os
+import sys
+import json
+import tempfile
+import contextlib
+
+from workspace import open_universe
+
+
+REGION = "0:1,0:1,0:1"
+QUERY = "name='Nowhere'"
+STALE_MATCHES = b'{"planet": "written after the last checkpoint"}\n' * 3
+
+
+def interrupted(iter_planets, records):
+    def limited(*args, **kwargs):
+        for count, record in enumerate(iter_planets(*args, **kwargs)):
+            if count == records:
+                raise KeyboardInterrupt
+            yield record
+
+    return limited
+
+
+def observe(universe, out_path, records):
+    from pymodules.__atlas_observer import batch_observer
+
+    universe.iter_planets = interrupted(universe.iter_planets, records)
+    try:
+        with contextlib.redirect_stderr(open(os.devnull, "w")):
+            batch_observer(universe, QUERY, REGION, out_path, checkpoint_interval=0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        universe.__dict__.pop("iter_planets", None)
+
+    with open(f"{out_path}.checkpoint") as checkpoint_file:
+        return json.load(checkpoint_file)
+
+
+def check(label, out_path, checkpoint):
+    with open(out_path, "rb") as out_file:
+        contents = out_file.read()
+    failures = []
+    if len(contents) != checkpoint["out_offset"]:
+        failures.append(
+            f"{label}: out_offset {checkpoint['out_offset']} but the file holds {len(contents)} bytes"
+        )
+    if b"\0" in contents:
+        failures.append(f"{label}: the file contains NUL padding")
+    return failures
+
+
+def main():
+    universe = open_universe()
+    out_path = os.path.join(tempfile.mkdtemp(prefix="atlas-observer-"), "out.ndjson")
+
+    observe(universe, out_path, records=40)
+    with open(out_path, "ab") as out_file:
+        out_file.write(STALE_MATCHES)
+
+    failures = []
+    checkpoint = observe(universe, out_path, records=40)
+    failures += check("first resume", out_path, checkpoint)
+    checkpoint = observe(universe, out_path, records=40)
+    failures += check("second resume", out_path, checkpoint)
+    checkpoint = observe(universe, out_path, records=40)
+    failures += check("third resume", out_path, checkpoint)
+
+    for failure in failures:
+        print(f"[observer-resume] {failure}", file=sys.stderr)
+    print(f"[observer-resume] {'FAILED' if failures else 'ok'}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
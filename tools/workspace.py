@@ -0,0 +1,68 @@
+# tools/workspace.py
+
+import io
+import os
+import sys
+import time
+import tempfile
+import contextlib
+import configparser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+REFERENCE_SEED = "1.618033988749895"
+REFERENCE_ORIGIN_TIME = 514080000
+REFERENCE_TIMESTAMP = 1760000000
+
+
+def freeze_time(timestamp=REFERENCE_TIMESTAMP):
+    strftime = time.strftime
+    localtime = time.localtime(timestamp)
+    time.time = lambda: float(timestamp)
+    time.strftime = lambda format, moment=localtime: strftime(format, moment)
+
+
+def open_workspace(seed=REFERENCE_SEED, tree=ROOT, **settings):
+    if tree not in sys.path:
+        sys.path.insert(0, tree)
+    os.chdir(tempfile.mkdtemp(prefix="atlas-tools-"))
+
+    ini = configparser.ConfigParser()
+    ini["Settings"] = {
+        "seed": seed,
+        "cosmic_origin_time": str(REFERENCE_ORIGIN_TIME),
+        "image_quality": "100",
+        "enable_cache": "False",
+        "cache_cleanup_time": "900",
+    }
+    ini["Settings"].update({key: str(value) for key, value in settings.items()})
+    with open("atlas.ini", "w") as ini_file:
+        ini.write(ini_file)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        from pymodules.__atlas_config import config
+
+        config._initialized = False
+        config.initialize()
+    return config
+
+
+def open_universe(universe_format=1, seed=REFERENCE_SEED, **settings):
+    config = open_workspace(seed, universe_format=universe_format, **settings)
+
+    from pymodules.__atlas_seedmaster import create_seed_deriver
+    from pymodules.__universe_base import Universe
+    from pymodules.__universe_constants import PhysicalConstants
+
+    return Universe(
+        config.seed,
+        PhysicalConstants(),
+        create_seed_deriver(config.seed, config.universe_format),
+    )
+
+
+def reference_clock():
+    from pymodules.__universe_clock import CosmicClock
+
+    return CosmicClock(REFERENCE_TIMESTAMP, REFERENCE_ORIGIN_TIME)